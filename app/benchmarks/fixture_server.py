@@ -0,0 +1,270 @@
+"""Local fixture marketplace for offline scraping benchmarks.
+
+Serves a search form, paginated result lists and car detail pages for a few
+synthetic platforms, with configurable latency and failure injection. Run it
+on its own from the app directory to inspect the pages:
+
+    python -m benchmarks.fixture_server --port 8765 --latency-ms 80
+"""
+
+import argparse
+import hashlib
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from html import escape
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+from schemas.car_platform_schema import CarPlatformCreateUpdate
+
+BRANDS: Dict[str, List[str]] = {
+    "BMW": ["X5", "320"],
+    "Audi": ["A4", "Q7"],
+    "Toyota": ["Camry", "RAV4"],
+}
+
+# 1x1 transparent GIF, so resource blocking has images to skip
+PIXEL_GIF = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04\x01\x00"
+    b"\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+@dataclass
+class FixtureConfig:
+    latency_ms: float = 50
+    jitter_ms: float = 20
+    failure_rate: float = 0.0
+    listings_per_page: int = 20
+    total_listings: int = 60
+    down_platforms: Set[str] = field(default_factory=set)
+
+
+@dataclass
+class FixturePlatform:
+    slug: str
+    render_mode: str = "browser"
+    paginate_with_template: bool = False
+
+
+FIXTURE_PLATFORMS = [
+    FixturePlatform("alpha"),
+    FixturePlatform("beta", paginate_with_template=True),
+    FixturePlatform("gamma", render_mode="http", paginate_with_template=True),
+]
+
+
+def platform_definitions(base_url: str) -> List[CarPlatformCreateUpdate]:
+    return [
+        CarPlatformCreateUpdate(
+            name=f"bench-{platform.slug}",
+            base_search_url=f"{base_url}/{platform.slug}/",
+            brand_selector="#brand",
+            model_selector="#model",
+            year_from_selector="#year-from",
+            year_to_selector="#year-to",
+            button_selector="#search",
+            car_list_selector="#results",
+            url_to_details="a.listing-link",
+            year_bs4_selector=".year",
+            price_bs4_selector=".price",
+            mileage_bs4_selector=".mileage",
+            views_bs4_selector=".views",
+            render_mode=platform.render_mode,
+            next_page_selector=None if platform.paginate_with_template else "a.next",
+            page_url_template=(
+                "{url}&page={page}" if platform.paginate_with_template else None
+            ),
+            max_concurrency=8,
+            requests_per_minute=600,
+        )
+        for platform in FIXTURE_PLATFORMS
+    ]
+
+
+def listing_id(*parts) -> int:
+    digest = hashlib.sha1("|".join(str(p) for p in parts).encode()).hexdigest()
+    return int(digest[:8], 16)
+
+
+def page_html(title: str, body: str) -> bytes:
+    return (
+        f"<!doctype html><html><head><meta charset='utf-8'><title>{escape(title)}</title>"
+        f"</head><body>{body}</body></html>"
+    ).encode("utf-8")
+
+
+def option_tags(values: List[str]) -> str:
+    return "".join(
+        f"<option value='{escape(v.lower())}'>{escape(v)}</option>" for v in values
+    )
+
+
+class FixtureServer:
+    def __init__(self, config: FixtureConfig, host: str = "127.0.0.1", port: int = 0):
+        self.config = config
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+        self.requests_served = 0
+        self.failures_injected = 0
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+
+    def serve_forever(self) -> None:
+        self._server.serve_forever()
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread = None
+        self._server.server_close()
+
+    def _handler_class(self):
+        fixture = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                fixture.requests_served += 1
+                status, content_type, body = fixture.route(self.path)
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+    def route(self, path: str) -> Tuple[int, str, bytes]:
+        parsed = urlparse(path)
+        parts = [p for p in parsed.path.split("/") if p]
+        if parts == ["static", "photo.gif"]:
+            return 200, "image/gif", PIXEL_GIF
+
+        time.sleep(
+            max(0.0, self.config.latency_ms + random.uniform(-1, 1) * self.config.jitter_ms)
+            / 1000
+        )
+        slug = parts[0] if parts else ""
+        if not any(platform.slug == slug for platform in FIXTURE_PLATFORMS):
+            return 404, "text/html", page_html("Not found", "<h1>Not found</h1>")
+        if slug in self.config.down_platforms or random.random() < self.config.failure_rate:
+            self.failures_injected += 1
+            return 503, "text/html", page_html("Unavailable", "<h1>Service unavailable</h1>")
+
+        if len(parts) == 1:
+            return 200, "text/html", self.search_form(slug)
+        if parts[1] == "search":
+            query = {key: values[0] for key, values in parse_qs(parsed.query).items()}
+            return 200, "text/html", self.results_page(slug, query)
+        if parts[1] == "car" and len(parts) == 3 and parts[2].isdigit():
+            return 200, "text/html", self.detail_page(int(parts[2]))
+        return 404, "text/html", page_html("Not found", "<h1>Not found</h1>")
+
+    def search_form(self, slug: str) -> bytes:
+        models = [model for brand_models in BRANDS.values() for model in brand_models]
+        years = [str(year) for year in range(2005, 2025)]
+        body = f"""
+        <form onsubmit="return false">
+          <select id="brand"><option value="">Brand</option>{option_tags(list(BRANDS))}</select>
+          <select id="model"><option value="">Model</option>{option_tags(models)}</select>
+          <select id="year-from"><option value="">From</option>{option_tags(years)}</select>
+          <select id="year-to"><option value="">To</option>{option_tags(years)}</select>
+          <button id="search" type="button">Search</button>
+        </form>
+        <script>
+          document.getElementById("search").addEventListener("click", () => {{
+            const params = new URLSearchParams({{
+              brand: document.getElementById("brand").value,
+              model: document.getElementById("model").value,
+              year_from: document.getElementById("year-from").value,
+              year_to: document.getElementById("year-to").value,
+            }});
+            location.href = "/{slug}/search?" + params.toString();
+          }});
+        </script>
+        """
+        return page_html(f"{slug} search", body)
+
+    def results_page(self, slug: str, query: Dict[str, str]) -> bytes:
+        page = int(query.get("page", "1"))
+        per_page = self.config.listings_per_page
+        first = (page - 1) * per_page
+        count = max(0, min(per_page, self.config.total_listings - first))
+
+        listings = []
+        for position in range(first, first + count):
+            car_id = listing_id(slug, query.get("brand"), query.get("model"), position)
+            listings.append(
+                f"<article class='listing'><img src='/static/photo.gif'>"
+                f"<a class='listing-link' href='{self.url}/{slug}/car/{car_id}'>"
+                f"{escape(query.get('brand', ''))} {escape(query.get('model', ''))} #{position + 1}"
+                f"</a></article>"
+            )
+
+        next_link = ""
+        if first + count < self.config.total_listings:
+            next_query = urlencode({**query, "page": page + 1})
+            next_link = f"<a class='next' href='/{slug}/search?{next_query}'>Next</a>"
+
+        return page_html(
+            f"{slug} results",
+            f"<div id='results'>{''.join(listings)}</div>{next_link}",
+        )
+
+    def detail_page(self, car_id: int) -> bytes:
+        year = 2005 + car_id % 20
+        price = 3000 + car_id % 40000
+        mileage = 10000 + car_id % 250000
+        views = 1 + car_id % 5000
+        body = (
+            f"<img src='/static/photo.gif'>"
+            f"<span class='year'>{year}</span>"
+            f"<span class='price'>${price:,}</span>"
+            f"<span class='mileage'>{mileage} км</span>"
+            f"<span class='views'>Views {views}</span>"
+        )
+        return page_html(f"Car {car_id}", body)
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--port", type=int, default=8765)
+    arg_parser.add_argument("--latency-ms", type=float, default=50)
+    arg_parser.add_argument("--jitter-ms", type=float, default=20)
+    arg_parser.add_argument("--failure-rate", type=float, default=0.0)
+    arg_parser.add_argument("--total-listings", type=int, default=60)
+    args = arg_parser.parse_args()
+
+    server = FixtureServer(
+        FixtureConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            failure_rate=args.failure_rate,
+            total_listings=args.total_listings,
+        ),
+        port=args.port,
+    )
+    print(f"Serving fixture platforms on {server.url}/<{'|'.join(p.slug for p in FIXTURE_PLATFORMS)}>/")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
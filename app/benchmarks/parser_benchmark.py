@@ -0,0 +1,107 @@
+"""Compare HTML parser backends on saved detail pages.
+
+Run from the app directory:
+
+    python -m benchmarks.parser_benchmark --pages saved_pages/ --platform platform.json
+
+``platform.json`` is a car platform as returned by ``GET /car-platforms/{id}``;
+the year, price, mileage and views selectors are taken from it.
+"""
+
+import argparse
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Callable, Dict, List
+from bs4 import BeautifulSoup
+from services.html_parser import create_html_parser, get_available_backends
+
+FIELDS = ("year", "price", "mileage", "views")
+
+
+def load_selectors(args: argparse.Namespace) -> Dict[str, str]:
+    if args.platform:
+        platform = json.loads(Path(args.platform).read_text(encoding="utf-8"))
+        return {field: platform[f"{field}_bs4_selector"] for field in FIELDS}
+    return {field: getattr(args, field) for field in FIELDS}
+
+
+def time_runs(func: Callable[[str], None], pages: List[str], repeat: int) -> List[float]:
+    timings = []
+    for _ in range(repeat):
+        for html in pages:
+            start = time.perf_counter()
+            func(html)
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+def p95(timings: List[float]) -> float:
+    if len(timings) < 2:
+        return timings[0]
+    return statistics.quantiles(timings, n=20)[-1]
+
+
+def uncompiled_extract(html: str, selectors: Dict[str, str]) -> None:
+    # Previous behaviour: html.parser tree and selectors re-split on every lookup
+    soup = BeautifulSoup(html, "html.parser")
+    for field in FIELDS:
+        for selector in selectors[field].split(","):
+            if soup.select_one(selector):
+                break
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--pages", required=True, help="Directory with saved *.html pages")
+    arg_parser.add_argument("--platform", help="Car platform JSON with bs4 selectors")
+    for field in FIELDS:
+        arg_parser.add_argument(f"--{field}", help=f"{field} selector (without --platform)")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    selectors = load_selectors(args)
+    if any(not selector for selector in selectors.values()):
+        arg_parser.error("pass --platform or all of --year --price --mileage --views")
+
+    pages = [
+        path.read_text(encoding="utf-8", errors="replace")
+        for path in sorted(Path(args.pages).glob("*.html"))
+    ]
+    if not pages:
+        arg_parser.error(f"no *.html files in {args.pages}")
+
+    print(f"{len(pages)} page(s), {args.repeat} run(s) each")
+    print(f"{'backend':<24}{'parse ms':>12}{'extract ms':>12}{'p95 ms':>12}")
+
+    results = {
+        "bs4 uncompiled (old)": time_runs(
+            lambda html: uncompiled_extract(html, selectors), pages, args.repeat
+        )
+    }
+    for backend_name in get_available_backends():
+        parser = create_html_parser(backend_name)
+        parse_only = time_runs(parser.parse, pages, args.repeat)
+
+        def extract(html: str) -> None:
+            document = parser.parse(html)
+            for field in FIELDS:
+                parser.select_first(document, selectors[field])
+
+        results[backend_name] = time_runs(extract, pages, args.repeat)
+        print(
+            f"{backend_name:<24}{statistics.mean(parse_only) * 1000:>12.2f}"
+            f"{statistics.mean(results[backend_name]) * 1000:>12.2f}"
+            f"{p95(results[backend_name]) * 1000:>12.2f}"
+        )
+
+    old = results["bs4 uncompiled (old)"]
+    print(
+        f"{'bs4 uncompiled (old)':<24}{'-':>12}{statistics.mean(old) * 1000:>12.2f}"
+        f"{p95(old) * 1000:>12.2f}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,273 @@
+"""Benchmark ScrapingService against the local fixture marketplace.
+
+Needs Playwright's Chromium and a migrated scratch database in
+DB_CONNECTION_STRING, but no network access. The run seeds "bench-*" car
+platforms and the fixture car models, then scrapes them. Run from the app
+directory:
+
+    python -m benchmarks.scraping_benchmark --runs 3 --max-listings 40 --latency-ms 80
+"""
+
+import argparse
+import asyncio
+import os
+import statistics
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+from db import SessionLocal
+from crud.car_model_repository import CarModelRepository
+from crud.car_platform_repository import CarPlatformRepository
+from models.car import Car
+from models.car_platform import CarPlatform
+from schemas.car_model_schema import CarModelCreateUpdate
+from schemas.scraped_car_schema import (
+    ScrapingConfigByQuery,
+    ScrapingConfigByCarsModel,
+    ScrapingResultSuccess,
+    ScrapingResultError,
+)
+from services.browser_pool import browser_pool
+from services.http_client import http_client
+from services.scraped_car_writer import scraped_car_writer
+from services.scraping_service import create_scraping_service
+from benchmarks.fixture_server import (
+    BRANDS,
+    FixtureConfig,
+    FixtureServer,
+    platform_definitions,
+)
+
+
+@dataclass
+class BenchmarkStats:
+    wall_seconds: float = 0.0
+    listings: int = 0
+    reused: int = 0
+    errors: Dict[str, int] = field(default_factory=dict)
+    platform_seconds: Dict[str, List[float]] = field(default_factory=dict)
+    stage_seconds: Dict[str, float] = field(default_factory=dict)
+
+    def add(self, results: List[ScrapingResultSuccess | ScrapingResultError], elapsed: float):
+        self.wall_seconds += elapsed
+        for result in results:
+            if isinstance(result, ScrapingResultSuccess):
+                self.listings += result.cars_scraped
+                self.reused += result.cars_reused
+                self.platform_seconds.setdefault(result.marketplace_name, []).append(
+                    result.time_to_scrape_platform_seconds
+                )
+            else:
+                self.errors[result.status] = self.errors.get(result.status, 0) + 1
+            for stage, seconds in result.stage_timings.items():
+                self.stage_seconds[stage] = self.stage_seconds.get(stage, 0.0) + seconds
+
+
+def percentile(values: List[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0]
+    return statistics.quantiles(values, n=100, method="inclusive")[q - 1]
+
+
+def descendant_pids(root_pid: int) -> List[int]:
+    children: Dict[int, List[int]] = {}
+    for stat_path in Path("/proc").glob("[0-9]*/stat"):
+        try:
+            # The command name may contain spaces, the fields after it do not
+            fields = stat_path.read_text().rsplit(")", 1)[1].split()
+        except (OSError, IndexError):
+            continue
+        children.setdefault(int(fields[1]), []).append(int(stat_path.parent.name))
+
+    pids, stack = [], [root_pid]
+    while stack:
+        for child in children.get(stack.pop(), []):
+            pids.append(child)
+            stack.append(child)
+    return pids
+
+
+def rss_kb(pid: int) -> int:
+    try:
+        for line in Path(f"/proc/{pid}/status").read_text().splitlines():
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    except OSError:
+        pass
+    return 0
+
+
+class BrowserMemoryMonitor:
+    # Playwright driver and Chromium run as child processes of the benchmark
+    def __init__(self, interval: float = 0.25):
+        self.interval = interval
+        self.peak_kb = 0
+        self._task: Optional[asyncio.Task] = None
+
+    async def _sample(self) -> None:
+        while True:
+            total = sum(rss_kb(pid) for pid in descendant_pids(os.getpid()))
+            self.peak_kb = max(self.peak_kb, total)
+            await asyncio.sleep(self.interval)
+
+    def start(self) -> None:
+        if Path("/proc").is_dir():
+            self._task = asyncio.create_task(self._sample())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+
+async def seed_platforms(session, base_url: str) -> List[CarPlatform]:
+    repo = CarPlatformRepository(session)
+    existing = {cp.name: cp for cp in await repo.get_all_car_platforms()}
+    platforms = []
+    for definition in platform_definitions(base_url):
+        if definition.name in existing:
+            # The fixture port changes between runs
+            platforms.append(
+                await repo.update_car_platform(existing[definition.name].id, definition)
+            )
+        else:
+            platforms.append(await repo.create_car_platform(definition))
+    return platforms
+
+
+async def seed_car_models(session, year_from: int, year_to: int) -> List[Car]:
+    repo = CarModelRepository(session)
+    existing = {
+        (car.brand, car.model, car.year_from, car.year_to): car
+        for car in await repo.get_all_car_models()
+    }
+    cars = []
+    for brand, models in BRANDS.items():
+        for model in models:
+            car = existing.get((brand, model, year_from, year_to))
+            if car is None:
+                car = await repo.create_car_model(
+                    CarModelCreateUpdate(
+                        brand=brand, model=model, year_from=year_from, year_to=year_to
+                    )
+                )
+            cars.append(car)
+    return cars
+
+
+def print_report(title: str, stats: BenchmarkStats) -> None:
+    print(f"\n{title}")
+    print(f"  wall time        {stats.wall_seconds:10.2f} s")
+    print(f"  listings         {stats.listings:10d}")
+    # Set LISTING_REUSE_TTL_HOURS=0 to load every detail page on repeated runs
+    print(f"  reused listings  {stats.reused:10d}")
+    print(
+        f"  listings/sec     {stats.listings / stats.wall_seconds if stats.wall_seconds else 0:10.2f}"
+    )
+    if stats.errors:
+        print(f"  errors           {stats.errors}")
+    print(f"  {'platform':<20}{'runs':>6}{'p50 s':>10}{'p95 s':>10}")
+    for name, seconds in sorted(stats.platform_seconds.items()):
+        print(
+            f"  {name:<20}{len(seconds):>6}{percentile(seconds, 50):>10.2f}"
+            f"{percentile(seconds, 95):>10.2f}"
+        )
+    if stats.stage_seconds:
+        # Concurrent detail pages add up, so stages can exceed the wall time
+        print(f"  {'stage':<26}{'total s':>10}")
+        for stage, seconds in sorted(
+            stats.stage_seconds.items(), key=lambda item: item[1], reverse=True
+        ):
+            print(f"  {stage:<26}{seconds:>10.2f}")
+
+
+async def run(args: argparse.Namespace) -> None:
+    server = FixtureServer(
+        FixtureConfig(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            failure_rate=args.failure_rate,
+            total_listings=args.total_listings,
+            down_platforms=set(args.down),
+        )
+    )
+    server.start()
+    await browser_pool.start()
+    await http_client.start()
+    await scraped_car_writer.start()
+    monitor = BrowserMemoryMonitor()
+    monitor.start()
+    try:
+        async with SessionLocal() as session:
+            platforms = await seed_platforms(session, server.url)
+            cars = await seed_car_models(session, args.year_from, args.year_to)
+            platform_ids = [platform.id for platform in platforms]
+            service = create_scraping_service(session)
+
+            if args.mode in ("query", "both"):
+                stats = BenchmarkStats()
+                for _ in range(args.runs):
+                    for car in cars:
+                        start = time.perf_counter()
+                        result = await service.scrape_car(
+                            ScrapingConfigByQuery(
+                                brand=car.brand,
+                                model=car.model,
+                                year_from=car.year_from,
+                                year_to=car.year_to,
+                                car_platform_ids=platform_ids,
+                                max_listings=args.max_listings,
+                            ),
+                            headless=True,
+                        )
+                        stats.add(result.results, time.perf_counter() - start)
+                print_report("scrape_car (one car model per call)", stats)
+
+            if args.mode in ("cars", "both"):
+                stats = BenchmarkStats()
+                for _ in range(args.runs):
+                    start = time.perf_counter()
+                    result = await service.scrape_cars(
+                        ScrapingConfigByCarsModel(
+                            car_ids=[car.id for car in cars],
+                            car_platform_ids=platform_ids,
+                            max_listings=args.max_listings,
+                        ),
+                        headless=True,
+                    )
+                    stats.add(result.results, time.perf_counter() - start)
+                print_report("scrape_cars (all car models per call)", stats)
+    finally:
+        await monitor.stop()
+        await scraped_car_writer.stop()
+        await http_client.stop()
+        await browser_pool.stop()
+        server.stop()
+
+    print(f"\npeak browser RSS   {monitor.peak_kb / 1024:10.1f} MiB")
+    print(
+        f"fixture requests   {server.requests_served:10d} "
+        f"({server.failures_injected} failures injected)"
+    )
+
+
+def main() -> None:
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    arg_parser.add_argument("--mode", choices=["query", "cars", "both"], default="both")
+    arg_parser.add_argument("--runs", type=int, default=3)
+    arg_parser.add_argument("--max-listings", type=int, default=20)
+    arg_parser.add_argument("--total-listings", type=int, default=60)
+    arg_parser.add_argument("--year-from", type=int, default=2010)
+    arg_parser.add_argument("--year-to", type=int, default=2020)
+    arg_parser.add_argument("--latency-ms", type=float, default=50)
+    arg_parser.add_argument("--jitter-ms", type=float, default=20)
+    arg_parser.add_argument("--failure-rate", type=float, default=0.0)
+    arg_parser.add_argument(
+        "--down", action="append", default=[], help="Fixture platform slug to fail entirely"
+    )
+    asyncio.run(run(arg_parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,79 @@
+from typing import Literal
 from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
 class AppSettings(BaseSettings):
     DB_CONNECTION_STRING: str = Field(alias="DB_CONNECTION_STRING", min_length=1)
+    # Concurrent scraping tasks each check out their own connection
+    DB_POOL_SIZE: int = Field(default=10, ge=1)
+    DB_MAX_OVERFLOW: int = Field(default=20, ge=0)
+
+    # Warm browser contexts shared by scraping requests
+    BROWSER_POOL_SIZE: int = Field(default=4, ge=1)
+    BROWSER_CONTEXT_MAX_PAGES: int = Field(default=100, ge=1)
+    BROWSER_LEASE_TIMEOUT_SECONDS: float = Field(default=120, gt=0)
+
+    # Pooled HTTP client for platforms scraped in "http" render mode
+    HTTP_MAX_CONNECTIONS: int = Field(default=100, ge=1)
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(default=20, ge=0)
+    HTTP_TIMEOUT_SECONDS: float = Field(default=20, gt=0)
+
+    # Falls back to html.parser when the chosen backend is not installed
+    HTML_PARSER_BACKEND: Literal["html.parser", "lxml", "selectolax"] = "lxml"
+
+    # Resolved search result URLs let repeat scrapes skip the search form
+    SEARCH_URL_CACHE_TTL_HOURS: float = Field(default=24, ge=0)
+
+    # Age after which a platform's saved cookies/localStorage are re-captured
+    BROWSER_STORAGE_STATE_REFRESH_HOURS: float = Field(default=12, ge=0)
+
+    # In-process workers for scrapes submitted as background jobs
+    SCRAPE_JOB_WORKERS: int = Field(default=2, ge=1)
+    SCRAPE_JOB_RETENTION: int = Field(default=200, ge=1)
+
+    # Listings whose details were loaded this recently are not revisited; 0 always reloads
+    LISTING_REUSE_TTL_HOURS: float = Field(default=6, ge=0)
+
+    # Compressed, content-addressed detail page HTML kept for offline re-parsing
+    HTML_SNAPSHOTS_ENABLED: bool = True
+    HTML_SNAPSHOT_RETENTION_DAYS: int = Field(default=30, ge=1)
+    # Expired snapshots are deleted by a background task, not on the scrape path
+    HTML_SNAPSHOT_PRUNE_INTERVAL_HOURS: float = Field(default=6, gt=0)
+    HTML_SNAPSHOT_COMPRESSION_LEVEL: int = Field(default=6, ge=1, le=9)
+    # 0 uses every CPU core
+    HTML_REPARSE_PROCESSES: int = Field(default=0, ge=0)
+    HTML_REPARSE_BATCH_SIZE: int = Field(default=500, ge=1)
+
+    # Comment line sent on idle result streams so proxies keep the connection open
+    SCRAPE_STREAM_KEEPALIVE_SECONDS: float = Field(default=15, gt=0)
+
+    # Write-behind buffer for scraped car rows, flushed by size or age
+    SCRAPED_CAR_WRITER_QUEUE_SIZE: int = Field(default=5000, ge=1)
+    SCRAPED_CAR_WRITER_BATCH_SIZE: int = Field(default=500, ge=1)
+    SCRAPED_CAR_WRITER_FLUSH_SECONDS: float = Field(default=1, gt=0)
+    # JSON lines file keeping rows that could not be written, with the error
+    SCRAPED_CAR_WRITER_DEAD_LETTER_PATH: str = "dead_letter/scraped_cars.jsonl"
+
+    # Processes sharing scrape_cars tasks, each with its own browser; 0 scrapes in-process
+    SCRAPING_WORKER_PROCESSES: int = Field(default=0, ge=0)
+
+    # Retries of transient scrape failures, with jittered exponential backoff
+    SCRAPE_RETRY_ATTEMPTS: int = Field(default=2, ge=0)
+    SCRAPE_RETRY_BASE_DELAY_SECONDS: float = Field(default=2, ge=0)
+    SCRAPE_RETRY_MAX_DELAY_SECONDS: float = Field(default=30, ge=0)
+
+    # Per-platform circuit breaker over consecutive outage/selector failures
+    CIRCUIT_BREAKER_FAILURE_THRESHOLD: int = Field(default=3, ge=1)
+    CIRCUIT_BREAKER_RESET_SECONDS: float = Field(default=300, gt=0)
+
+    # Recurring scrapes of tracked car models, submitted as background jobs
+    SCRAPE_SCHEDULER_ENABLED: bool = False
+    SCRAPE_SCHEDULER_POLL_SECONDS: float = Field(default=60, gt=0)
+    SCRAPE_SCHEDULER_MAX_JOBS_PER_TICK: int = Field(default=2, ge=1)
+    SCRAPE_SCHEDULER_TRACK_ALL_CARS: bool = True
+    SCRAPE_SCHEDULE_DEFAULT_INTERVAL_MINUTES: int = Field(default=360, ge=15)
+    SCRAPE_SCHEDULE_JITTER_RATIO: float = Field(default=0.1, ge=0, lt=1)
 
     model_config = SettingsConfigDict(env_file=".env")
 
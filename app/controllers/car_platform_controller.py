@@ -1,5 +1,8 @@
 from fastapi import APIRouter
 from crud.car_platform_repository import CarPlatformRepositoryDependency
+from crud.platform_storage_state_repository import (
+    PlatformStorageStateRepositoryDependency,
+)
 from schemas.car_platform_schema import CarPlatformCreateUpdate, CarPlatformResponse
 
 car_platform_router = APIRouter(prefix="/car-platforms", tags=["car-platforms"])
@@ -38,4 +41,11 @@ async def delete_car_platform(
     car_platform_id: int, repo: CarPlatformRepositoryDependency
 ):
     await repo.delete_car_platform(car_platform_id)
-    return {"detail": "Car platform deleted successfully"}
\ No newline at end of file
+    return {"detail": "Car platform deleted successfully"}
+
+@car_platform_router.delete("/{car_platform_id}/storage-state", response_model=None)
+async def delete_car_platform_storage_state(
+    car_platform_id: int, repo: PlatformStorageStateRepositoryDependency
+):
+    await repo.delete_storage_state(car_platform_id)
+    return {"detail": "Storage state deleted successfully"}
@@ -0,0 +1,42 @@
+from datetime import datetime, timedelta, timezone
+from fastapi import APIRouter
+from fastapi.responses import HTMLResponse
+from common.app_settings import settings
+from crud.html_snapshot_repository import HtmlSnapshotRepositoryDependency
+from schemas.html_snapshot_schema import (
+    HtmlSnapshotStats,
+    HtmlSnapshotPruneResult,
+    HtmlSnapshotReparseRequest,
+    HtmlSnapshotReparseResult,
+)
+from services.html_snapshot import decompress_html
+from services.snapshot_reparse_service import SnapshotReparseServiceDependency
+
+html_snapshot_router = APIRouter(prefix="/html-snapshots", tags=["html-snapshots"])
+
+
+@html_snapshot_router.get("", response_model=HtmlSnapshotStats)
+async def get_html_snapshot_stats(repo: HtmlSnapshotRepositoryDependency):
+    return await repo.get_stats()
+
+
+@html_snapshot_router.get("/{snapshot_hash}", response_class=HTMLResponse)
+async def get_html_snapshot(snapshot_hash: str, repo: HtmlSnapshotRepositoryDependency):
+    snapshot = await repo.get_snapshot(snapshot_hash)
+    return HTMLResponse(decompress_html(snapshot.content))
+
+
+@html_snapshot_router.post("/prune", response_model=HtmlSnapshotPruneResult)
+async def prune_html_snapshots(repo: HtmlSnapshotRepositoryDependency):
+    deleted = await repo.delete_expired_snapshots(
+        datetime.now(timezone.utc) - timedelta(days=settings.HTML_SNAPSHOT_RETENTION_DAYS)
+    )
+    return HtmlSnapshotPruneResult(deleted_snapshots=deleted)
+
+
+@html_snapshot_router.post("/reparse", response_model=HtmlSnapshotReparseResult)
+async def reparse_html_snapshots(
+    service: SnapshotReparseServiceDependency,
+    criteria: HtmlSnapshotReparseRequest = HtmlSnapshotReparseRequest(),
+):
+    return await service.reparse(criteria)
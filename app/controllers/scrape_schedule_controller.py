@@ -0,0 +1,56 @@
+from fastapi import APIRouter
+from crud.scrape_schedule_repository import ScrapeScheduleRepositoryDependency
+from schemas.scrape_schedule_schema import (
+    ScrapeScheduleCreateUpdate,
+    ScrapeScheduleResponse,
+)
+
+scrape_schedule_router = APIRouter(prefix="/scrape-schedules", tags=["scrape-schedules"])
+
+
+@scrape_schedule_router.post("", response_model=ScrapeScheduleResponse)
+async def create_scrape_schedule(
+    repo: ScrapeScheduleRepositoryDependency, schedule: ScrapeScheduleCreateUpdate
+):
+    created_schedule = await repo.create_schedule(schedule)
+    return ScrapeScheduleResponse.model_validate(created_schedule)
+
+
+@scrape_schedule_router.get("", response_model=list[ScrapeScheduleResponse])
+async def get_all_scrape_schedules(repo: ScrapeScheduleRepositoryDependency):
+    schedules = await repo.get_all_schedules()
+    return [ScrapeScheduleResponse.model_validate(s) for s in schedules]
+
+
+@scrape_schedule_router.get("/{schedule_id}", response_model=ScrapeScheduleResponse)
+async def get_scrape_schedule_by_id(
+    schedule_id: int, repo: ScrapeScheduleRepositoryDependency
+):
+    schedule = await repo.get_schedule_by_id(schedule_id)
+    return ScrapeScheduleResponse.model_validate(schedule)
+
+
+@scrape_schedule_router.put("/{schedule_id}", response_model=ScrapeScheduleResponse)
+async def update_scrape_schedule(
+    schedule_id: int,
+    schedule: ScrapeScheduleCreateUpdate,
+    repo: ScrapeScheduleRepositoryDependency,
+):
+    updated_schedule = await repo.update_schedule(schedule_id, schedule)
+    return ScrapeScheduleResponse.model_validate(updated_schedule)
+
+
+@scrape_schedule_router.post("/{schedule_id}/run-now", response_model=ScrapeScheduleResponse)
+async def run_scrape_schedule_now(
+    schedule_id: int, repo: ScrapeScheduleRepositoryDependency
+):
+    schedule = await repo.run_schedule_now(schedule_id)
+    return ScrapeScheduleResponse.model_validate(schedule)
+
+
+@scrape_schedule_router.delete("/{schedule_id}", response_model=None)
+async def delete_scrape_schedule(
+    schedule_id: int, repo: ScrapeScheduleRepositoryDependency
+):
+    await repo.delete_schedule(schedule_id)
+    return {"detail": "Scrape schedule deleted successfully"}
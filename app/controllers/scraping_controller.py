@@ -1,4 +1,4 @@
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Query
 from services.scraping_service import ScrapingServiceDependency
 from schemas.scraped_car_schema import (
     ScrapingConfigByQuery,
@@ -10,9 +10,22 @@ from schemas.scraped_car_schema import (
     ScrapingResultsByCarModels,
     ScrapedCarQuery,
 )
+from schemas.browser_pool_schema import BrowserPoolStats
+from schemas.scrape_job_schema import ScrapeJobResponse
+from schemas.rate_limiter_schema import PlatformLimiterStats
+from schemas.circuit_breaker_schema import CircuitBreakerStats
+from schemas.stage_timing_schema import StageTimingResponse, StageHistogram
+from schemas.scrape_stream_schema import ScrapeStreamFormat
+from schemas.scraped_car_writer_schema import ScrapedCarWriterStats
 from crud.scraping_repository import ScrapingRepositoryDependency
-from crud.car_model_repository import CarModelRepositoryDependency
 from services.csv_service import CSVServiceDependency
+from services.browser_pool import browser_pool
+from services.scrape_job_service import scrape_job_manager
+from services.rate_limiter import platform_limiters
+from services.circuit_breaker import circuit_breakers
+from services.stage_timer import stage_histograms
+from services.scraped_car_writer import scraped_car_writer
+from services.scrape_stream_service import MEDIA_TYPES, StreamRunner, stream_scrape
 from typing import Annotated
 from fastapi.responses import StreamingResponse
 
@@ -33,23 +46,10 @@ async def scrape_car(
 )
 async def scrape_cars_by_car_model(
     service: ScrapingServiceDependency,
-    car_repo: CarModelRepositoryDependency,
     config: ScrapingConfigByCarModel,
     headless: bool = True,
 ):
-    car_model = await car_repo.get_car_model_by_id(config.car_id)
-
-    return await service.scrape_car(
-        ScrapingConfigByQuery(
-            brand=car_model.brand,
-            model=car_model.model,
-            year_from=car_model.year_from,
-            year_to=car_model.year_to,
-            car_platform_ids=config.car_platform_ids,
-        ),
-        headless=headless,
-        car_id=car_model.id,
-    )
+    return await service.scrape_car_model(config, headless=headless)
 
 
 @scraping_router.post(
@@ -63,6 +63,58 @@ async def scrape_cars_by_cars_models(
     return await service.scrape_cars(config, headless=headless)
 
 
+def streaming_scrape_response(
+    runner: StreamRunner, stream_format: ScrapeStreamFormat
+) -> StreamingResponse:
+    return StreamingResponse(
+        stream_scrape(runner, stream_format),
+        media_type=MEDIA_TYPES[stream_format],
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@scraping_router.post("/stream/scrape-cars-query/{headless}")
+async def stream_scrape_car(
+    config: ScrapingConfigByQuery,
+    headless: bool = True,
+    stream_format: ScrapeStreamFormat = Query(ScrapeStreamFormat.SSE, alias="format"),
+):
+    return streaming_scrape_response(
+        lambda service, on_result: service.scrape_car(
+            config, headless=headless, on_result=on_result
+        ),
+        stream_format,
+    )
+
+
+@scraping_router.post("/stream/scrape-cars-by-car-model/{headless}")
+async def stream_scrape_cars_by_car_model(
+    config: ScrapingConfigByCarModel,
+    headless: bool = True,
+    stream_format: ScrapeStreamFormat = Query(ScrapeStreamFormat.SSE, alias="format"),
+):
+    return streaming_scrape_response(
+        lambda service, on_result: service.scrape_car_model(
+            config, headless=headless, on_result=on_result
+        ),
+        stream_format,
+    )
+
+
+@scraping_router.post("/stream/scrape-cars-by-cars-models/{headless}")
+async def stream_scrape_cars_by_cars_models(
+    config: ScrapingConfigByCarsModel,
+    headless: bool = True,
+    stream_format: ScrapeStreamFormat = Query(ScrapeStreamFormat.SSE, alias="format"),
+):
+    return streaming_scrape_response(
+        lambda service, on_result: service.scrape_cars(
+            config, headless=headless, on_result=on_result
+        ),
+        stream_format,
+    )
+
+
 @scraping_router.get("/scraped-cars", response_model=list[ScrapedRequestResponse])
 async def get_scraped_cars(
     repo: ScrapingRepositoryDependency,
@@ -92,6 +144,17 @@ async def get_scrape_request(
     return ScrapeRequestResponse.model_validate(scrape_request)
 
 
+@scraping_router.get(
+    "/scrape-request/{request_id}/timings", response_model=list[StageTimingResponse]
+)
+async def get_scrape_request_timings(
+    request_id: int,
+    repo: ScrapingRepositoryDependency,
+):
+    timings = await repo.fetch_stage_timings(request_id)
+    return [StageTimingResponse.model_validate(t) for t in timings]
+
+
 @scraping_router.delete("/scrape-request/{request_id}", response_model=None)
 async def delete_scrape_request(request_id: int, repo: ScrapingRepositoryDependency):
     await repo.delete_scrape_request(request_id)
@@ -111,3 +174,90 @@ async def get_scraped_cars_csv(
     }
 
     return StreamingResponse(csv_content, headers=headers)
+
+
+@scraping_router.get("/browser-pool", response_model=BrowserPoolStats)
+async def get_browser_pool_stats():
+    return browser_pool.stats()
+
+
+@scraping_router.get("/write-buffer", response_model=ScrapedCarWriterStats)
+async def get_write_buffer_stats():
+    return scraped_car_writer.stats()
+
+
+@scraping_router.get("/rate-limits", response_model=list[PlatformLimiterStats])
+async def get_platform_rate_limits():
+    return platform_limiters.stats()
+
+
+@scraping_router.get("/circuit-breakers", response_model=list[CircuitBreakerStats])
+async def get_circuit_breakers():
+    return circuit_breakers.stats()
+
+
+@scraping_router.post(
+    "/circuit-breakers/{car_platform_id}/reset", response_model=CircuitBreakerStats
+)
+async def reset_circuit_breaker(car_platform_id: int):
+    breaker = circuit_breakers.reset(car_platform_id)
+    if breaker is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No circuit breaker for car platform {car_platform_id}",
+        )
+    return breaker.stats()
+
+
+@scraping_router.get("/stage-timings/histograms", response_model=list[StageHistogram])
+async def get_stage_timing_histograms():
+    return stage_histograms.snapshot()
+
+
+@scraping_router.post(
+    "/jobs/scrape-cars-query/{headless}",
+    response_model=ScrapeJobResponse,
+    status_code=202,
+)
+async def submit_scrape_car_job(config: ScrapingConfigByQuery, headless: bool = True):
+    job = scrape_job_manager.submit_query(config, headless=headless)
+    return scrape_job_manager.to_response(job)
+
+
+@scraping_router.post(
+    "/jobs/scrape-cars-by-car-model/{headless}",
+    response_model=ScrapeJobResponse,
+    status_code=202,
+)
+async def submit_scrape_car_model_job(
+    config: ScrapingConfigByCarModel, headless: bool = True
+):
+    job = scrape_job_manager.submit_car_model(config, headless=headless)
+    return scrape_job_manager.to_response(job)
+
+
+@scraping_router.post(
+    "/jobs/scrape-cars-by-cars-models/{headless}",
+    response_model=ScrapeJobResponse,
+    status_code=202,
+)
+async def submit_scrape_car_models_job(
+    config: ScrapingConfigByCarsModel, headless: bool = True
+):
+    job = scrape_job_manager.submit_car_models(config, headless=headless)
+    return scrape_job_manager.to_response(job)
+
+
+@scraping_router.get("/jobs", response_model=list[ScrapeJobResponse])
+async def list_scrape_jobs():
+    return [scrape_job_manager.to_response(job) for job in scrape_job_manager.list_jobs()]
+
+
+@scraping_router.get("/jobs/{job_id}", response_model=ScrapeJobResponse)
+async def get_scrape_job(job_id: str):
+    return scrape_job_manager.to_response(scrape_job_manager.get_job(job_id))
+
+
+@scraping_router.delete("/jobs/{job_id}", response_model=ScrapeJobResponse)
+async def cancel_scrape_job(job_id: str):
+    return scrape_job_manager.to_response(scrape_job_manager.cancel(job_id))
@@ -0,0 +1,83 @@
+from fastapi import Depends
+from db import SessionContext
+from typing import Annotated, List
+from sqlalchemy import select, delete, insert
+from models.dropdown_option import DropdownOption
+from schemas.dropdown_option_schema import DropdownOptionItem
+
+
+class DropdownOptionRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_options(
+        self, car_platform_id: int, field: str, parent_value: str = ""
+    ) -> List[DropdownOptionItem]:
+        stmt = (
+            select(DropdownOption)
+            .where(
+                DropdownOption.car_platform_id == car_platform_id,
+                DropdownOption.field == field,
+                DropdownOption.parent_value == parent_value,
+            )
+            .order_by(DropdownOption.position)
+        )
+        result = await self.session.execute(stmt)
+        return [DropdownOptionItem.model_validate(o) for o in result.scalars().all()]
+
+    async def replace_options(
+        self,
+        car_platform_id: int,
+        field: str,
+        parent_value: str,
+        options: List[DropdownOptionItem],
+    ) -> None:
+        try:
+            await self.session.execute(
+                delete(DropdownOption).where(
+                    DropdownOption.car_platform_id == car_platform_id,
+                    DropdownOption.field == field,
+                    DropdownOption.parent_value == parent_value,
+                )
+            )
+            if options:
+                await self.session.execute(
+                    insert(DropdownOption),
+                    [
+                        {
+                            "car_platform_id": car_platform_id,
+                            "field": field,
+                            "parent_value": parent_value,
+                            "position": position,
+                            **option.model_dump(),
+                        }
+                        for position, option in enumerate(options)
+                    ],
+                )
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def merge_options(
+        self,
+        car_platform_id: int,
+        field: str,
+        parent_value: str,
+        options: List[DropdownOptionItem],
+    ) -> None:
+        # A virtualized list harvested until a deadline is often partial: options
+        # seen now go first in page order, indexed ones not seen this time stay
+        harvested = {option.normalized_text for option in options}
+        existing = await self.get_options(car_platform_id, field, parent_value)
+        await self.replace_options(
+            car_platform_id,
+            field,
+            parent_value,
+            options + [o for o in existing if o.normalized_text not in harvested],
+        )
+
+
+DropdownOptionRepositoryDependency = Annotated[
+    DropdownOptionRepository, Depends(DropdownOptionRepository)
+]
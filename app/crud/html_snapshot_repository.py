@@ -0,0 +1,127 @@
+from fastapi import Depends, HTTPException
+from db import SessionContext
+from typing import Annotated, Dict, List, Set
+from datetime import datetime
+from sqlalchemy import select, delete, update, func
+from sqlalchemy.dialects.postgresql import insert
+from models.html_snapshot import HtmlSnapshot
+from models.scraped_car import ScrapedCar
+from schemas.html_snapshot_schema import (
+    HtmlSnapshotCreate,
+    HtmlSnapshotStats,
+    HtmlSnapshotReparseRequest,
+)
+
+
+class HtmlSnapshotRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def save_snapshots(self, snapshots: List[HtmlSnapshotCreate]) -> None:
+        # One statement cannot upsert the same row twice
+        unique = {snapshot.hash: snapshot for snapshot in snapshots}
+        if not unique:
+            return
+        stmt = insert(HtmlSnapshot).values(
+            [snapshot.model_dump() for snapshot in unique.values()]
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[HtmlSnapshot.hash],
+            set_={"last_seen_at": func.now()},
+        )
+        try:
+            await self.session.execute(stmt)
+            await self.session.commit()
+        except Exception:
+            await self.session.rollback()
+            raise
+
+    async def touch_snapshots(self, hashes: List[str]) -> Set[str]:
+        # Marks reused snapshots as seen so pruning keeps them; returns the hashes that still exist
+        if not hashes:
+            return set()
+        result = await self.session.execute(
+            update(HtmlSnapshot)
+            .where(HtmlSnapshot.hash.in_(hashes))
+            .values(last_seen_at=func.now())
+            .returning(HtmlSnapshot.hash)
+        )
+        touched = set(result.scalars().all())
+        await self.session.commit()
+        return touched
+
+    async def get_snapshot(self, snapshot_hash: str) -> HtmlSnapshot:
+        result = await self.session.execute(
+            select(HtmlSnapshot).where(HtmlSnapshot.hash == snapshot_hash)
+        )
+        snapshot = result.scalar_one_or_none()
+        if snapshot is None:
+            raise HTTPException(status_code=404, detail="HTML snapshot not found")
+        return snapshot
+
+    async def get_snapshot_contents(self, hashes: List[str]) -> Dict[str, bytes]:
+        if not hashes:
+            return {}
+        result = await self.session.execute(
+            select(HtmlSnapshot.hash, HtmlSnapshot.content).where(
+                HtmlSnapshot.hash.in_(hashes)
+            )
+        )
+        return {row.hash: row.content for row in result}
+
+    async def get_stats(self) -> HtmlSnapshotStats:
+        result = await self.session.execute(
+            select(
+                func.count(HtmlSnapshot.hash),
+                func.coalesce(func.sum(HtmlSnapshot.size_bytes), 0),
+                func.coalesce(func.sum(HtmlSnapshot.compressed_size_bytes), 0),
+                func.min(HtmlSnapshot.last_seen_at),
+            )
+        )
+        snapshots, size_bytes, compressed_size_bytes, oldest_seen_at = result.one()
+        return HtmlSnapshotStats(
+            snapshots=snapshots,
+            size_bytes=size_bytes,
+            compressed_size_bytes=compressed_size_bytes,
+            oldest_seen_at=oldest_seen_at,
+        )
+
+    async def delete_expired_snapshots(self, seen_before: datetime) -> int:
+        # scraped_cars.snapshot_hash is set to NULL by the foreign key
+        result = await self.session.execute(
+            delete(HtmlSnapshot).where(HtmlSnapshot.last_seen_at < seen_before)
+        )
+        await self.session.commit()
+        return result.rowcount
+
+    async def fetch_scraped_cars_with_snapshots(
+        self, criteria: HtmlSnapshotReparseRequest, after_id: int, limit: int
+    ) -> List[ScrapedCar]:
+        stmt = (
+            select(ScrapedCar)
+            .where(ScrapedCar.snapshot_hash.is_not(None), ScrapedCar.id > after_id)
+            .order_by(ScrapedCar.id)
+            .limit(limit)
+        )
+        if criteria.car_platform_id is not None:
+            stmt = stmt.where(ScrapedCar.car_platform_id == criteria.car_platform_id)
+        if criteria.request_id is not None:
+            stmt = stmt.where(ScrapedCar.request_id == criteria.request_id)
+        if criteria.scraped_from is not None:
+            stmt = stmt.where(ScrapedCar.scraped_at >= criteria.scraped_from)
+        if criteria.scraped_to is not None:
+            stmt = stmt.where(ScrapedCar.scraped_at <= criteria.scraped_to)
+        result = await self.session.execute(stmt)
+        return list(result.scalars().all())
+
+    async def update_scraped_cars(self, rows: List[dict]) -> None:
+        # Bulk UPDATE by primary key, one executemany round trip
+        if not rows:
+            return
+        await self.session.execute(update(ScrapedCar), rows)
+        await self.session.commit()
+
+
+HtmlSnapshotRepositoryDependency = Annotated[
+    HtmlSnapshotRepository, Depends(HtmlSnapshotRepository)
+]
@@ -0,0 +1,47 @@
+from fastapi import Depends, HTTPException
+from db import SessionContext
+from typing import Annotated, Optional
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from models.platform_storage_state import PlatformStorageState
+
+
+class PlatformStorageStateRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def get_storage_state(
+        self, car_platform_id: int
+    ) -> Optional[PlatformStorageState]:
+        result = await self.session.execute(
+            select(PlatformStorageState).where(
+                PlatformStorageState.car_platform_id == car_platform_id
+            )
+        )
+        return result.scalar_one_or_none()
+
+    async def save_storage_state(self, car_platform_id: int, storage_state: dict) -> None:
+        stmt = insert(PlatformStorageState).values(
+            car_platform_id=car_platform_id, storage_state=storage_state
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[PlatformStorageState.car_platform_id],
+            set_={"storage_state": storage_state, "saved_at": func.now()},
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def delete_storage_state(self, car_platform_id: int) -> None:
+        result = await self.session.execute(
+            delete(PlatformStorageState).where(
+                PlatformStorageState.car_platform_id == car_platform_id
+            )
+        )
+        if result.rowcount == 0:
+            raise HTTPException(status_code=404, detail="Storage state not found")
+        await self.session.commit()
+
+
+PlatformStorageStateRepositoryDependency = Annotated[
+    PlatformStorageStateRepository, Depends(PlatformStorageStateRepository)
+]
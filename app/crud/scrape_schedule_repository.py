@@ -0,0 +1,150 @@
+import random
+from fastapi import Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
+from typing import Annotated, List, Optional
+from datetime import datetime, timedelta, timezone
+from db import SessionContext
+from common.app_settings import settings
+from models.car import Car
+from models.scrape_schedule import ScrapeSchedule
+from schemas.scrape_schedule_schema import ScrapeScheduleCreateUpdate
+
+
+def first_run_time(interval_minutes: int) -> datetime:
+    # New schedules start at a random point of their first interval, so adding
+    # many at once does not make them all due together
+    return datetime.now(timezone.utc) + timedelta(
+        minutes=random.uniform(0, interval_minutes)
+    )
+
+
+def next_run_time(last_run_at: datetime, interval_minutes: int) -> datetime:
+    jitter = random.uniform(
+        -settings.SCRAPE_SCHEDULE_JITTER_RATIO, settings.SCRAPE_SCHEDULE_JITTER_RATIO
+    )
+    return last_run_at + timedelta(minutes=interval_minutes * (1 + jitter))
+
+
+class ScrapeScheduleRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    async def create_schedule(self, schedule: ScrapeScheduleCreateUpdate) -> ScrapeSchedule:
+        try:
+            new_schedule = ScrapeSchedule(
+                **schedule.model_dump(),
+                next_run_at=first_run_time(schedule.interval_minutes),
+            )
+            self.session.add(new_schedule)
+            await self.session.commit()
+            await self.session.refresh(new_schedule)
+            return new_schedule
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise HTTPException(status_code=400, detail=str(e.orig))
+
+    async def get_all_schedules(self) -> List[ScrapeSchedule]:
+        response = await self.session.execute(
+            select(ScrapeSchedule).order_by(ScrapeSchedule.next_run_at)
+        )
+        return list(response.scalars())
+
+    async def get_schedule_by_id(self, schedule_id: int) -> ScrapeSchedule:
+        response = await self.session.execute(
+            select(ScrapeSchedule).where(ScrapeSchedule.id == schedule_id)
+        )
+        schedule = response.scalar_one_or_none()
+
+        if not schedule:
+            raise HTTPException(status_code=404, detail="Scrape schedule not found")
+
+        return schedule
+
+    async def update_schedule(
+        self, schedule_id: int, schedule: ScrapeScheduleCreateUpdate
+    ) -> ScrapeSchedule:
+        existing_schedule = await self.get_schedule_by_id(schedule_id)
+        try:
+            if schedule.interval_minutes != existing_schedule.interval_minutes:
+                existing_schedule.next_run_at = next_run_time(
+                    existing_schedule.last_run_at or datetime.now(timezone.utc),
+                    schedule.interval_minutes,
+                )
+            for key, value in schedule.model_dump().items():
+                setattr(existing_schedule, key, value)
+
+            await self.session.commit()
+            await self.session.refresh(existing_schedule)
+            return existing_schedule
+
+        except IntegrityError as e:
+            await self.session.rollback()
+            raise HTTPException(status_code=400, detail=str(e.orig))
+
+    async def run_schedule_now(self, schedule_id: int) -> ScrapeSchedule:
+        schedule = await self.get_schedule_by_id(schedule_id)
+        schedule.next_run_at = datetime.now(timezone.utc)
+        await self.session.commit()
+        await self.session.refresh(schedule)
+        return schedule
+
+    async def delete_schedule(self, schedule_id: int) -> None:
+        schedule = await self.get_schedule_by_id(schedule_id)
+        await self.session.delete(schedule)
+        await self.session.commit()
+
+    async def add_missing_schedules(self, interval_minutes: int) -> int:
+        scheduled_car_ids = select(ScrapeSchedule.car_id)
+        response = await self.session.execute(
+            select(Car.id).where(Car.id.not_in(scheduled_car_ids))
+        )
+        car_ids = list(response.scalars())
+        for car_id in car_ids:
+            self.session.add(
+                ScrapeSchedule(
+                    car_id=car_id,
+                    car_platform_ids=[],
+                    interval_minutes=interval_minutes,
+                    next_run_at=first_run_time(interval_minutes),
+                )
+            )
+        try:
+            await self.session.commit()
+        except IntegrityError:
+            # Another scheduler instance added them first
+            await self.session.rollback()
+            return 0
+        return len(car_ids)
+
+    async def claim_due_schedules(self, limit: int) -> List[ScrapeSchedule]:
+        # Rows stay locked until release_claims(), so several app instances never
+        # pick up the same run; only runs passed to advance_schedule() move on
+        response = await self.session.execute(
+            select(ScrapeSchedule)
+            .where(
+                ScrapeSchedule.enabled,
+                ScrapeSchedule.next_run_at <= datetime.now(timezone.utc),
+            )
+            .order_by(ScrapeSchedule.next_run_at)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+        )
+        return list(response.scalars())
+
+    def advance_schedule(
+        self, schedule: ScrapeSchedule, run_at: datetime, job_id: Optional[str] = None
+    ) -> None:
+        schedule.last_run_at = run_at
+        schedule.next_run_at = next_run_time(run_at, schedule.interval_minutes)
+        if job_id is not None:
+            schedule.last_job_id = job_id
+
+    async def release_claims(self) -> None:
+        await self.session.commit()
+
+
+ScrapeScheduleRepositoryDependency = Annotated[
+    ScrapeScheduleRepository, Depends(ScrapeScheduleRepository)
+]
@@ -1,14 +1,17 @@
 from fastapi import Depends, HTTPException
 from db import SessionContext
-from typing import Annotated, List
+from typing import Annotated, Dict, List
+from datetime import datetime
 from sqlalchemy import select, insert, delete
 from schemas.scraped_car_schema import (
     ScrapedCarCreate,
     ScrapedRequestCreate,
     ScrapedCarQuery,
+    ScrapingStatus,
 )
 from models.scraped_car import ScrapedCar
 from models.scrape_request import ScrapeRequest
+from models.scrape_stage_timing import ScrapeStageTiming
 
 
 class ScrapingRepository:
@@ -32,6 +35,35 @@ class ScrapingRepository:
         await self.session.commit()
         return result.scalar_one()
 
+    async def add_scraped_cars(self, cars_data: List[ScrapedCarCreate]) -> None:
+        # executemany: asyncpg batches the rows into multi-row INSERTs, one commit
+        if not cars_data:
+            return
+        await self.session.execute(
+            insert(ScrapedCar), [car_data.model_dump() for car_data in cars_data]
+        )
+        await self.session.commit()
+
+    async def get_recent_listings(
+        self, car_platform_id: int, canonical_urls: List[str], loaded_after: datetime
+    ) -> Dict[str, ScrapedCar]:
+        # Latest successful row per canonical URL (DISTINCT ON)
+        if not canonical_urls:
+            return {}
+        stmt = (
+            select(ScrapedCar)
+            .distinct(ScrapedCar.canonical_url)
+            .where(
+                ScrapedCar.car_platform_id == car_platform_id,
+                ScrapedCar.canonical_url.in_(canonical_urls),
+                ScrapedCar.details_scraped_at >= loaded_after,
+                ScrapedCar.status == ScrapingStatus.SUCCESS,
+            )
+            .order_by(ScrapedCar.canonical_url, ScrapedCar.details_scraped_at.desc())
+        )
+        result = await self.session.execute(stmt)
+        return {car.canonical_url: car for car in result.scalars().all()}
+
     async def fetch_scraped_cars(
         self,
         car_search_criteria: ScrapedCarQuery = ScrapedCarQuery(),
@@ -96,6 +128,39 @@ class ScrapingRepository:
             raise HTTPException(status_code=404, detail="Scrape request not found")
         return req
 
+    async def add_stage_timings(
+        self,
+        request_id: int,
+        car_platform_id: int,
+        seconds: Dict[str, float],
+        counts: Dict[str, int],
+    ) -> None:
+        if not seconds:
+            return
+        await self.session.execute(
+            insert(ScrapeStageTiming),
+            [
+                {
+                    "request_id": request_id,
+                    "car_platform_id": car_platform_id,
+                    "stage": stage,
+                    "seconds": stage_seconds,
+                    "count": counts[stage],
+                }
+                for stage, stage_seconds in seconds.items()
+            ],
+        )
+        await self.session.commit()
+
+    async def fetch_stage_timings(self, req_id: int) -> List[ScrapeStageTiming]:
+        await self.fetch_scrape_request(req_id)
+        result = await self.session.execute(
+            select(ScrapeStageTiming)
+            .where(ScrapeStageTiming.request_id == req_id)
+            .order_by(ScrapeStageTiming.car_platform_id, ScrapeStageTiming.id)
+        )
+        return list(result.scalars().all())
+
     async def delete_scrape_request(self, req_id: int) -> None:
         try:
             stmt = delete(ScrapeRequest).where(ScrapeRequest.id == req_id)
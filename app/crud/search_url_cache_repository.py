@@ -0,0 +1,70 @@
+from fastapi import Depends
+from db import SessionContext
+from typing import Annotated, Optional
+from datetime import datetime, timedelta, timezone
+from sqlalchemy import select, delete, func
+from sqlalchemy.dialects.postgresql import insert
+from models.search_url_cache import SearchUrlCache
+from schemas.scraped_car_schema import ScrapingConfigByQuery
+
+
+class SearchUrlCacheRepository:
+    def __init__(self, session: SessionContext):
+        self.session = session
+
+    @staticmethod
+    def _key(car_platform_id: int, config: ScrapingConfigByQuery):
+        return (
+            SearchUrlCache.car_platform_id == car_platform_id,
+            SearchUrlCache.brand == config.brand.strip().lower(),
+            SearchUrlCache.model == config.model.strip().lower(),
+            SearchUrlCache.year_from == config.year_from,
+            SearchUrlCache.year_to == config.year_to,
+        )
+
+    async def get_search_url(
+        self, car_platform_id: int, config: ScrapingConfigByQuery, ttl: timedelta
+    ) -> Optional[str]:
+        stmt = select(SearchUrlCache.search_url).where(
+            *self._key(car_platform_id, config),
+            SearchUrlCache.resolved_at >= datetime.now(timezone.utc) - ttl,
+        )
+        result = await self.session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    async def save_search_url(
+        self, car_platform_id: int, config: ScrapingConfigByQuery, search_url: str
+    ) -> None:
+        stmt = insert(SearchUrlCache).values(
+            car_platform_id=car_platform_id,
+            brand=config.brand.strip().lower(),
+            model=config.model.strip().lower(),
+            year_from=config.year_from,
+            year_to=config.year_to,
+            search_url=search_url,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[
+                SearchUrlCache.car_platform_id,
+                SearchUrlCache.brand,
+                SearchUrlCache.model,
+                SearchUrlCache.year_from,
+                SearchUrlCache.year_to,
+            ],
+            set_={"search_url": search_url, "resolved_at": func.now()},
+        )
+        await self.session.execute(stmt)
+        await self.session.commit()
+
+    async def delete_search_url(
+        self, car_platform_id: int, config: ScrapingConfigByQuery
+    ) -> None:
+        await self.session.execute(
+            delete(SearchUrlCache).where(*self._key(car_platform_id, config))
+        )
+        await self.session.commit()
+
+
+SearchUrlCacheRepositoryDependency = Annotated[
+    SearchUrlCacheRepository, Depends(SearchUrlCacheRepository)
+]
@@ -5,7 +5,13 @@ from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, Asyn
 
 from common.app_settings import settings
 
-engine = create_async_engine(settings.DB_CONNECTION_STRING, connect_args={})
+engine = create_async_engine(
+    settings.DB_CONNECTION_STRING,
+    connect_args={},
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_pre_ping=True,
+)
 
 SessionLocal = async_sessionmaker(
     autoflush=False, autocommit=False, bind=engine, expire_on_commit=False
@@ -1,3 +1,4 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
@@ -5,9 +6,40 @@ from controllers.car_platform_controller import car_platform_router
 from controllers.scraping_controller import scraping_router
 from controllers.car_model_controller import car_model_router
 from controllers.regression_controller import regression_router
+from controllers.scrape_schedule_controller import scrape_schedule_router
+from controllers.html_snapshot_controller import html_snapshot_router
+from services.browser_pool import browser_pool
+from services.http_client import http_client
+from services.scrape_job_service import scrape_job_manager
+from services.scraping_worker import scraping_worker_pool
+from services.scrape_scheduler import scrape_scheduler
+from services.scraped_car_writer import scraped_car_writer
+from services.html_snapshot_pruner import html_snapshot_pruner
 
 
-app = FastAPI(title="Car Ranking and Price Analysis")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await browser_pool.start()
+    await http_client.start()
+    await scraped_car_writer.start()
+    await scraping_worker_pool.start()
+    await scrape_job_manager.start()
+    await scrape_scheduler.start()
+    await html_snapshot_pruner.start()
+    try:
+        yield
+    finally:
+        await html_snapshot_pruner.stop()
+        await scrape_scheduler.stop()
+        await scrape_job_manager.stop()
+        await scraping_worker_pool.stop()
+        # After every producer has stopped, so all queued rows are written
+        await scraped_car_writer.stop()
+        await http_client.stop()
+        await browser_pool.stop()
+
+
+app = FastAPI(title="Car Ranking and Price Analysis", lifespan=lifespan)
 
 app.add_middleware(
     CORSMiddleware,
@@ -25,6 +57,10 @@ app.include_router(car_model_router)
 
 app.include_router(regression_router)
 
+app.include_router(scrape_schedule_router)
+
+app.include_router(html_snapshot_router)
+
 @app.get("/", include_in_schema=False)
 def redirect_to_docs():
     return RedirectResponse(url="/docs")
\ No newline at end of file
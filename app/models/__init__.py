@@ -4,6 +4,12 @@ from models.car_platform import CarPlatform
 from models.scraped_car import ScrapedCar
 from models.scrape_request import ScrapeRequest
 from .regression_model import RegressionModel
+from models.search_url_cache import SearchUrlCache
+from models.dropdown_option import DropdownOption
+from models.scrape_schedule import ScrapeSchedule
+from models.platform_storage_state import PlatformStorageState
+from models.scrape_stage_timing import ScrapeStageTiming
+from models.html_snapshot import HtmlSnapshot
 
 __all__ = [
     "Base",
@@ -12,4 +18,10 @@ __all__ = [
     "ScrapedCar",
     "ScrapeRequest",
     "RegressionModel",
+    "SearchUrlCache",
+    "DropdownOption",
+    "ScrapeSchedule",
+    "PlatformStorageState",
+    "ScrapeStageTiming",
+    "HtmlSnapshot",
 ]
@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, DateTime
+from sqlalchemy import Boolean, Integer, String, DateTime, JSON
 from sqlalchemy.sql import func
 from sqlalchemy.orm import mapped_column, Mapped
 from models.base import Base
@@ -37,6 +37,38 @@ class CarPlatform(Base):
     mileage_bs4_selector: Mapped[str] = mapped_column(String)
     views_bs4_selector: Mapped[str] = mapped_column(String)
 
+    # Number of detail pages scraped concurrently within one browser context
+    detail_pages_concurrency: Mapped[int] = mapped_column(Integer, server_default="4")
+
+    # Network requests aborted while scraping (playwright resource types, URL regexes)
+    blocked_resource_types: Mapped[list] = mapped_column(
+        JSON, server_default='["image", "media", "font"]'
+    )
+    blocked_url_patterns: Mapped[list] = mapped_column(JSON, server_default="[]")
+
+    # Upper bound for condition waits (network idle, lazy content) and per-scrape deadline
+    max_wait_ms: Mapped[int] = mapped_column(Integer, server_default="5000")
+    scrape_timeout_seconds: Mapped[int] = mapped_column(Integer, server_default="180")
+
+    # "browser" loads detail pages in playwright, "http" fetches server-rendered HTML
+    render_mode: Mapped[str] = mapped_column(String, server_default="browser")
+
+    # Pagination of search results: a "next" control or a URL template with
+    # {url} (first results page) and {page} (1-based page number) placeholders
+    next_page_selector: Mapped[str] = mapped_column(String, nullable=True)
+    page_url_template: Mapped[str] = mapped_column(String, nullable=True)
+    max_result_pages: Mapped[int] = mapped_column(Integer, server_default="10")
+
+    # Upper bounds for the adaptive limiter: concurrent scrapes and scrapes started per minute
+    max_concurrency: Mapped[int] = mapped_column(Integer, server_default="4")
+    requests_per_minute: Mapped[int] = mapped_column(Integer, server_default="30")
+
+    # With a saved storage state (consent already given) the close_selector
+    # popup waits around every form field are skipped
+    skip_popups_with_storage_state: Mapped[bool] = mapped_column(
+        Boolean, server_default="false"
+    )
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
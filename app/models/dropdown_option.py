@@ -0,0 +1,29 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, Index
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+from sqlalchemy.sql import func
+
+
+class DropdownOption(Base):
+    __tablename__ = "dropdown_options"
+    __table_args__ = (
+        Index(
+            "ix_dropdown_options_lookup", "car_platform_id", "field", "parent_value"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    car_platform_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("car_platforms.id", ondelete="CASCADE")
+    )
+    # "brand" or "model"; model options are indexed per normalized brand
+    field: Mapped[str] = mapped_column(String(20))
+    parent_value: Mapped[str] = mapped_column(String, server_default="")
+    position: Mapped[int] = mapped_column(Integer)
+    value: Mapped[str] = mapped_column(String)
+    text: Mapped[str] = mapped_column(String)
+    normalized_text: Mapped[str] = mapped_column(String)
+    harvested_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,22 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, LargeBinary
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+from sqlalchemy.sql import func
+
+
+class HtmlSnapshot(Base):
+    __tablename__ = "html_snapshots"
+
+    # sha256 of the uncompressed HTML, so identical pages are stored once
+    hash: Mapped[str] = mapped_column(String(64), primary_key=True)
+    content: Mapped[bytes] = mapped_column(LargeBinary)
+    size_bytes: Mapped[int] = mapped_column(Integer)
+    compressed_size_bytes: Mapped[int] = mapped_column(Integer)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    last_seen_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), index=True
+    )
@@ -0,0 +1,18 @@
+from datetime import datetime
+from sqlalchemy import Integer, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+from sqlalchemy.sql import func
+
+
+class PlatformStorageState(Base):
+    __tablename__ = "platform_storage_states"
+
+    car_platform_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("car_platforms.id", ondelete="CASCADE"), primary_key=True
+    )
+    # Playwright storage state (cookies and localStorage origins) of the platform's site
+    storage_state: Mapped[dict] = mapped_column(JSON)
+    saved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,31 @@
+from datetime import datetime
+from sqlalchemy import Boolean, Integer, String, DateTime, ForeignKey, JSON
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+from sqlalchemy.sql import func
+
+
+class ScrapeSchedule(Base):
+    __tablename__ = "scrape_schedules"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    car_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("cars.id", ondelete="CASCADE"), unique=True
+    )
+    # Empty list scrapes every car platform
+    car_platform_ids: Mapped[list] = mapped_column(JSON, server_default="[]")
+    interval_minutes: Mapped[int] = mapped_column(Integer)
+    max_listings: Mapped[int] = mapped_column(Integer, server_default="10")
+    headless: Mapped[bool] = mapped_column(Boolean, server_default="true")
+    enabled: Mapped[bool] = mapped_column(Boolean, server_default="true")
+
+    last_run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
+    next_run_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), index=True)
+    last_job_id: Mapped[str] = mapped_column(String, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+    )
@@ -0,0 +1,20 @@
+from sqlalchemy import Integer, String, Float, ForeignKey
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+
+
+class ScrapeStageTiming(Base):
+    __tablename__ = "scrape_stage_timings"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    request_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("scrape_requests.id", ondelete="CASCADE"), index=True
+    )
+    car_platform_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("car_platforms.id", ondelete="CASCADE")
+    )
+    # Total seconds spent in the stage during one platform scrape and how many
+    # times it ran (e.g. once per detail page)
+    stage: Mapped[str] = mapped_column(String)
+    seconds: Mapped[float] = mapped_column(Float)
+    count: Mapped[int] = mapped_column(Integer)
@@ -1,11 +1,20 @@
 from datetime import datetime
-from sqlalchemy import Integer, String, DateTime, Text, ForeignKey
+from sqlalchemy import Integer, String, DateTime, Text, ForeignKey, Index
 from sqlalchemy.orm import mapped_column, Mapped
 from models.base import Base
 from sqlalchemy.sql import func
 
 class ScrapedCar(Base):
     __tablename__ = "scraped_cars"
+    __table_args__ = (
+        # Recent-listing lookups by platform and canonical URL
+        Index(
+            "ix_scraped_cars_platform_canonical_url",
+            "car_platform_id",
+            "canonical_url",
+            "details_scraped_at",
+        ),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     car_platform_id: Mapped[int] = mapped_column(
@@ -19,6 +28,7 @@ class ScrapedCar(Base):
     )
 
     scraped_url: Mapped[str] = mapped_column(String, nullable=True)
+    canonical_url: Mapped[str] = mapped_column(String, nullable=True)
     search_position: Mapped[int] = mapped_column(Integer, nullable=True)
     scraped_year: Mapped[int] = mapped_column(Integer, nullable=True)
     scraped_price: Mapped[int] = mapped_column(Integer, nullable=True)
@@ -29,5 +39,14 @@ class ScrapedCar(Base):
 
     status: Mapped[str] = mapped_column(String)
     error_message: Mapped[str] = mapped_column(Text, nullable=True)
+    snapshot_hash: Mapped[str] = mapped_column(
+        String(64),
+        ForeignKey("html_snapshots.hash", ondelete="SET NULL"),
+        nullable=True,
+        index=True,
+    )
 
-    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
\ No newline at end of file
+    scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    # When the detail page was last actually loaded; reused rows keep the
+    # original time so a listing cannot stay fresh forever
+    details_scraped_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=True)
\ No newline at end of file
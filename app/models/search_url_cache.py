@@ -0,0 +1,28 @@
+from datetime import datetime
+from sqlalchemy import Integer, String, DateTime, ForeignKey, UniqueConstraint
+from sqlalchemy.orm import mapped_column, Mapped
+from models.base import Base
+from sqlalchemy.sql import func
+
+
+class SearchUrlCache(Base):
+    __tablename__ = "search_url_cache"
+    __table_args__ = (
+        UniqueConstraint(
+            "car_platform_id", "brand", "model", "year_from", "year_to"
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    car_platform_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("car_platforms.id", ondelete="CASCADE")
+    )
+    # Brand and model are stored lowercased so lookups ignore input casing
+    brand: Mapped[str] = mapped_column(String)
+    model: Mapped[str] = mapped_column(String)
+    year_from: Mapped[int] = mapped_column(Integer)
+    year_to: Mapped[int] = mapped_column(Integer)
+    search_url: Mapped[str] = mapped_column(String)
+    resolved_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
@@ -0,0 +1,24 @@
+from pydantic import BaseModel
+from typing import List
+
+
+class BrowserStatus(BaseModel):
+    headless: bool
+    connected: bool
+
+
+class BrowserPoolStats(BaseModel):
+    running: bool
+    healthy: bool
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    context_max_pages: int
+    leases_total: int
+    lease_timeouts: int
+    avg_lease_wait_seconds: float
+    max_lease_wait_seconds: float
+    contexts_recycled: int
+    browser_restarts: int
+    browsers: List[BrowserStatus]
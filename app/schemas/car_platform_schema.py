@@ -1,7 +1,24 @@
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, Field, field_validator
+from typing import List, Literal, Optional
+import re
 from datetime import datetime
 
+BlockableResourceType = Literal[
+    "stylesheet",
+    "image",
+    "media",
+    "font",
+    "script",
+    "texttrack",
+    "xhr",
+    "fetch",
+    "eventsource",
+    "websocket",
+    "manifest",
+    "other",
+]
+
+
 class CarPlatformCreateUpdate(BaseModel):
     name: str = Field(..., max_length=100, min_length=3)
     base_search_url: str
@@ -21,6 +38,30 @@ class CarPlatformCreateUpdate(BaseModel):
     price_bs4_selector: str
     mileage_bs4_selector: str
     views_bs4_selector: str
+    detail_pages_concurrency: int = Field(default=4, ge=1, le=16)
+    blocked_resource_types: List[BlockableResourceType] = ["image", "media", "font"]
+    blocked_url_patterns: List[str] = []
+    max_wait_ms: int = Field(default=5000, ge=100, le=60000)
+    scrape_timeout_seconds: int = Field(default=180, ge=10, le=1800)
+    render_mode: Literal["browser", "http"] = "browser"
+    next_page_selector: Optional[str] = None
+    page_url_template: Optional[str] = Field(
+        default=None, description="Uses {url} and {page}, e.g. {url}&page={page}"
+    )
+    max_result_pages: int = Field(default=10, ge=1, le=100)
+    max_concurrency: int = Field(default=4, ge=1, le=32)
+    requests_per_minute: int = Field(default=30, ge=1, le=600)
+    skip_popups_with_storage_state: bool = False
+
+    @field_validator("blocked_url_patterns")
+    @classmethod
+    def validate_url_patterns(cls, patterns: List[str]) -> List[str]:
+        for pattern in patterns:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid URL pattern '{pattern}': {e}")
+        return patterns
 
 
 class CarPlatformResponse(CarPlatformCreateUpdate):
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+from typing import Optional
+from datetime import datetime
+from enum import Enum
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreakerStats(BaseModel):
+    car_platform_id: int
+    car_platform_name: str
+    state: CircuitState
+    consecutive_failures: int
+    failure_threshold: int
+    last_failure_status: Optional[str] = None
+    opened_at: Optional[datetime] = None
+    retry_at: Optional[datetime] = None
+    short_circuited: int
@@ -0,0 +1,22 @@
+from pydantic import BaseModel
+
+
+def normalize_option_text(text: str) -> str:
+    return " ".join(text.lower().split())
+
+
+class DropdownOptionItem(BaseModel):
+    value: str
+    text: str
+    normalized_text: str
+
+    class Config:
+        from_attributes = True
+
+    @classmethod
+    def from_text(cls, text: str, value: str | None = None) -> "DropdownOptionItem":
+        return cls(
+            value=text if value is None else value,
+            text=text,
+            normalized_text=normalize_option_text(text),
+        )
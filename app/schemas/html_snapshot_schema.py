@@ -0,0 +1,38 @@
+from pydantic import BaseModel, Field
+from typing import Optional
+from datetime import datetime
+
+
+class HtmlSnapshotCreate(BaseModel):
+    hash: str
+    content: bytes
+    size_bytes: int
+    compressed_size_bytes: int
+
+
+class HtmlSnapshotStats(BaseModel):
+    snapshots: int
+    size_bytes: int
+    compressed_size_bytes: int
+    oldest_seen_at: Optional[datetime] = None
+
+
+class HtmlSnapshotPruneResult(BaseModel):
+    deleted_snapshots: int
+
+
+class HtmlSnapshotReparseRequest(BaseModel):
+    car_platform_id: Optional[int] = None
+    request_id: Optional[int] = None
+    scraped_from: Optional[datetime] = Field(default=None, description="Date must be before scraped_to")
+    scraped_to: Optional[datetime] = Field(default=None, description="Date must be after scraped_from")
+
+
+class HtmlSnapshotReparseResult(BaseModel):
+    scraped_cars_checked: int
+    snapshots_parsed: int
+    scraped_cars_updated: int
+    # Rows left untouched because year or price no longer parse
+    scraped_cars_unparseable: int
+    missing_snapshots: int
+    time_to_reparse_seconds: float
@@ -0,0 +1,17 @@
+from pydantic import BaseModel
+from typing import Optional
+
+
+class PlatformLimiterStats(BaseModel):
+    car_platform_id: int
+    car_platform_name: str
+    concurrency_limit: int
+    max_concurrency: int
+    in_flight: int
+    waiting: int
+    requests_per_minute: float
+    max_requests_per_minute: int
+    avg_scrape_seconds: Optional[float] = None
+    successes: int
+    failures: int
+    backoffs: int
@@ -0,0 +1,39 @@
+from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime
+from enum import Enum
+from schemas.scraped_car_schema import (
+    ScrapingResultSuccess,
+    ScrapingResultError,
+    ScrapeResultSummary,
+)
+
+
+class ScrapeJobKind(str, Enum):
+    QUERY = "query"
+    CAR_MODEL = "car_model"
+    CAR_MODELS = "car_models"
+
+
+class ScrapeJobStatus(str, Enum):
+    QUEUED = "queued"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class ScrapeJobResponse(BaseModel):
+    job_id: str
+    kind: ScrapeJobKind
+    status: ScrapeJobStatus
+    headless: bool
+    created_at: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    queue_position: Optional[int] = None
+    completed_scrapes: int
+    scrape_request_id: Optional[int] = None
+    results: List[ScrapingResultSuccess | ScrapingResultError]
+    summary: Optional[ScrapeResultSummary] = None
+    error_message: Optional[str] = None
@@ -0,0 +1,26 @@
+from pydantic import BaseModel, Field
+from typing import List, Optional
+from datetime import datetime
+
+
+class ScrapeScheduleCreateUpdate(BaseModel):
+    car_id: int
+    car_platform_ids: List[int] = Field(
+        default=[], description="Empty list scrapes every car platform"
+    )
+    interval_minutes: int = Field(default=360, ge=15, le=10080)
+    max_listings: int = Field(default=10, ge=1, le=500)
+    headless: bool = True
+    enabled: bool = True
+
+
+class ScrapeScheduleResponse(ScrapeScheduleCreateUpdate):
+    id: int
+    last_run_at: Optional[datetime] = None
+    next_run_at: datetime
+    last_job_id: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+    class Config:
+        from_attributes = True
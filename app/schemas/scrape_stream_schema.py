@@ -0,0 +1,12 @@
+from pydantic import BaseModel
+from enum import Enum
+
+
+class ScrapeStreamFormat(str, Enum):
+    SSE = "sse"
+    NDJSON = "ndjson"
+
+
+class ScrapeStreamError(BaseModel):
+    status_code: int
+    detail: str
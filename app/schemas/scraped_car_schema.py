@@ -1,7 +1,8 @@
 from pydantic import BaseModel, Field
-from typing import List, Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timezone
 from enum import Enum
+from schemas.dropdown_option_schema import DropdownOptionItem
 
 
 class ScrapingStatus(str, Enum):
@@ -10,6 +11,7 @@ class ScrapingStatus(str, Enum):
     INVALID_SELECTOR = "invalid_selector"
     SITE_UNAVAILABLE = "site_unavailable"
     ERROR_SCRAPING = "error_scraping"
+    CIRCUIT_OPEN = "circuit_open"
 
 
 class ScrapedCarCreate(BaseModel):
@@ -17,6 +19,7 @@ class ScrapedCarCreate(BaseModel):
     car_platform_id: int
     car_id: Optional[int] = None
     scraped_url: Optional[str] = None
+    canonical_url: Optional[str] = None
     search_position: Optional[int] = None
     scraped_year: Optional[int] = None
     scraped_price: Optional[int] = None
@@ -25,8 +28,10 @@ class ScrapedCarCreate(BaseModel):
     scraped_mileage_unit: Optional[str] = None
     scraped_number_of_views: Optional[int] = None
     scraped_at: Optional[datetime] = None
+    details_scraped_at: Optional[datetime] = None
     status: ScrapingStatus
     error_message: Optional[str]
+    snapshot_hash: Optional[str] = None
 
 
 class ScrapingConfigByQuery(BaseModel):
@@ -35,23 +40,30 @@ class ScrapingConfigByQuery(BaseModel):
     year_from: int = Field(..., ge=1985, le=datetime.now(timezone.utc).year)
     year_to: int = Field(..., ge=1985, le=datetime.now(timezone.utc).year)
     car_platform_ids: List[int]
+    max_listings: int = Field(default=10, ge=1, le=500)
 
 
 class ScrapingConfigByCarModel(BaseModel):
     car_id: int
     car_platform_ids: List[int]
+    max_listings: int = Field(default=10, ge=1, le=500)
 
 
 class ScrapingConfigByCarsModel(BaseModel):
     car_ids: List[int]
     car_platform_ids: List[int]
+    max_listings: int = Field(default=10, ge=1, le=500)
 
 
 class ScrapingResultSuccess(BaseModel):
     marketplace_name: str
     status: str = "success"
     cars_scraped: int
+    # Listings seen within LISTING_REUSE_TTL_HOURS whose details were not reloaded
+    cars_reused: int = 0
     time_to_scrape_platform: str
+    time_to_scrape_platform_seconds: float = 0.0
+    stage_timings: Dict[str, float] = {}
     car_id: Optional[int] = None
     scraped_at: datetime
 
@@ -60,6 +72,7 @@ class ScrapingResultError(BaseModel):
     marketplace_name: str
     status: str
     error_message: str
+    stage_timings: Dict[str, float] = {}
     car_id: Optional[int] = None
     scraped_at: datetime
 
@@ -117,6 +130,7 @@ class ScrapedRequestResponse(BaseModel):
     scraped_number_of_views: Optional[int] = None
     status: str
     error_message: Optional[str] = None
+    snapshot_hash: Optional[str] = None
     scraped_at: datetime
 
 
@@ -132,6 +146,7 @@ class ScrapeRequestResponse(BaseModel):
 
 class ScrapedCarItem(BaseModel):
     url: str
+    search_position: Optional[int] = None
     year: Optional[int] = None
     price: Optional[int] = None
     currency: Optional[str] = None
@@ -139,3 +154,16 @@ class ScrapedCarItem(BaseModel):
     mileage_unit: Optional[str] = None
     views: Optional[int] = None
     scraped_at: Optional[datetime] = None
+    # Detail page HTML kept for the snapshot store, never serialized
+    html: Optional[str] = Field(default=None, exclude=True, repr=False)
+    # Set when the fields were copied from a recent scrape of the same listing
+    reused: bool = Field(default=False, exclude=True)
+    details_scraped_at: Optional[datetime] = Field(default=None, exclude=True)
+    snapshot_hash: Optional[str] = Field(default=None, exclude=True)
+
+
+class CarDataScrapeResult(BaseModel):
+    cars: List[ScrapedCarItem]
+    search_url: Optional[str] = None
+    search_url_from_cache: bool = False
+    harvested_options: Dict[str, List[DropdownOptionItem]] = {}
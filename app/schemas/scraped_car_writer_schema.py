@@ -0,0 +1,13 @@
+from pydantic import BaseModel
+
+
+class ScrapedCarWriterStats(BaseModel):
+    running: bool
+    queue_size: int
+    pending: int
+    batch_size: int
+    rows_written: int
+    rows_dropped: int
+    dead_letter_path: str
+    batches_flushed: int
+    producers_blocked_total: int
@@ -0,0 +1,26 @@
+from pydantic import BaseModel
+from typing import List, Optional
+
+
+class StageTimingResponse(BaseModel):
+    car_platform_id: int
+    stage: str
+    seconds: float
+    count: int
+
+    class Config:
+        from_attributes = True
+
+
+class HistogramBucket(BaseModel):
+    # Upper bound in seconds, None for +Inf; counts are cumulative
+    le: Optional[float] = None
+    count: int
+
+
+class StageHistogram(BaseModel):
+    car_platform_name: str
+    stage: str
+    count: int
+    sum_seconds: float
+    buckets: List[HistogramBucket]
@@ -0,0 +1,195 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Dict, Optional
+from fastapi import HTTPException
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Playwright,
+)
+from common.app_settings import settings
+from schemas.browser_pool_schema import BrowserPoolStats, BrowserStatus
+from services.logger_service import logger
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/114.0"
+
+
+@dataclass
+class PooledContext:
+    slot_id: int
+    headless: bool = True
+    context: Optional[BrowserContext] = None
+    pages_opened: int = 0
+
+
+class BrowserPool:
+    def __init__(self, size: int, context_max_pages: int, lease_timeout: float):
+        self.size = size
+        self.context_max_pages = context_max_pages
+        self.lease_timeout = lease_timeout
+
+        self._playwright: Optional[Playwright] = None
+        self._browsers: Dict[bool, Browser] = {}
+        self._browser_lock = asyncio.Lock()
+        self._slots: asyncio.Queue[PooledContext] = asyncio.Queue()
+        self._started = False
+
+        self._waiting = 0
+        self._leases_total = 0
+        self._lease_timeouts = 0
+        self._lease_wait_total = 0.0
+        self._lease_wait_max = 0.0
+        self._contexts_recycled = 0
+        self._browser_restarts = 0
+
+    async def start(self) -> None:
+        if self._started:
+            return
+        self._playwright = await async_playwright().start()
+        self._slots = asyncio.Queue()
+        slots = [PooledContext(slot_id=i) for i in range(self.size)]
+        try:
+            for slot in slots:
+                await self._prepare(slot, headless=True)
+        except Exception as e:
+            logger.error(f"Failed to warm up browser pool: {str(e)}")
+        for slot in slots:
+            self._slots.put_nowait(slot)
+        self._started = True
+        logger.info(f"Browser pool started with {self.size} context(s)")
+
+    async def stop(self) -> None:
+        if not self._started:
+            return
+        self._started = False
+        while not self._slots.empty():
+            await self._close_context(self._slots.get_nowait())
+        for browser in self._browsers.values():
+            try:
+                await browser.close()
+            except Exception:
+                pass
+        self._browsers.clear()
+        if self._playwright:
+            await self._playwright.stop()
+            self._playwright = None
+        logger.info("Browser pool stopped")
+
+    async def _get_browser(self, headless: bool) -> Browser:
+        async with self._browser_lock:
+            browser = self._browsers.get(headless)
+            if browser is None or not browser.is_connected():
+                if browser is not None:
+                    self._browser_restarts += 1
+                    logger.warning("Browser disconnected, relaunching")
+                assert self._playwright is not None
+                browser = await self._playwright.chromium.launch(headless=headless)
+                self._browsers[headless] = browser
+            return browser
+
+    async def _close_context(self, slot: PooledContext) -> None:
+        if slot.context is not None:
+            try:
+                await slot.context.close()
+            except Exception:
+                pass
+        slot.context = None
+        slot.pages_opened = 0
+
+    def _is_healthy(self, slot: PooledContext, headless: bool) -> bool:
+        if slot.context is None or slot.headless != headless:
+            return False
+        browser = slot.context.browser
+        return browser is not None and browser.is_connected()
+
+    async def _prepare(self, slot: PooledContext, headless: bool) -> BrowserContext:
+        if slot.context is not None and (
+            slot.pages_opened >= self.context_max_pages
+            or not self._is_healthy(slot, headless)
+        ):
+            await self._close_context(slot)
+            self._contexts_recycled += 1
+
+        if slot.context is None:
+            browser = await self._get_browser(headless)
+            context = await browser.new_context(user_agent=USER_AGENT)
+
+            def count_page(_):
+                slot.pages_opened += 1
+
+            context.on("page", count_page)
+            slot.context = context
+            slot.headless = headless
+            slot.pages_opened = 0
+
+        return slot.context
+
+    @asynccontextmanager
+    async def lease(self, headless: bool = True) -> AsyncIterator[BrowserContext]:
+        if not self._started:
+            raise HTTPException(status_code=503, detail="Browser pool is not running")
+
+        start_time = time.perf_counter()
+        self._waiting += 1
+        try:
+            slot = await asyncio.wait_for(self._slots.get(), timeout=self.lease_timeout)
+        except asyncio.TimeoutError:
+            self._lease_timeouts += 1
+            raise HTTPException(
+                status_code=503,
+                detail=f"No browser context available after {self.lease_timeout:.0f} seconds",
+            )
+        finally:
+            self._waiting -= 1
+
+        wait_time = time.perf_counter() - start_time
+        self._leases_total += 1
+        self._lease_wait_total += wait_time
+        self._lease_wait_max = max(self._lease_wait_max, wait_time)
+
+        try:
+            context = await self._prepare(slot, headless)
+            yield context
+        finally:
+            if slot.context is not None:
+                for page in slot.context.pages:
+                    try:
+                        await page.close()
+                    except Exception:
+                        pass
+            self._slots.put_nowait(slot)
+
+    def stats(self) -> BrowserPoolStats:
+        idle = self._slots.qsize()
+        browsers = [
+            BrowserStatus(headless=headless, connected=browser.is_connected())
+            for headless, browser in self._browsers.items()
+        ]
+        return BrowserPoolStats(
+            running=self._started,
+            healthy=self._started and all(b.connected for b in browsers),
+            size=self.size,
+            idle=idle,
+            in_use=self.size - idle if self._started else 0,
+            waiting=self._waiting,
+            context_max_pages=self.context_max_pages,
+            leases_total=self._leases_total,
+            lease_timeouts=self._lease_timeouts,
+            avg_lease_wait_seconds=(
+                self._lease_wait_total / self._leases_total if self._leases_total else 0.0
+            ),
+            max_lease_wait_seconds=self._lease_wait_max,
+            contexts_recycled=self._contexts_recycled,
+            browser_restarts=self._browser_restarts,
+            browsers=browsers,
+        )
+
+
+browser_pool = BrowserPool(
+    size=settings.BROWSER_POOL_SIZE,
+    context_max_pages=settings.BROWSER_CONTEXT_MAX_PAGES,
+    lease_timeout=settings.BROWSER_LEASE_TIMEOUT_SECONDS,
+)
@@ -0,0 +1,144 @@
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional
+from common.app_settings import settings
+from schemas.circuit_breaker_schema import CircuitBreakerStats, CircuitState
+from schemas.scraped_car_schema import ScrapingStatus
+from services.logger_service import logger
+
+# Outcomes that point at an outage or a changed site rather than at the query
+BREAKING_STATUSES = (ScrapingStatus.SITE_UNAVAILABLE, ScrapingStatus.INVALID_SELECTOR)
+
+
+class CircuitBreaker:
+    def __init__(
+        self, car_platform_id: int, name: str, failure_threshold: int, reset_seconds: float
+    ):
+        self.car_platform_id = car_platform_id
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = timedelta(seconds=reset_seconds)
+
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.last_failure_status: Optional[ScrapingStatus] = None
+        self.opened_at: Optional[datetime] = None
+        self.short_circuited = 0
+        self._probe_started_at: Optional[datetime] = None
+
+    def allow(self) -> bool:
+        if self.state == CircuitState.CLOSED:
+            return True
+        if self.state == CircuitState.OPEN:
+            assert self.opened_at is not None
+            if datetime.now(timezone.utc) < self.opened_at + self.reset_timeout:
+                self.short_circuited += 1
+                return False
+            self.state = CircuitState.HALF_OPEN
+            logger.info(f"Circuit for {self.name} half-open, sending a probe scrape")
+        # Half-open: a single probe at a time, everything else fails fast. A probe
+        # that never reported back (e.g. a cancelled job) is replaced after the timeout
+        now = datetime.now(timezone.utc)
+        if self._probe_started_at and now < self._probe_started_at + self.reset_timeout:
+            self.short_circuited += 1
+            return False
+        self._probe_started_at = now
+        return True
+
+    def rejects(self) -> bool:
+        # Fail fast before queueing for a limiter slot; unlike allow() it never
+        # claims the half-open probe, allow() still decides once the slot is held
+        if (
+            self.state == CircuitState.OPEN
+            and self.opened_at is not None
+            and datetime.now(timezone.utc) < self.opened_at + self.reset_timeout
+        ):
+            self.short_circuited += 1
+            return True
+        return False
+
+    def record(self, status: ScrapingStatus) -> None:
+        self._probe_started_at = None
+        if status in BREAKING_STATUSES:
+            self.consecutive_failures += 1
+            self.last_failure_status = status
+            if (
+                self.state == CircuitState.HALF_OPEN
+                or self.consecutive_failures >= self.failure_threshold
+            ):
+                self._open()
+        elif status == ScrapingStatus.ERROR_SCRAPING:
+            # Inconclusive: neither counts towards opening nor closes a half-open circuit
+            pass
+        else:
+            if self.state != CircuitState.CLOSED:
+                logger.info(f"Circuit for {self.name} closed")
+            self.reset()
+
+    def _open(self) -> None:
+        if self.state != CircuitState.OPEN:
+            logger.warning(
+                f"Circuit for {self.name} opened after {self.consecutive_failures} "
+                f"consecutive failure(s), last: {self.last_failure_status}"
+            )
+        self.state = CircuitState.OPEN
+        self.opened_at = datetime.now(timezone.utc)
+
+    def reset(self) -> None:
+        self.state = CircuitState.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = None
+        self._probe_started_at = None
+
+    def stats(self) -> CircuitBreakerStats:
+        return CircuitBreakerStats(
+            car_platform_id=self.car_platform_id,
+            car_platform_name=self.name,
+            state=self.state,
+            consecutive_failures=self.consecutive_failures,
+            failure_threshold=self.failure_threshold,
+            last_failure_status=(
+                self.last_failure_status.value if self.last_failure_status else None
+            ),
+            opened_at=self.opened_at,
+            retry_at=(
+                self.opened_at + self.reset_timeout
+                if self.state == CircuitState.OPEN and self.opened_at
+                else None
+            ),
+            short_circuited=self.short_circuited,
+        )
+
+
+class CircuitBreakerRegistry:
+    def __init__(self, failure_threshold: int, reset_seconds: float):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._breakers: Dict[int, CircuitBreaker] = {}
+
+    def get(self, car_platform) -> CircuitBreaker:
+        breaker = self._breakers.get(car_platform.id)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                car_platform_id=car_platform.id,
+                name=car_platform.name,
+                failure_threshold=self.failure_threshold,
+                reset_seconds=self.reset_seconds,
+            )
+            self._breakers[car_platform.id] = breaker
+        breaker.name = car_platform.name
+        return breaker
+
+    def reset(self, car_platform_id: int) -> Optional[CircuitBreaker]:
+        breaker = self._breakers.get(car_platform_id)
+        if breaker is not None:
+            breaker.reset()
+        return breaker
+
+    def stats(self) -> List[CircuitBreakerStats]:
+        return [breaker.stats() for breaker in self._breakers.values()]
+
+
+circuit_breakers = CircuitBreakerRegistry(
+    failure_threshold=settings.CIRCUIT_BREAKER_FAILURE_THRESHOLD,
+    reset_seconds=settings.CIRCUIT_BREAKER_RESET_SECONDS,
+)
@@ -0,0 +1,143 @@
+from typing import Any, Dict, Optional, Protocol, Tuple
+from bs4 import BeautifulSoup
+import soupsieve
+from common.app_settings import settings
+from services.logger_service import logger
+
+
+class HtmlParserBackend(Protocol):
+    name: str
+
+    def parse(self, html: str) -> Any: ...
+
+    def compile(self, selector: str) -> Any: ...
+
+    def select_one(self, document: Any, compiled_selector: Any) -> Optional[Any]: ...
+
+
+class SoupParserBackend:
+    def __init__(self, features: str):
+        self.name = features
+        self.features = features
+        # Fail early if the tree builder (e.g. lxml) is not installed
+        BeautifulSoup("", features)
+
+    def parse(self, html: str) -> BeautifulSoup:
+        return BeautifulSoup(html, self.features)
+
+    def compile(self, selector: str) -> soupsieve.SoupSieve:
+        return soupsieve.compile(selector)
+
+    def select_one(self, document: BeautifulSoup, compiled_selector: soupsieve.SoupSieve):
+        return compiled_selector.select_one(document)
+
+
+# Gives selectolax nodes the part of the bs4 Tag interface used by CarDataParser
+class SelectolaxElement:
+    def __init__(self, node):
+        self.node = node
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.node.text(deep=True, separator=separator, strip=strip)
+
+    @property
+    def contents(self) -> list:
+        return list(self.node.iter(include_text=True))
+
+
+# Text and child count of an element extracted inside the browser page
+class TextElement:
+    def __init__(self, text: str, child_count: int):
+        self.text = text
+        self.child_count = child_count
+
+    @classmethod
+    def from_extracted(cls, extracted: Optional[dict]) -> Optional["TextElement"]:
+        if extracted is None:
+            return None
+        return cls(extracted["text"], extracted["childCount"])
+
+    def get_text(self, separator: str = "", strip: bool = False) -> str:
+        return self.text.strip() if strip else self.text
+
+    @property
+    def contents(self) -> list:
+        return [None] * self.child_count
+
+
+class SelectolaxParserBackend:
+    name = "selectolax"
+
+    def __init__(self):
+        from selectolax.lexbor import LexborHTMLParser
+
+        self._parser_class = LexborHTMLParser
+
+    def parse(self, html: str):
+        return self._parser_class(html)
+
+    def compile(self, selector: str) -> str:
+        return selector
+
+    def select_one(self, document, compiled_selector: str) -> Optional[SelectolaxElement]:
+        node = document.css_first(compiled_selector)
+        return SelectolaxElement(node) if node is not None else None
+
+
+class HtmlParser:
+    def __init__(self, backend: HtmlParserBackend):
+        self.backend = backend
+        self._compiled: Dict[str, Tuple[Any, ...]] = {}
+
+    @property
+    def name(self) -> str:
+        return self.backend.name
+
+    def parse(self, html: str) -> Any:
+        return self.backend.parse(html)
+
+    def compile(self, selectors: str) -> Tuple[Any, ...]:
+        # Platform selectors are comma-separated fallbacks, tried in order
+        compiled = self._compiled.get(selectors)
+        if compiled is None:
+            compiled = tuple(
+                self.backend.compile(selector.strip())
+                for selector in selectors.split(",")
+                if selector.strip()
+            )
+            self._compiled[selectors] = compiled
+        return compiled
+
+    def select_first(self, document: Any, selectors: str) -> Optional[Any]:
+        for compiled_selector in self.compile(selectors):
+            element = self.backend.select_one(document, compiled_selector)
+            if element is not None:
+                return element
+        return None
+
+
+def create_html_parser(backend_name: str) -> HtmlParser:
+    if backend_name == "selectolax":
+        return HtmlParser(SelectolaxParserBackend())
+    return HtmlParser(SoupParserBackend(backend_name))
+
+
+def get_available_backends() -> list[str]:
+    available = []
+    for backend_name in ("html.parser", "lxml", "selectolax"):
+        try:
+            create_html_parser(backend_name)
+            available.append(backend_name)
+        except Exception:
+            pass
+    return available
+
+
+try:
+    html_parser = create_html_parser(settings.HTML_PARSER_BACKEND)
+except Exception as e:
+    logger.warning(
+        f"HTML parser backend '{settings.HTML_PARSER_BACKEND}' is unavailable "
+        f"({str(e)}), falling back to html.parser"
+    )
+    html_parser = create_html_parser("html.parser")
@@ -0,0 +1,19 @@
+import hashlib
+import zlib
+from common.app_settings import settings
+from schemas.html_snapshot_schema import HtmlSnapshotCreate
+
+
+def compress_html(html: str) -> HtmlSnapshotCreate:
+    raw = html.encode("utf-8")
+    content = zlib.compress(raw, settings.HTML_SNAPSHOT_COMPRESSION_LEVEL)
+    return HtmlSnapshotCreate(
+        hash=hashlib.sha256(raw).hexdigest(),
+        content=content,
+        size_bytes=len(raw),
+        compressed_size_bytes=len(content),
+    )
+
+
+def decompress_html(content: bytes) -> str:
+    return zlib.decompress(content).decode("utf-8")
@@ -0,0 +1,55 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+from common.app_settings import settings
+from crud.html_snapshot_repository import HtmlSnapshotRepository
+from db import SessionLocal
+from services.logger_service import logger
+
+
+class HtmlSnapshotPruner:
+    def __init__(self, enabled: bool, interval_seconds: float, retention_days: int):
+        self.enabled = enabled
+        self.interval_seconds = interval_seconds
+        self.retention_days = retention_days
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(
+            f"HTML snapshot pruner started, pruning every {self.interval_seconds:.0f}s"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("HTML snapshot pruner stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.prune()
+            except Exception as e:
+                logger.error(f"HTML snapshot pruning failed: {str(e)}")
+            await asyncio.sleep(self.interval_seconds)
+
+    async def prune(self) -> int:
+        async with SessionLocal() as session:
+            deleted = await HtmlSnapshotRepository(session).delete_expired_snapshots(
+                datetime.now(timezone.utc) - timedelta(days=self.retention_days)
+            )
+        if deleted:
+            logger.info(f"Pruned {deleted} expired HTML snapshot(s)")
+        return deleted
+
+
+html_snapshot_pruner = HtmlSnapshotPruner(
+    enabled=settings.HTML_SNAPSHOTS_ENABLED,
+    interval_seconds=settings.HTML_SNAPSHOT_PRUNE_INTERVAL_HOURS * 3600,
+    retention_days=settings.HTML_SNAPSHOT_RETENTION_DAYS,
+)
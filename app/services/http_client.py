@@ -0,0 +1,53 @@
+from typing import Optional
+import httpx
+from common.app_settings import settings
+from services.browser_pool import USER_AGENT
+from services.logger_service import logger
+
+
+class ScrapingHttpClient:
+    def __init__(
+        self, max_connections: int, max_keepalive_connections: int, timeout: float
+    ):
+        self.max_connections = max_connections
+        self.max_keepalive_connections = max_keepalive_connections
+        self.timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+
+    async def start(self) -> None:
+        if self._client is not None:
+            return
+        self._client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            timeout=self.timeout,
+            limits=httpx.Limits(
+                max_connections=self.max_connections,
+                max_keepalive_connections=self.max_keepalive_connections,
+            ),
+            headers={
+                "User-Agent": USER_AGENT,
+                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+            },
+        )
+        logger.info("Scraping HTTP client started")
+
+    async def stop(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def fetch_html(self, url: str) -> str:
+        if self._client is None:
+            await self.start()
+        assert self._client is not None
+        response = await self._client.get(url)
+        response.raise_for_status()
+        return response.text
+
+
+http_client = ScrapingHttpClient(
+    max_connections=settings.HTTP_MAX_CONNECTIONS,
+    max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    timeout=settings.HTTP_TIMEOUT_SECONDS,
+)
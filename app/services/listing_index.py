@@ -0,0 +1,39 @@
+import re
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+# Query parameters that differ between visits to the same listing
+TRACKING_PARAM_PREFIXES = ("utm_", "gclid", "fbclid", "yclid", "_ga", "_gl")
+
+
+def canonicalize_url(url: str) -> str:
+    # Scheme, "www.", default ports, fragments, tracking parameters, parameter
+    # order and trailing slashes do not identify a listing
+    try:
+        parts = urlsplit(url.strip())
+        host = (parts.hostname or "").lower().removeprefix("www.")
+        port = parts.port
+    except ValueError:
+        return url.strip()
+    netloc = host if port in (None, 80, 443) else f"{host}:{port}"
+    path = parts.path.rstrip("/")
+    query = urlencode(
+        sorted(
+            (key, value)
+            for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if not key.lower().startswith(TRACKING_PARAM_PREFIXES)
+        )
+    )
+    return f"{netloc}{path}?{query}" if query else f"{netloc}{path}"
+
+
+def _compact(text: str) -> str:
+    return re.sub(r"[\W_]+", "", unquote(text).lower())
+
+
+def url_encodes_search(url: str, base_search_url: str, *values: str) -> bool:
+    # A results URL is only worth replaying when the filters live in it; sites
+    # that keep them in session state or a POST body return other listings
+    if canonicalize_url(url) == canonicalize_url(base_search_url):
+        return False
+    compact_url = _compact(url)
+    return all(_compact(value) in compact_url for value in values if _compact(value))
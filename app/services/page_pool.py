@@ -0,0 +1,76 @@
+import asyncio
+from typing import Awaitable, Callable, List, Optional, Sequence, TypeVar
+from playwright.async_api import BrowserContext, Page
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+# Bounded set of pages opened lazily in one browser context
+class PagePool:
+    def __init__(
+        self,
+        context: BrowserContext,
+        size: int,
+        setup_page: Optional[Callable[[Page], Awaitable[None]]] = None,
+    ):
+        self.context = context
+        self.size = max(1, size)
+        self.setup_page = setup_page
+        self._pages: List[Page] = []
+        self._idle: asyncio.Queue[Page] = asyncio.Queue()
+        self._reserved = 0
+
+    async def __aenter__(self) -> "PagePool":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _acquire(self) -> Page:
+        if self._idle.empty() and self._reserved < self.size:
+            self._reserved += 1
+            page = None
+            try:
+                page = await self.context.new_page()
+                if self.setup_page:
+                    await self.setup_page(page)
+            except Exception:
+                self._reserved -= 1
+                if page is not None:
+                    await page.close()
+                raise
+            self._pages.append(page)
+            return page
+        return await self._idle.get()
+
+    async def map(
+        self, func: Callable[[Page, T], Awaitable[R]], items: Sequence[T]
+    ) -> List[R]:
+        async def run(item: T) -> R:
+            page = await self._acquire()
+            try:
+                return await func(page, item)
+            finally:
+                self._idle.put_nowait(page)
+
+        # gather keeps results in the order of items
+        tasks = [asyncio.create_task(run(item)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            # Runs parked on an idle page may never be woken once page creation
+            # fails, so the siblings are cancelled rather than left pending
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+    async def close(self) -> None:
+        for page in self._pages:
+            try:
+                await page.close()
+            except Exception:
+                pass
+        self._pages.clear()
+        self._reserved = 0
@@ -0,0 +1,178 @@
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Dict, List, Optional
+from schemas.rate_limiter_schema import PlatformLimiterStats
+
+# A scrape taking longer than this share of the platform deadline counts as a slowdown
+SLOW_SCRAPE_RATIO = 0.5
+BACKOFF_FACTOR = 0.5
+MIN_REQUESTS_PER_MINUTE = 1.0
+
+
+# AIMD limiter for one car platform: every healthy scrape raises the concurrency
+# limit by about one per window of scrapes and the rate by a tenth of its cap,
+# a failure or slowdown halves both
+class PlatformLimiter:
+    def __init__(
+        self,
+        car_platform_id: int,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: int,
+        scrape_timeout_seconds: float,
+    ):
+        self.car_platform_id = car_platform_id
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_minute = requests_per_minute
+        self.scrape_timeout_seconds = scrape_timeout_seconds
+
+        # Start low and let successful scrapes open the platform up
+        self.limit = 1.0
+        self.rate = float(requests_per_minute)
+
+        self._condition: Optional[asyncio.Condition] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_flight = 0
+        self._waiting = 0
+        self._next_start = 0.0
+
+        self.avg_scrape_seconds: Optional[float] = None
+        self.successes = 0
+        self.failures = 0
+        self.backoffs = 0
+
+    def configure(
+        self,
+        name: str,
+        max_concurrency: int,
+        requests_per_minute: int,
+        scrape_timeout_seconds: float,
+    ) -> None:
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_requests_per_minute = requests_per_minute
+        self.scrape_timeout_seconds = scrape_timeout_seconds
+        self.limit = min(self.limit, float(max_concurrency))
+        self.rate = min(self.rate, float(requests_per_minute))
+
+    def _loop_condition(self) -> asyncio.Condition:
+        # Worker processes run each shard in a new event loop (asyncio.run), and
+        # a Condition stays bound to the loop it was first used in
+        loop = asyncio.get_running_loop()
+        if self._condition is None or self._loop is not loop:
+            self._condition = asyncio.Condition()
+            self._loop = loop
+            self._in_flight = 0
+            self._waiting = 0
+            self._next_start = 0.0
+        return self._condition
+
+    async def _pace(self) -> None:
+        now = time.monotonic()
+        start = max(now, self._next_start)
+        self._next_start = start + 60 / self.rate
+        if start > now:
+            await asyncio.sleep(start - now)
+
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        condition = self._loop_condition()
+        async with condition:
+            self._waiting += 1
+            try:
+                await condition.wait_for(
+                    lambda: self._in_flight < int(self.limit)
+                )
+            finally:
+                self._waiting -= 1
+            self._in_flight += 1
+
+        try:
+            await self._pace()
+            yield
+        finally:
+            async with condition:
+                self._in_flight -= 1
+                condition.notify_all()
+
+    async def record(self, elapsed: float, overloaded: bool) -> None:
+        self.avg_scrape_seconds = (
+            elapsed
+            if self.avg_scrape_seconds is None
+            else 0.8 * self.avg_scrape_seconds + 0.2 * elapsed
+        )
+        if overloaded or elapsed > SLOW_SCRAPE_RATIO * self.scrape_timeout_seconds:
+            self.failures += 1
+            self.backoffs += 1
+            self.limit = max(1.0, self.limit * BACKOFF_FACTOR)
+            self.rate = max(MIN_REQUESTS_PER_MINUTE, self.rate * BACKOFF_FACTOR)
+            return
+
+        self.successes += 1
+        self.limit = min(float(self.max_concurrency), self.limit + 1 / self.limit)
+        self.rate = min(
+            float(self.max_requests_per_minute),
+            self.rate + self.max_requests_per_minute * 0.1,
+        )
+        condition = self._loop_condition()
+        async with condition:
+            condition.notify_all()
+
+    def stats(self) -> PlatformLimiterStats:
+        return PlatformLimiterStats(
+            car_platform_id=self.car_platform_id,
+            car_platform_name=self.name,
+            concurrency_limit=int(self.limit),
+            max_concurrency=self.max_concurrency,
+            in_flight=self._in_flight,
+            waiting=self._waiting,
+            requests_per_minute=round(self.rate, 2),
+            max_requests_per_minute=self.max_requests_per_minute,
+            avg_scrape_seconds=self.avg_scrape_seconds,
+            successes=self.successes,
+            failures=self.failures,
+            backoffs=self.backoffs,
+        )
+
+
+# Limits are learned per process; worker processes each keep their own
+class PlatformLimiterRegistry:
+    def __init__(self):
+        self._limiters: Dict[int, PlatformLimiter] = {}
+        self._shares: Dict[int, int] = {}
+
+    def set_shares(self, car_platform_id: int, shares: int) -> None:
+        # A platform spread over several worker processes gets an equal part of
+        # its caps in each, so together they stay within the configured limits
+        self._shares[car_platform_id] = max(1, shares)
+
+    def get(self, car_platform) -> PlatformLimiter:
+        shares = self._shares.get(car_platform.id, 1)
+        max_concurrency = max(1, car_platform.max_concurrency // shares)
+        requests_per_minute = max(1, car_platform.requests_per_minute // shares)
+        limiter = self._limiters.get(car_platform.id)
+        if limiter is None:
+            limiter = PlatformLimiter(
+                car_platform_id=car_platform.id,
+                name=car_platform.name,
+                max_concurrency=max_concurrency,
+                requests_per_minute=requests_per_minute,
+                scrape_timeout_seconds=car_platform.scrape_timeout_seconds,
+            )
+            self._limiters[car_platform.id] = limiter
+        else:
+            limiter.configure(
+                name=car_platform.name,
+                max_concurrency=max_concurrency,
+                requests_per_minute=requests_per_minute,
+                scrape_timeout_seconds=car_platform.scrape_timeout_seconds,
+            )
+        return limiter
+
+    def stats(self) -> List[PlatformLimiterStats]:
+        return [limiter.stats() for limiter in self._limiters.values()]
+
+
+platform_limiters = PlatformLimiterRegistry()
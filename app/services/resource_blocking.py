@@ -0,0 +1,30 @@
+import re
+from functools import lru_cache
+from typing import Optional, Pattern, Tuple
+from playwright.async_api import Page, Route
+from models.car_platform import CarPlatform
+
+
+@lru_cache(maxsize=128)
+def compile_url_patterns(patterns: Tuple[str, ...]) -> Optional[Pattern[str]]:
+    if not patterns:
+        return None
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+async def block_resources(page: Page, car_platform: CarPlatform) -> None:
+    resource_types = frozenset(car_platform.blocked_resource_types or [])
+    url_pattern = compile_url_patterns(tuple(car_platform.blocked_url_patterns or []))
+    if not resource_types and url_pattern is None:
+        return
+
+    async def handle_route(route: Route):
+        request = route.request
+        if request.resource_type in resource_types or (
+            url_pattern is not None and url_pattern.search(request.url)
+        ):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    await page.route("**/*", handle_route)
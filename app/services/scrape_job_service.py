@@ -0,0 +1,241 @@
+import asyncio
+import uuid
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Awaitable, Callable, Dict, List, Optional
+from fastapi import HTTPException
+from db import SessionLocal
+from common.app_settings import settings
+from schemas.scrape_job_schema import ScrapeJobKind, ScrapeJobResponse, ScrapeJobStatus
+from schemas.scraped_car_schema import (
+    ScrapingConfigByQuery,
+    ScrapingConfigByCarModel,
+    ScrapingConfigByCarsModel,
+    ScrapingResultSuccess,
+    ScrapingResultError,
+    ScrapingResults,
+    ScrapingResultsByCarModels,
+    ScrapeResultSummary,
+)
+from services.scraping_service import (
+    ResultCallback,
+    ScrapingService,
+    create_scraping_service,
+)
+from services.logger_service import logger
+
+JobRunner = Callable[
+    [ScrapingService, ResultCallback],
+    Awaitable[ScrapingResults | ScrapingResultsByCarModels],
+]
+
+FINISHED_STATUSES = (
+    ScrapeJobStatus.COMPLETED,
+    ScrapeJobStatus.FAILED,
+    ScrapeJobStatus.CANCELLED,
+)
+
+
+@dataclass
+class ScrapeJob:
+    job_id: str
+    kind: ScrapeJobKind
+    headless: bool
+    runner: JobRunner
+    status: ScrapeJobStatus = ScrapeJobStatus.QUEUED
+    created_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    results: List[ScrapingResultSuccess | ScrapingResultError] = field(default_factory=list)
+    summary: Optional[ScrapeResultSummary] = None
+    scrape_request_id: Optional[int] = None
+    error_message: Optional[str] = None
+    task: Optional[asyncio.Task] = None
+
+
+# Jobs live in memory only: they are lost on restart, while the scraped rows
+# they wrote stay in the database
+class ScrapeJobManager:
+    def __init__(self, workers: int, retention: int):
+        self.workers = workers
+        self.retention = retention
+        self._jobs: Dict[str, ScrapeJob] = {}
+        self._queue: asyncio.Queue[ScrapeJob] = asyncio.Queue()
+        self._worker_tasks: List[asyncio.Task] = []
+
+    async def start(self) -> None:
+        if self._worker_tasks:
+            return
+        self._queue = asyncio.Queue()
+        self._worker_tasks = [
+            asyncio.create_task(self._worker()) for _ in range(self.workers)
+        ]
+        logger.info(f"Scrape job queue started with {self.workers} worker(s)")
+
+    async def stop(self) -> None:
+        if not self._worker_tasks:
+            return
+        running = []
+        for job in self._jobs.values():
+            if job.status == ScrapeJobStatus.QUEUED:
+                self._mark_cancelled(job)
+            elif job.task is not None:
+                job.task.cancel()
+                running.append(job.task)
+        if running:
+            await asyncio.wait(running)
+        for worker in self._worker_tasks:
+            worker.cancel()
+        await asyncio.gather(*self._worker_tasks, return_exceptions=True)
+        self._worker_tasks = []
+        logger.info("Scrape job queue stopped")
+
+    async def _run(self, job: ScrapeJob) -> ScrapingResults | ScrapingResultsByCarModels:
+        async with SessionLocal() as session:
+            service = create_scraping_service(session)
+            return await job.runner(service, job.results.append)
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status != ScrapeJobStatus.QUEUED:
+                    continue
+                job.status = ScrapeJobStatus.RUNNING
+                job.started_at = datetime.now(timezone.utc)
+                job.task = asyncio.create_task(self._run(job))
+                # wait() instead of awaiting the task, so cancelling the job
+                # does not cancel the worker
+                await asyncio.wait([job.task])
+                self._finish(job)
+            finally:
+                self._queue.task_done()
+
+    def _finish(self, job: ScrapeJob) -> None:
+        assert job.task is not None
+        job.finished_at = datetime.now(timezone.utc)
+        if job.task.cancelled():
+            job.status = ScrapeJobStatus.CANCELLED
+            logger.info(f"Scrape job {job.job_id} cancelled")
+        elif (error := job.task.exception()) is not None:
+            job.status = ScrapeJobStatus.FAILED
+            job.error_message = (
+                str(error.detail) if isinstance(error, HTTPException) else str(error)
+            )
+            logger.error(f"Scrape job {job.job_id} failed: {job.error_message}")
+        else:
+            result = job.task.result()
+            job.status = ScrapeJobStatus.COMPLETED
+            job.results = list(result.results)
+            job.summary = result.summary
+            if isinstance(result, ScrapingResults):
+                job.scrape_request_id = result.scrape_request_id
+        job.task = None
+        self._prune()
+
+    def _mark_cancelled(self, job: ScrapeJob) -> None:
+        job.status = ScrapeJobStatus.CANCELLED
+        job.finished_at = datetime.now(timezone.utc)
+
+    def _prune(self) -> None:
+        finished = [job for job in self._jobs.values() if job.status in FINISHED_STATUSES]
+        for job in finished[: max(0, len(finished) - self.retention)]:
+            del self._jobs[job.job_id]
+
+    def submit(self, kind: ScrapeJobKind, headless: bool, runner: JobRunner) -> ScrapeJob:
+        if not self._worker_tasks:
+            raise HTTPException(status_code=503, detail="Scrape job queue is not running")
+        job = ScrapeJob(job_id=uuid.uuid4().hex, kind=kind, headless=headless, runner=runner)
+        self._jobs[job.job_id] = job
+        self._queue.put_nowait(job)
+        self._prune()
+        logger.info(f"Scrape job {job.job_id} ({kind.value}) queued")
+        return job
+
+    def submit_query(self, config: ScrapingConfigByQuery, headless: bool) -> ScrapeJob:
+        return self.submit(
+            ScrapeJobKind.QUERY,
+            headless,
+            lambda service, on_result: service.scrape_car(
+                config, headless=headless, on_result=on_result
+            ),
+        )
+
+    def submit_car_model(self, config: ScrapingConfigByCarModel, headless: bool) -> ScrapeJob:
+        return self.submit(
+            ScrapeJobKind.CAR_MODEL,
+            headless,
+            lambda service, on_result: service.scrape_car_model(
+                config, headless=headless, on_result=on_result
+            ),
+        )
+
+    def submit_car_models(self, config: ScrapingConfigByCarsModel, headless: bool) -> ScrapeJob:
+        return self.submit(
+            ScrapeJobKind.CAR_MODELS,
+            headless,
+            lambda service, on_result: service.scrape_cars(
+                config, headless=headless, on_result=on_result
+            ),
+        )
+
+    def get_job(self, job_id: str) -> ScrapeJob:
+        job = self._jobs.get(job_id)
+        if job is None:
+            raise HTTPException(status_code=404, detail=f"Scrape job {job_id} not found")
+        return job
+
+    def is_active(self, job_id: Optional[str]) -> bool:
+        job = self._jobs.get(job_id) if job_id else None
+        return job is not None and job.status not in FINISHED_STATUSES
+
+    def list_jobs(self) -> List[ScrapeJob]:
+        return list(reversed(self._jobs.values()))
+
+    def cancel(self, job_id: str) -> ScrapeJob:
+        job = self.get_job(job_id)
+        if job.status == ScrapeJobStatus.QUEUED:
+            self._mark_cancelled(job)
+        elif job.status == ScrapeJobStatus.RUNNING and job.task is not None:
+            # The worker marks the job cancelled once the task has unwound
+            job.task.cancel()
+        else:
+            raise HTTPException(
+                status_code=409,
+                detail=f"Scrape job {job_id} is already {job.status.value}",
+            )
+        return job
+
+    def _queue_position(self, job: ScrapeJob) -> Optional[int]:
+        if job.status != ScrapeJobStatus.QUEUED:
+            return None
+        position = 0
+        for queued_job in self._jobs.values():
+            if queued_job.status == ScrapeJobStatus.QUEUED:
+                position += 1
+            if queued_job is job:
+                return position
+        return None
+
+    def to_response(self, job: ScrapeJob) -> ScrapeJobResponse:
+        return ScrapeJobResponse(
+            job_id=job.job_id,
+            kind=job.kind,
+            status=job.status,
+            headless=job.headless,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            queue_position=self._queue_position(job),
+            completed_scrapes=len(job.results),
+            scrape_request_id=job.scrape_request_id,
+            results=list(job.results),
+            summary=job.summary,
+            error_message=job.error_message,
+        )
+
+
+scrape_job_manager = ScrapeJobManager(
+    workers=settings.SCRAPE_JOB_WORKERS,
+    retention=settings.SCRAPE_JOB_RETENTION,
+)
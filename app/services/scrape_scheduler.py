@@ -0,0 +1,102 @@
+import asyncio
+from datetime import datetime, timezone
+from typing import Optional
+from common.app_settings import settings
+from crud.scrape_schedule_repository import ScrapeScheduleRepository
+from db import SessionLocal
+from schemas.scraped_car_schema import ScrapingConfigByCarModel
+from services.scrape_job_service import scrape_job_manager
+from services.logger_service import logger
+
+
+class ScrapeScheduler:
+    def __init__(
+        self,
+        enabled: bool,
+        poll_seconds: float,
+        max_jobs_per_tick: int,
+        track_all_cars: bool,
+        default_interval_minutes: int,
+    ):
+        self.enabled = enabled
+        self.poll_seconds = poll_seconds
+        self.max_jobs_per_tick = max_jobs_per_tick
+        self.track_all_cars = track_all_cars
+        self.default_interval_minutes = default_interval_minutes
+        self._task: Optional[asyncio.Task] = None
+
+    async def start(self) -> None:
+        if not self.enabled or self._task is not None:
+            return
+        self._task = asyncio.create_task(self._loop())
+        logger.info(f"Scrape scheduler started, polling every {self.poll_seconds:.0f}s")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        await asyncio.gather(self._task, return_exceptions=True)
+        self._task = None
+        logger.info("Scrape scheduler stopped")
+
+    async def _loop(self) -> None:
+        while True:
+            try:
+                await self.tick()
+            except Exception as e:
+                logger.error(f"Scrape scheduler tick failed: {str(e)}")
+            await asyncio.sleep(self.poll_seconds)
+
+    async def tick(self) -> int:
+        async with SessionLocal() as session:
+            repo = ScrapeScheduleRepository(session)
+            if self.track_all_cars:
+                added = await repo.add_missing_schedules(self.default_interval_minutes)
+                if added:
+                    logger.info(f"Scheduled {added} newly tracked car model(s)")
+
+            # Overdue runs (e.g. after downtime) are drained a few per tick
+            # instead of all at once
+            now = datetime.now(timezone.utc)
+            submitted = 0
+            try:
+                for schedule in await repo.claim_due_schedules(self.max_jobs_per_tick):
+                    if scrape_job_manager.is_active(schedule.last_job_id):
+                        logger.info(
+                            f"Skipping scheduled scrape of car {schedule.car_id}, "
+                            f"job {schedule.last_job_id} is still running"
+                        )
+                        repo.advance_schedule(schedule, now)
+                        continue
+                    try:
+                        job = scrape_job_manager.submit_car_model(
+                            ScrapingConfigByCarModel(
+                                car_id=schedule.car_id,
+                                car_platform_ids=schedule.car_platform_ids,
+                                max_listings=schedule.max_listings,
+                            ),
+                            headless=schedule.headless,
+                        )
+                    except Exception as e:
+                        # Left due, so the run is retried on the next tick
+                        logger.error(
+                            f"Failed to submit scheduled scrape of car "
+                            f"{schedule.car_id}: {str(e)}"
+                        )
+                        continue
+                    repo.advance_schedule(schedule, now, job.job_id)
+                    submitted += 1
+            except Exception:
+                await session.rollback()
+                raise
+            await repo.release_claims()
+            return submitted
+
+
+scrape_scheduler = ScrapeScheduler(
+    enabled=settings.SCRAPE_SCHEDULER_ENABLED,
+    poll_seconds=settings.SCRAPE_SCHEDULER_POLL_SECONDS,
+    max_jobs_per_tick=settings.SCRAPE_SCHEDULER_MAX_JOBS_PER_TICK,
+    track_all_cars=settings.SCRAPE_SCHEDULER_TRACK_ALL_CARS,
+    default_interval_minutes=settings.SCRAPE_SCHEDULE_DEFAULT_INTERVAL_MINUTES,
+)
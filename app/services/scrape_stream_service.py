@@ -0,0 +1,92 @@
+import asyncio
+import json
+from typing import AsyncIterator, Awaitable, Callable, Optional, Set
+from fastapi import HTTPException
+from pydantic import BaseModel
+from db import SessionLocal
+from common.app_settings import settings
+from schemas.scrape_stream_schema import ScrapeStreamError, ScrapeStreamFormat
+from schemas.scraped_car_schema import ScrapingResults, ScrapingResultsByCarModels
+from services.scraping_service import (
+    ResultCallback,
+    ScrapingService,
+    create_scraping_service,
+)
+from services.logger_service import logger
+
+StreamRunner = Callable[
+    [ScrapingService, ResultCallback],
+    Awaitable[ScrapingResults | ScrapingResultsByCarModels],
+]
+
+MEDIA_TYPES = {
+    ScrapeStreamFormat.SSE: "text/event-stream",
+    ScrapeStreamFormat.NDJSON: "application/x-ndjson",
+}
+
+
+def format_event(
+    stream_format: ScrapeStreamFormat,
+    event: str,
+    data: BaseModel,
+    exclude: Optional[Set[str]] = None,
+) -> str:
+    if stream_format == ScrapeStreamFormat.SSE:
+        return f"event: {event}\ndata: {data.model_dump_json(exclude=exclude)}\n\n"
+    payload = data.model_dump(mode="json", exclude=exclude)
+    return json.dumps({"event": event, "data": payload}) + "\n"
+
+
+def format_keepalive(stream_format: ScrapeStreamFormat) -> str:
+    return ": keep-alive\n\n" if stream_format == ScrapeStreamFormat.SSE else "\n"
+
+
+async def _run(
+    runner: StreamRunner, on_result: ResultCallback
+) -> ScrapingResults | ScrapingResultsByCarModels:
+    # The request's session is closed before a streaming body is sent
+    async with SessionLocal() as session:
+        return await runner(create_scraping_service(session), on_result)
+
+
+async def stream_scrape(
+    runner: StreamRunner, stream_format: ScrapeStreamFormat
+) -> AsyncIterator[str]:
+    # Emits a "result" event per finished (car, platform) task, then a "summary"
+    # event with the aggregate, or an "error" event if the scrape itself failed
+    queue: asyncio.Queue = asyncio.Queue()
+    task = asyncio.create_task(_run(runner, queue.put_nowait))
+    task.add_done_callback(lambda _: queue.put_nowait(None))
+    try:
+        while True:
+            try:
+                result = await asyncio.wait_for(
+                    queue.get(), timeout=settings.SCRAPE_STREAM_KEEPALIVE_SECONDS
+                )
+            except TimeoutError:
+                yield format_keepalive(stream_format)
+                continue
+            if result is None:
+                break
+            yield format_event(stream_format, "result", result)
+
+        error = task.exception()
+        if error is None:
+            # Results were already streamed one by one
+            yield format_event(stream_format, "summary", task.result(), exclude={"results"})
+        elif isinstance(error, HTTPException):
+            yield format_event(
+                stream_format,
+                "error",
+                ScrapeStreamError(status_code=error.status_code, detail=str(error.detail)),
+            )
+        else:
+            logger.error(f"Streamed scrape failed: {str(error)}")
+            yield format_event(
+                stream_format, "error", ScrapeStreamError(status_code=500, detail=str(error))
+            )
+    finally:
+        # The client went away before the scrape finished
+        if not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,207 @@
+import asyncio
+import json
+from pathlib import Path
+from typing import List, Optional
+from sqlalchemy.exc import DataError, IntegrityError
+from common.app_settings import settings
+from db import SessionLocal
+from crud.scraping_repository import ScrapingRepository
+from schemas.scraped_car_schema import ScrapedCarCreate
+from schemas.scraped_car_writer_schema import ScrapedCarWriterStats
+from services.logger_service import logger
+
+FLUSH_ATTEMPTS = 3
+
+
+def _error_text(error: Exception) -> str:
+    # SQLAlchemy errors embed the statement and every bound row; keep the driver's message
+    return str(getattr(error, "orig", None) or error)
+
+
+# Write-behind buffer: scraping tasks enqueue rows and move on, one writer
+# flushes them in batches by size or age. A full queue blocks producers
+class ScrapedCarWriter:
+    def __init__(
+        self,
+        queue_size: int,
+        batch_size: int,
+        flush_interval: float,
+        dead_letter_path: str,
+    ):
+        self.queue_size = queue_size
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.dead_letter_path = dead_letter_path
+        self._queue: asyncio.Queue[ScrapedCarCreate] = asyncio.Queue(queue_size)
+        self._task: Optional[asyncio.Task] = None
+        # Rows are flushed in FIFO order, so a sequence number tells flush()
+        # when everything enqueued before it has been handled
+        self._enqueued = 0
+        self._handled = 0
+        self._handled_changed = asyncio.Condition()
+        self._rows_written = 0
+        self._rows_dropped = 0
+        self._batches_flushed = 0
+        self._producers_blocked = 0
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None
+
+    async def start(self) -> None:
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._handled_changed = asyncio.Condition()
+        self._enqueued = self._handled = 0
+        self._task = asyncio.create_task(self._run())
+        logger.info(
+            f"Scraped car writer started (batch {self.batch_size}, "
+            f"every {self.flush_interval}s, queue {self.queue_size})"
+        )
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        # Producers are stopped first in the lifespan; whatever is queued is written
+        await self.flush()
+        task, self._task = self._task, None
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        remaining = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            await self._flush_batch(remaining)
+        logger.info(f"Scraped car writer stopped, {self._rows_written} row(s) written")
+
+    async def write(self, rows: List[ScrapedCarCreate]) -> None:
+        if not rows:
+            return
+        if self._task is None:
+            # Worker processes and scripts write directly, failures handled the same way
+            await self._flush_batch(rows)
+            return
+        for row in rows:
+            if self._queue.full():
+                self._producers_blocked += 1
+            await self._queue.put(row)
+            self._enqueued += 1
+
+    async def flush(self) -> None:
+        target = self._enqueued
+        async with self._handled_changed:
+            await self._handled_changed.wait_for(
+                lambda: self._handled >= target or self._task is None
+            )
+
+    async def _next_batch(self) -> List[ScrapedCarCreate]:
+        batch = [await self._queue.get()]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.flush_interval
+        while len(batch) < self.batch_size:
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except TimeoutError:
+                break
+        return batch
+
+    async def _insert(self, rows: List[ScrapedCarCreate]) -> None:
+        async with SessionLocal() as session:
+            await ScrapingRepository(session).add_scraped_cars(rows)
+        self._rows_written += len(rows)
+
+    async def _flush_batch(self, batch: List[ScrapedCarCreate]) -> None:
+        for attempt in range(1, FLUSH_ATTEMPTS + 1):
+            try:
+                await self._insert(batch)
+                self._batches_flushed += 1
+                return
+            except (IntegrityError, DataError) as e:
+                # A bad row fails the whole statement and retrying will not fix
+                # it; split the batch so the rows around it still get written
+                await self._split_batch(batch, e)
+                self._batches_flushed += 1
+                return
+            except Exception as e:
+                if attempt == FLUSH_ATTEMPTS:
+                    await self._dead_letter(batch, e)
+                    return
+                logger.warning(
+                    f"Writing {len(batch)} scraped car row(s) failed: {_error_text(e)}"
+                )
+                await asyncio.sleep(attempt)
+
+    async def _split_batch(self, batch: List[ScrapedCarCreate], error: Exception) -> None:
+        if len(batch) == 1:
+            await self._dead_letter(batch, error)
+            return
+        middle = len(batch) // 2
+        for half in (batch[:middle], batch[middle:]):
+            try:
+                await self._insert(half)
+            except (IntegrityError, DataError) as e:
+                await self._split_batch(half, e)
+            except Exception as e:
+                await self._dead_letter(half, e)
+
+    async def _dead_letter(self, rows: List[ScrapedCarCreate], error: Exception) -> None:
+        # Dropped rows are kept with their payload so they can be replayed
+        self._rows_dropped += len(rows)
+        lines = [
+            json.dumps({"error": _error_text(error), "row": row.model_dump(mode="json")})
+            for row in rows
+        ]
+        logger.error(
+            f"Dropped {len(rows)} scraped car row(s), saved to "
+            f"{self.dead_letter_path}: {_error_text(error)}"
+        )
+        try:
+            await asyncio.to_thread(self._append_dead_letters, lines)
+        except Exception as e:
+            logger.error(f"Failed to save dropped scraped car rows: {str(e)}")
+            for line in lines:
+                logger.error(f"Dropped scraped car row: {line}")
+
+    def _append_dead_letters(self, lines: List[str]) -> None:
+        path = Path(self.dead_letter_path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with path.open("a", encoding="utf-8") as f:
+            f.writelines(line + "\n" for line in lines)
+
+    async def _run(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            try:
+                await self._flush_batch(batch)
+            finally:
+                async with self._handled_changed:
+                    self._handled += len(batch)
+                    self._handled_changed.notify_all()
+
+    def stats(self) -> ScrapedCarWriterStats:
+        return ScrapedCarWriterStats(
+            running=self.running,
+            queue_size=self.queue_size,
+            pending=self._enqueued - self._handled,
+            batch_size=self.batch_size,
+            rows_written=self._rows_written,
+            rows_dropped=self._rows_dropped,
+            dead_letter_path=self.dead_letter_path,
+            batches_flushed=self._batches_flushed,
+            producers_blocked_total=self._producers_blocked,
+        )
+
+
+scraped_car_writer = ScrapedCarWriter(
+    queue_size=settings.SCRAPED_CAR_WRITER_QUEUE_SIZE,
+    batch_size=settings.SCRAPED_CAR_WRITER_BATCH_SIZE,
+    flush_interval=settings.SCRAPED_CAR_WRITER_FLUSH_SECONDS,
+    dead_letter_path=settings.SCRAPED_CAR_WRITER_DEAD_LETTER_PATH,
+)
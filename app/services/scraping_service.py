@@ -1,8 +1,8 @@
-from typing import List, Annotated, Optional
+from typing import Callable, Dict, List, Annotated, Optional, Set
 from fastapi import HTTPException, Depends
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 import asyncio
-from playwright.async_api import async_playwright
+import random
 from schemas.scraped_car_schema import (
     ScrapingConfigByQuery,
     ScrapingResultSuccess,
@@ -12,16 +12,92 @@ from schemas.scraped_car_schema import (
     ScrapedCarCreate,
     ScrapingStatus,
     ScrapedRequestCreate,
+    CarDataScrapeResult,
+    ScrapedCarItem,
+    ScrapingConfigByCarModel,
     ScrapingConfigByCarsModel,
     ScrapingResultsByCarModels,
 )
-from crud.scraping_repository import ScrapingRepositoryDependency
-from crud.car_platform_repository import CarPlatformRepositoryDependency
-from crud.car_model_repository import CarModelRepositoryDependency
+from sqlalchemy.ext.asyncio import AsyncSession
+from crud.scraping_repository import ScrapingRepository, ScrapingRepositoryDependency
+from crud.car_platform_repository import (
+    CarPlatformRepository,
+    CarPlatformRepositoryDependency,
+)
+from crud.car_model_repository import CarModelRepository, CarModelRepositoryDependency
+from crud.search_url_cache_repository import (
+    SearchUrlCacheRepository,
+    SearchUrlCacheRepositoryDependency,
+)
+from crud.platform_storage_state_repository import (
+    PlatformStorageStateRepository,
+    PlatformStorageStateRepositoryDependency,
+)
+from crud.html_snapshot_repository import (
+    HtmlSnapshotRepository,
+    HtmlSnapshotRepositoryDependency,
+)
+from crud.dropdown_option_repository import (
+    DropdownOptionRepository,
+    DropdownOptionRepositoryDependency,
+)
+from schemas.dropdown_option_schema import DropdownOptionItem, normalize_option_text
+from db import SessionLocal
+from common.app_settings import settings
 from services.scraping_utils import scrape_car_data
+from services.storage_state import apply_storage_state, capture_storage_state
+from services.html_snapshot import compress_html
+from services.listing_index import canonicalize_url
+from services.browser_pool import browser_pool
+from services.rate_limiter import platform_limiters
+from services.circuit_breaker import circuit_breakers
+from services.scraping_worker import ShardTask, scraping_worker_pool
+from services.stage_timer import StageTimer, stage_histograms
+from services.scraped_car_writer import scraped_car_writer
 import time
 from services.logger_service import logger
 
+# Keeps fire-and-forget tasks referenced until they finish
+background_tasks: set[asyncio.Task] = set()
+
+ResultCallback = Callable[[ScrapingResultSuccess | ScrapingResultError], None]
+
+# Failures worth another attempt; a missing car or a broken selector will not fix itself
+RETRYABLE_STATUSES = (ScrapingStatus.SITE_UNAVAILABLE, ScrapingStatus.ERROR_SCRAPING)
+
+
+def classify_scraping_error(error_message: str) -> ScrapingStatus:
+    if "not found" in error_message.lower():
+        return ScrapingStatus.NOT_FOUND
+    elif "timeout" in error_message.lower():
+        # Playwright waits bounded by max_wait_ms come back wrapped as "Failed to
+        # interact with selector ...: Timeout ..."; a slow page is worth a retry and
+        # must not open the circuit like a broken selector would
+        return ScrapingStatus.ERROR_SCRAPING
+    elif "selector" in error_message.lower():
+        return ScrapingStatus.INVALID_SELECTOR
+    elif "site unavailable" in error_message.lower():
+        return ScrapingStatus.SITE_UNAVAILABLE
+    return ScrapingStatus.ERROR_SCRAPING
+
+
+async def refresh_option_index(
+    car_platform_id: int,
+    brand: str,
+    harvested_options: Dict[str, List[DropdownOptionItem]],
+) -> None:
+    try:
+        async with SessionLocal() as session:
+            repo = DropdownOptionRepository(session)
+            for field, options in harvested_options.items():
+                parent_value = normalize_option_text(brand) if field == "model" else ""
+                await repo.merge_options(car_platform_id, field, parent_value, options)
+        logger.info(f"Refreshed dropdown option index for car platform {car_platform_id}")
+    except Exception as e:
+        logger.warning(
+            f"Failed to refresh dropdown option index for car platform {car_platform_id}: {str(e)}"
+        )
+
 
 class ScrapingService:
     def __init__(
@@ -29,107 +105,484 @@ class ScrapingService:
         repo_car_platform: CarPlatformRepositoryDependency,
         repo_scraping: ScrapingRepositoryDependency,
         repo_car_model: CarModelRepositoryDependency,
+        repo_search_url_cache: SearchUrlCacheRepositoryDependency,
+        repo_dropdown_option: DropdownOptionRepositoryDependency,
+        repo_storage_state: PlatformStorageStateRepositoryDependency,
+        repo_html_snapshot: HtmlSnapshotRepositoryDependency,
     ):
         self.repo_car_platform = repo_car_platform
         self.repo_scraping = repo_scraping
         self.repo_car_model = repo_car_model
+        self.repo_search_url_cache = repo_search_url_cache
+        self.repo_dropdown_option = repo_dropdown_option
+        self.repo_storage_state = repo_storage_state
+        self.repo_html_snapshot = repo_html_snapshot
+
+    async def load_option_indexes(
+        self, car_platform_id: int, brand: str
+    ) -> Dict[str, List[DropdownOptionItem]]:
+        return {
+            "brand": await self.repo_dropdown_option.get_options(
+                car_platform_id, "brand"
+            ),
+            "model": await self.repo_dropdown_option.get_options(
+                car_platform_id, "model", normalize_option_text(brand)
+            ),
+        }
 
-    async def scrape_single_car_platform(
+    async def save_storage_state(self, context, car_platform) -> None:
+        try:
+            storage_state = await capture_storage_state(context, car_platform)
+            await self.repo_storage_state.save_storage_state(
+                car_platform.id, storage_state
+            )
+            logger.info(f"Saved browser storage state for {car_platform.name}")
+        except Exception as e:
+            logger.warning(
+                f"Failed to save browser storage state for {car_platform.name}: {str(e)}"
+            )
+
+    async def update_search_url(
+        self, car_platform, config: ScrapingConfigByQuery, search_url: Optional[str]
+    ) -> None:
+        # Caches the fresh URL, or drops a cached one that stopped working
+        try:
+            if search_url:
+                await self.repo_search_url_cache.save_search_url(
+                    car_platform.id, config, search_url
+                )
+            else:
+                await self.repo_search_url_cache.delete_search_url(car_platform.id, config)
+        except Exception as e:
+            # Leaves the session usable for the writes that follow
+            await self.repo_search_url_cache.session.rollback()
+            logger.warning(
+                f"Failed to update cached search URL for {car_platform.name}: {str(e)}"
+            )
+
+    async def save_stage_timings(
+        self, car_platform, scrape_request_id: int, timer: StageTimer
+    ) -> None:
+        # Diagnostics only: the scrape's rows are already queued, so a failed
+        # write must not turn the platform's result into an exception
+        try:
+            await self.repo_scraping.add_stage_timings(
+                scrape_request_id, car_platform.id, timer.seconds, timer.counts
+            )
+        except Exception as e:
+            await self.repo_scraping.session.rollback()
+            logger.warning(
+                f"Failed to save stage timings for {car_platform.name}: {str(e)}"
+            )
+
+    async def save_html_snapshots(
+        self, car_platform, car_results: List[ScrapedCarItem]
+    ) -> List[Optional[str]]:
+        # Returns the snapshot hash of each car, None where nothing was stored
+        if not settings.HTML_SNAPSHOTS_ENABLED:
+            return [None] * len(car_results)
+        try:
+            snapshots = await asyncio.to_thread(
+                lambda: [
+                    compress_html(car_data.html) if car_data.html else None
+                    for car_data in car_results
+                ]
+            )
+            await self.repo_html_snapshot.save_snapshots(
+                [snapshot for snapshot in snapshots if snapshot is not None]
+            )
+            return [snapshot.hash if snapshot else None for snapshot in snapshots]
+        except Exception as e:
+            logger.warning(
+                f"Failed to save HTML snapshots for {car_platform.name}: {str(e)}"
+            )
+            return [None] * len(car_results)
+
+    async def release_connection(self) -> None:
+        # Ends the read transaction so the connection goes back to the pool
+        # while the browser works; expire_on_commit is off, loaded rows stay usable
+        await self.repo_scraping.session.commit()
+
+    async def touch_reused_snapshots(
+        self, car_platform, hashes: List[str]
+    ) -> Set[str]:
+        # Reused rows point at the old snapshot; refreshing last_seen_at keeps the
+        # pruner from deleting it before the write-behind buffer inserts them
+        try:
+            return await self.repo_html_snapshot.touch_snapshots(hashes)
+        except Exception as e:
+            await self.repo_html_snapshot.session.rollback()
+            logger.warning(
+                f"Failed to refresh reused HTML snapshots for {car_platform.name}: {str(e)}"
+            )
+            return set()
+
+    async def find_recent_listings(
+        self, car_platform, urls: List[str]
+    ) -> Dict[str, ScrapedCarItem]:
+        canonical_urls = {url: canonicalize_url(url) for url in urls}
+        recent = await self.repo_scraping.get_recent_listings(
+            car_platform.id,
+            list(set(canonical_urls.values())),
+            datetime.now(timezone.utc)
+            - timedelta(hours=settings.LISTING_REUSE_TTL_HOURS),
+        )
+        live_hashes = await self.touch_reused_snapshots(
+            car_platform,
+            [car.snapshot_hash for car in recent.values() if car.snapshot_hash],
+        )
+        await self.release_connection()
+        reused = {}
+        for url, canonical_url in canonical_urls.items():
+            car = recent.get(canonical_url)
+            if car is None:
+                continue
+            reused[url] = ScrapedCarItem(
+                url=url,
+                year=car.scraped_year,
+                price=car.scraped_price,
+                currency=car.scraped_currency,
+                mileage=car.scraped_mileage,
+                mileage_unit=car.scraped_mileage_unit,
+                views=car.scraped_number_of_views,
+                scraped_at=datetime.now(timezone.utc),
+                reused=True,
+                details_scraped_at=car.details_scraped_at,
+                snapshot_hash=(
+                    car.snapshot_hash if car.snapshot_hash in live_hashes else None
+                ),
+            )
+        return reused
+
+    async def scrape_with_retries(
         self,
         context,
         car_platform,
         config: ScrapingConfigByQuery,
-        scrape_request_id: int,
-        semaphore: asyncio.Semaphore,
-        car_id: Optional[int] = None,
-    ) -> ScrapingResultSuccess | ScrapingResultError:
-        async with semaphore:
-            start_time = time.perf_counter()
+        cached_search_url: Optional[str],
+        option_indexes: Optional[Dict[str, List[DropdownOptionItem]]],
+        skip_popups: bool = False,
+        timer: Optional[StageTimer] = None,
+    ) -> CarDataScrapeResult:
+        timer = timer or StageTimer()
+        # One deadline for the whole call, retries and backoff sleeps included,
+        # so a flapping platform cannot hold its slot for attempts x timeout
+        try:
+            async with asyncio.timeout(car_platform.scrape_timeout_seconds):
+                return await self._scrape_with_retries(
+                    context,
+                    car_platform,
+                    config,
+                    cached_search_url,
+                    option_indexes,
+                    skip_popups,
+                    timer,
+                )
+        except TimeoutError:
+            raise RuntimeError(
+                f"Site unavailable: scraping {car_platform.name} exceeded "
+                f"the {car_platform.scrape_timeout_seconds}s deadline"
+            )
+
+    async def _scrape_with_retries(
+        self,
+        context,
+        car_platform,
+        config: ScrapingConfigByQuery,
+        cached_search_url: Optional[str],
+        option_indexes: Optional[Dict[str, List[DropdownOptionItem]]],
+        skip_popups: bool,
+        timer: StageTimer,
+    ) -> CarDataScrapeResult:
+        attempt = 0
+        while True:
             try:
-                car_results = await scrape_car_data(
+                return await scrape_car_data(
                     context=context,
                     car_platform=car_platform,
                     brand=config.brand,
                     model=config.model,
                     year_from=config.year_from,
                     year_to=config.year_to,
+                    max_listings=config.max_listings,
+                    cached_search_url=cached_search_url,
+                    option_indexes=option_indexes,
+                    skip_popups=skip_popups,
+                    timer=timer,
+                    capture_html=settings.HTML_SNAPSHOTS_ENABLED,
+                    lookup_listings=(
+                        (lambda urls: self.find_recent_listings(car_platform, urls))
+                        if settings.LISTING_REUSE_TTL_HOURS
+                        else None
+                    ),
+                )
+            except RuntimeError as e:
+                if (
+                    attempt >= settings.SCRAPE_RETRY_ATTEMPTS
+                    or classify_scraping_error(str(e)) not in RETRYABLE_STATUSES
+                ):
+                    raise
+                # Full jitter keeps retries against one platform from synchronising
+                delay = random.uniform(
+                    0,
+                    min(
+                        settings.SCRAPE_RETRY_MAX_DELAY_SECONDS,
+                        settings.SCRAPE_RETRY_BASE_DELAY_SECONDS * 2**attempt,
+                    ),
+                )
+                attempt += 1
+                logger.warning(
+                    f"Scraping {car_platform.name} failed ({str(e)}), "
+                    f"retry {attempt}/{settings.SCRAPE_RETRY_ATTEMPTS} in {delay:.1f}s"
+                )
+                with timer.stage("retry_backoff"):
+                    await asyncio.sleep(delay)
+
+    async def add_scrape_error(
+        self,
+        car_platform,
+        scrape_request_id: int,
+        car_id: Optional[int],
+        status: ScrapingStatus,
+        error_message: str,
+    ) -> ScrapingResultError:
+        await scraped_car_writer.write(
+            [
+                ScrapedCarCreate(
+                    request_id=scrape_request_id,
+                    car_platform_id=car_platform.id,
+                    car_id=car_id,
+                    scraped_url=None,
+                    search_position=None,
+                    scraped_year=None,
+                    scraped_price=None,
+                    scraped_currency=None,
+                    scraped_mileage=None,
+                    scraped_mileage_unit=None,
+                    scraped_number_of_views=None,
+                    scraped_at=datetime.now(timezone.utc),
+                    status=status,
+                    error_message=error_message,
+                )
+            ]
+        )
+        return ScrapingResultError(
+            marketplace_name=car_platform.name,
+            status=status,
+            error_message=error_message,
+            car_id=car_id,
+            scraped_at=datetime.now(timezone.utc),
+        )
+
+    async def skip_open_circuit(
+        self,
+        car_platform,
+        breaker,
+        scrape_request_id: int,
+        car_id: Optional[int],
+        on_result: Optional[ResultCallback],
+    ) -> ScrapingResultError:
+        result = await self.add_scrape_error(
+            car_platform,
+            scrape_request_id,
+            car_id,
+            ScrapingStatus.CIRCUIT_OPEN,
+            f"Circuit open for {car_platform.name} after "
+            f"{breaker.consecutive_failures} consecutive failures, skipped",
+        )
+        if on_result is not None:
+            on_result(result)
+        return result
+
+    async def scrape_single_car_platform(
+        self,
+        context,
+        car_platform,
+        config: ScrapingConfigByQuery,
+        scrape_request_id: int,
+        car_id: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
+    ) -> ScrapingResultSuccess | ScrapingResultError:
+        # Tasks run concurrently and an AsyncSession cannot be shared between
+        # them, so each one reads and commits through its own pooled session
+        async with SessionLocal() as session:
+            return await create_scraping_service(session)._scrape_single_car_platform(
+                context, car_platform, config, scrape_request_id, car_id, on_result
+            )
+
+    async def _scrape_single_car_platform(
+        self,
+        context,
+        car_platform,
+        config: ScrapingConfigByQuery,
+        scrape_request_id: int,
+        car_id: Optional[int],
+        on_result: Optional[ResultCallback],
+    ) -> ScrapingResultSuccess | ScrapingResultError:
+        breaker = circuit_breakers.get(car_platform)
+        if breaker.rejects():
+            return await self.skip_open_circuit(
+                car_platform, breaker, scrape_request_id, car_id, on_result
+            )
+
+        limiter = platform_limiters.get(car_platform)
+        timer = StageTimer()
+        scrape_result: Optional[CarDataScrapeResult] = None
+        error_message: Optional[str] = None
+        slot_requested_at = time.perf_counter()
+        # The slot covers the browser work only; everything this scrape writes
+        # happens after it is released so other tasks are not held up by the DB
+        async with limiter.slot():
+            # Checked again with the slot held: tasks queued behind the failures
+            # that opened the circuit must not go on to hit the platform
+            if not breaker.allow():
+                return await self.skip_open_circuit(
+                    car_platform, breaker, scrape_request_id, car_id, on_result
                 )
+            start_time = time.perf_counter()
+            timer.add("limiter_wait", start_time - slot_requested_at)
+            try:
+                with timer.stage("setup"):
+                    cached_search_url = await self.repo_search_url_cache.get_search_url(
+                        car_platform.id,
+                        config,
+                        ttl=timedelta(hours=settings.SEARCH_URL_CACHE_TTL_HOURS),
+                    )
+                    option_indexes = (
+                        None
+                        if cached_search_url
+                        else await self.load_option_indexes(car_platform.id, config.brand)
+                    )
+                    saved_state = await self.repo_storage_state.get_storage_state(
+                        car_platform.id
+                    )
+                    if saved_state:
+                        await apply_storage_state(
+                            context, car_platform, saved_state.storage_state
+                        )
+                    await self.release_connection()
+                scrape_result = await self.scrape_with_retries(
+                    context,
+                    car_platform,
+                    config,
+                    cached_search_url,
+                    option_indexes,
+                    skip_popups=bool(saved_state)
+                    and car_platform.skip_popups_with_storage_state,
+                    timer=timer,
+                )
+            except RuntimeError as e:
+                error_message = str(e)
 
-                for search_position, car_data in enumerate(car_results, 1):
-                    await self.repo_scraping.add_scraped_car(
-                        car_data=ScrapedCarCreate(
-                            request_id=scrape_request_id,
-                            car_platform_id=car_platform.id,
-                            car_id=car_id,
-                            scraped_url=car_data.url,
-                            search_position=search_position,
-                            scraped_year=car_data.year,
-                            scraped_price=car_data.price,
-                            scraped_currency=car_data.currency,
-                            scraped_mileage=car_data.mileage,
-                            scraped_mileage_unit=car_data.mileage_unit,
-                            scraped_number_of_views=car_data.views,
-                            scraped_at=car_data.scraped_at,
-                            status=ScrapingStatus.SUCCESS,
-                            error_message=None,
+            await limiter.record(
+                time.perf_counter() - start_time,
+                overloaded=error_message is not None
+                and classify_scraping_error(error_message)
+                in (ScrapingStatus.SITE_UNAVAILABLE, ScrapingStatus.ERROR_SCRAPING),
+            )
+
+        result: Optional[ScrapingResultSuccess | ScrapingResultError] = None
+        if scrape_result is not None:
+            try:
+                car_results = scrape_result.cars
+
+                if scrape_result.harvested_options:
+                    task = asyncio.create_task(
+                        refresh_option_index(
+                            car_platform.id, config.brand, scrape_result.harvested_options
                         )
                     )
+                    background_tasks.add(task)
+                    task.add_done_callback(background_tasks.discard)
+
+                if not scrape_result.search_url_from_cache and (
+                    scrape_result.search_url or cached_search_url
+                ):
+                    await self.update_search_url(
+                        car_platform, config, scrape_result.search_url
+                    )
+
+                refresh_before = datetime.now(timezone.utc) - timedelta(
+                    hours=settings.BROWSER_STORAGE_STATE_REFRESH_HOURS
+                )
+                if saved_state is None or saved_state.saved_at < refresh_before:
+                    await self.save_storage_state(context, car_platform)
+
+                with timer.stage("snapshot_store"):
+                    snapshot_hashes = await self.save_html_snapshots(car_platform, car_results)
+
+                # Queued on the write-behind buffer, only blocks when it is full
+                with timer.stage("db_write"):
+                    await scraped_car_writer.write(
+                        [
+                            ScrapedCarCreate(
+                                request_id=scrape_request_id,
+                                car_platform_id=car_platform.id,
+                                car_id=car_id,
+                                scraped_url=car_data.url,
+                                canonical_url=canonicalize_url(car_data.url),
+                                search_position=car_data.search_position,
+                                scraped_year=car_data.year,
+                                scraped_price=car_data.price,
+                                scraped_currency=car_data.currency,
+                                scraped_mileage=car_data.mileage,
+                                scraped_mileage_unit=car_data.mileage_unit,
+                                scraped_number_of_views=car_data.views,
+                                scraped_at=car_data.scraped_at,
+                                details_scraped_at=car_data.details_scraped_at
+                                or car_data.scraped_at,
+                                status=ScrapingStatus.SUCCESS,
+                                error_message=None,
+                                snapshot_hash=snapshot_hash or car_data.snapshot_hash,
+                            )
+                            for car_data, snapshot_hash in zip(car_results, snapshot_hashes)
+                        ]
+                    )
 
                 time_to_scrape_platform = time.perf_counter() - start_time
                 logger.info(
                     f"Scraped {car_platform.name} in {time_to_scrape_platform:.2f} seconds"
                 )
 
-                return ScrapingResultSuccess(
+                result = ScrapingResultSuccess(
                     marketplace_name=car_platform.name,
                     status="success",
                     cars_scraped=len(car_results),
+                    cars_reused=sum(1 for car_data in car_results if car_data.reused),
                     time_to_scrape_platform=f"{time_to_scrape_platform:.2f} seconds",
+                    time_to_scrape_platform_seconds=round(time_to_scrape_platform, 3),
                     car_id=car_id,
                     scraped_at=datetime.now(timezone.utc),
                 )
-
             except RuntimeError as e:
                 error_message = str(e)
-                status = ScrapingStatus.ERROR_SCRAPING
-                if "not found" in error_message.lower():
-                    status = ScrapingStatus.NOT_FOUND
-                elif "selector" in error_message.lower():
-                    status = ScrapingStatus.INVALID_SELECTOR
-                elif "site unavailable" in error_message.lower():
-                    status = ScrapingStatus.SITE_UNAVAILABLE
-
-                await self.repo_scraping.add_scraped_car(
-                    car_data=ScrapedCarCreate(
-                        request_id=scrape_request_id,
-                        car_platform_id=car_platform.id,
-                        car_id=car_id,
-                        scraped_url=None,
-                        search_position=None,
-                        scraped_year=None,
-                        scraped_price=None,
-                        scraped_currency=None,
-                        scraped_mileage=None,
-                        scraped_mileage_unit=None,
-                        scraped_number_of_views=None,
-                        scraped_at=datetime.now(timezone.utc),
-                        status=status,
-                        error_message=error_message,
-                    )
-                )
-                return ScrapingResultError(
-                    marketplace_name=car_platform.name,
-                    status=status,
-                    error_message=error_message,
-                    car_id=car_id,
-                    scraped_at=datetime.now(timezone.utc),
+
+        if result is None:
+            with timer.stage("db_write"):
+                result = await self.add_scrape_error(
+                    car_platform,
+                    scrape_request_id,
+                    car_id,
+                    classify_scraping_error(error_message),
+                    error_message,
                 )
 
+        breaker.record(ScrapingStatus(result.status))
+
+        result.stage_timings = timer.rounded()
+        stage_histograms.observe_timer(car_platform.name, timer)
+        await self.save_stage_timings(car_platform, scrape_request_id, timer)
+
+        if on_result is not None:
+            on_result(result)
+        return result
+
     async def scrape_car(
         self,
         config: ScrapingConfigByQuery,
         headless: bool = True,
         car_id: Optional[int] = None,
+        on_result: Optional[ResultCallback] = None,
     ) -> ScrapingResults:
         all_car_platforms = await self.repo_car_platform.get_all_car_platforms()
 
@@ -157,32 +610,21 @@ class ScrapingService:
             )
         )
 
-        max_concurrent_requests = 4
-        semaphore = asyncio.Semaphore(max_concurrent_requests)
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/114.0"
-            )
-
+        async with browser_pool.lease(headless=headless) as context:
             tasks = [
                 self.scrape_single_car_platform(
                     context=context,
                     car_platform=car_platform,
                     config=config,
                     scrape_request_id=scraping_request.id,
-                    semaphore=semaphore,
                     car_id=car_id,
+                    on_result=on_result,
                 )
                 for car_platform in chosen_car_platforms
             ]
             results = await asyncio.gather(*tasks, return_exceptions=False)
-
-            await context.close()
-            await browser.close()
-
-        
+        # The response should not mention rows that cannot be read back yet
+        await scraped_car_writer.flush()
 
         summary = ScrapeResultSummary(
             total_marketplaces_processed=len(results),
@@ -207,8 +649,33 @@ class ScrapingService:
             summary=summary,
         )
 
+    async def scrape_car_model(
+        self,
+        config: ScrapingConfigByCarModel,
+        headless: bool = True,
+        on_result: Optional[ResultCallback] = None,
+    ) -> ScrapingResults:
+        car_model = await self.repo_car_model.get_car_model_by_id(config.car_id)
+
+        return await self.scrape_car(
+            ScrapingConfigByQuery(
+                brand=car_model.brand,
+                model=car_model.model,
+                year_from=car_model.year_from,
+                year_to=car_model.year_to,
+                car_platform_ids=config.car_platform_ids,
+                max_listings=config.max_listings,
+            ),
+            headless=headless,
+            car_id=car_model.id,
+            on_result=on_result,
+        )
+
     async def scrape_cars(
-        self, config: ScrapingConfigByCarsModel, headless: bool = True
+        self,
+        config: ScrapingConfigByCarsModel,
+        headless: bool = True,
+        on_result: Optional[ResultCallback] = None,
     ) -> ScrapingResultsByCarModels:
         all_car_platforms = await self.repo_car_platform.get_all_car_platforms()
 
@@ -245,47 +712,57 @@ class ScrapingService:
             chosen_car_models = all_car_models
 
         results: List[ScrapingResultSuccess | ScrapingResultError] = []
-        max_concurrent_requests = 6
-        semaphore = asyncio.Semaphore(max_concurrent_requests)
-
-        async with async_playwright() as p:
-            browser = await p.chromium.launch(headless=headless)
-            tasks = []
-
-            context = await browser.new_context(
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:109.0) Gecko/20100101 Firefox/114.0"
+        car_requests = []
+        for car in chosen_car_models:
+            scraping_request = await self.repo_scraping.add_scrape_request(
+                ScrapedRequestCreate(
+                    car_id=car.id,
+                    search_query=f"{car.brand} {car.model} {car.year_from}-{car.year_to}",
+                )
+            )
+            car_config = ScrapingConfigByQuery(
+                brand=car.brand,
+                model=car.model,
+                year_from=car.year_from,
+                year_to=car.year_to,
+                car_platform_ids=config.car_platform_ids,
+                max_listings=config.max_listings,
             )
+            car_requests.append((car.id, scraping_request.id, car_config))
 
-            for car in chosen_car_models:
-                scraping_request = await self.repo_scraping.add_scrape_request(
-                    ScrapedRequestCreate(
-                        car_id=car.id,
-                        search_query=f"{car.brand} {car.model} {car.year_from}-{car.year_to}",
-                    )
+        if scraping_worker_pool.enabled:
+            shard_tasks = [
+                ShardTask(
+                    car_id=car_id,
+                    car_platform_id=car_platform.id,
+                    scrape_request_id=scrape_request_id,
+                    config=car_config,
                 )
-
-                car_tasks = [
+                for car_id, scrape_request_id, car_config in car_requests
+                for car_platform in chosen_car_platforms
+            ]
+            results_raw = await scraping_worker_pool.run(
+                shard_tasks,
+                car_platforms=chosen_car_platforms,
+                headless=headless,
+                on_result=on_result,
+            )
+        else:
+            async with browser_pool.lease(headless=headless) as context:
+                tasks = [
                     self.scrape_single_car_platform(
                         context=context,
                         car_platform=car_platform,
-                        config=ScrapingConfigByQuery(
-                            brand=car.brand,
-                            model=car.model,
-                            year_from=car.year_from,
-                            year_to=car.year_to,
-                            car_platform_ids=config.car_platform_ids,
-                        ),
-                        scrape_request_id=scraping_request.id,
-                        semaphore=semaphore,
-                        car_id=car.id,
+                        config=car_config,
+                        scrape_request_id=scrape_request_id,
+                        car_id=car_id,
+                        on_result=on_result,
                     )
+                    for car_id, scrape_request_id, car_config in car_requests
                     for car_platform in chosen_car_platforms
                 ]
-                tasks.extend(car_tasks)
-
-            results_raw = await asyncio.gather(*tasks, return_exceptions=True)
-
-            await browser.close()
+                results_raw = await asyncio.gather(*tasks, return_exceptions=True)
+        await scraped_car_writer.flush()
 
         results: List[ScrapingResultSuccess | ScrapingResultError] = [
             r
@@ -319,11 +796,31 @@ def get_scraping_service(
     repo_car_platform: CarPlatformRepositoryDependency,
     repo_scraping: ScrapingRepositoryDependency,
     repo_car_model: CarModelRepositoryDependency,
+    repo_search_url_cache: SearchUrlCacheRepositoryDependency,
+    repo_dropdown_option: DropdownOptionRepositoryDependency,
+    repo_storage_state: PlatformStorageStateRepositoryDependency,
+    repo_html_snapshot: HtmlSnapshotRepositoryDependency,
 ):
     return ScrapingService(
         repo_car_platform=repo_car_platform,
         repo_scraping=repo_scraping,
         repo_car_model=repo_car_model,
+        repo_search_url_cache=repo_search_url_cache,
+        repo_dropdown_option=repo_dropdown_option,
+        repo_storage_state=repo_storage_state,
+        repo_html_snapshot=repo_html_snapshot,
+    )
+
+
+def create_scraping_service(session: AsyncSession) -> ScrapingService:
+    return ScrapingService(
+        repo_car_platform=CarPlatformRepository(session),
+        repo_scraping=ScrapingRepository(session),
+        repo_car_model=CarModelRepository(session),
+        repo_search_url_cache=SearchUrlCacheRepository(session),
+        repo_dropdown_option=DropdownOptionRepository(session),
+        repo_storage_state=PlatformStorageStateRepository(session),
+        repo_html_snapshot=HtmlSnapshotRepository(session),
     )
 
 
@@ -1,12 +1,48 @@
-from typing import List, Dict, Optional
+from typing import Any, Awaitable, Callable, List, Dict, Optional
+import asyncio
+import time
+from functools import lru_cache
 from playwright.async_api import BrowserContext, Page
-from bs4 import BeautifulSoup, Tag
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 import re
 from models.car_platform import CarPlatform
 from services.car_data_parser import CarDataParser
 from datetime import datetime, timezone
-from schemas.scraped_car_schema import ScrapedCarItem
+from schemas.scraped_car_schema import ScrapedCarItem, CarDataScrapeResult
 from services.logger_service import logger
+from services.page_pool import PagePool
+from services.resource_blocking import block_resources
+from services.http_client import http_client
+from services.html_parser import html_parser, TextElement
+from services.stage_timer import StageTimer
+from services.listing_index import url_encodes_search
+from schemas.dropdown_option_schema import DropdownOptionItem, normalize_option_text
+
+# Maps listing URLs to recently scraped data for the ones that need no reload
+ListingLookup = Callable[[List[str]], Awaitable[Dict[str, ScrapedCarItem]]]
+
+
+def find_indexed_option(
+    option_index: Optional[List[DropdownOptionItem]],
+    value: str,
+    allow_partial: bool = False,
+) -> Optional[DropdownOptionItem]:
+    # An exact match always wins, so "X5" does not pick "X5 M" listed before it;
+    # partial matches mirror the page lookups, which only allow them for native
+    # selects and brand lists
+    if not option_index:
+        return None
+    search_text = normalize_option_text(value)
+    exact = next(
+        (option for option in option_index if option.normalized_text == search_text),
+        None,
+    )
+    if exact is not None or not allow_partial:
+        return exact
+    return next(
+        (option for option in option_index if search_text in option.normalized_text),
+        None,
+    )
 
 
 async def select_option_or_click(
@@ -16,39 +52,68 @@ async def select_option_or_click(
     value: str,
     close_selector: Optional[str],
     is_selector_brand: bool = False,
-):
-    await page.wait_for_timeout(300)
+    max_wait_ms: int = 5000,
+    option_index: Optional[List[DropdownOptionItem]] = None,
+) -> Optional[List[DropdownOptionItem]]:
+    # Returns the options seen on the page when the index had no usable match
+    harvested_options: Optional[List[DropdownOptionItem]] = None
+
     if close_selector:
         await close_popup(page, close_selector)
 
     try:
-        await page.wait_for_selector(selector, state="visible")
+        await page.wait_for_selector(selector, state="visible", timeout=max_wait_ms)
         element = await page.locator(selector).first.element_handle()
         tag_name = await element.evaluate("el => el.tagName.toLowerCase()")
 
         if tag_name == "select":
-            options = await page.locator(selector).evaluate(
-                """el => el.options ? Array.from(el.options).map(opt => ({
-                    value: opt.value,
-                    text: opt.textContent.trim()
-                })) : []"""
-            )
-            option_value = await page.locator(selector).evaluate(
-                """(el, searchText) => {
-                    const options = Array.from(el.options);
-                    const matchingOption = options.find(opt => 
-                        opt.textContent.trim().toLowerCase().includes(searchText.toLowerCase())
-                    );
-                    return matchingOption ? matchingOption.value : null;
-                }""",
-                value,
-            )
-            if option_value:
-                await page.locator(selector).select_option(option_value)
-            else:
-                raise ValueError(
-                    f"Option '{value}' not found in select options: {options}"
-                )
+            indexed_option = find_indexed_option(option_index, value, allow_partial=True)
+            if indexed_option is not None:
+                try:
+                    await page.locator(selector).select_option(
+                        indexed_option.value, timeout=max_wait_ms
+                    )
+                except PlaywrightTimeoutError:
+                    indexed_option = None
+
+            if indexed_option is None:
+                # Options are often filled in by XHR after the previous field changes
+                try:
+                    option_handle = await page.wait_for_function(
+                        """([el, searchText]) => {
+                            const options = Array.from(el.options || []);
+                            const matchingOption = options.find(opt =>
+                                opt.textContent.trim().toLowerCase().includes(searchText.toLowerCase())
+                            );
+                            if (!matchingOption || !matchingOption.value) return null;
+                            return {
+                                value: matchingOption.value,
+                                options: options.map(opt => ({
+                                    value: opt.value,
+                                    text: opt.textContent.trim()
+                                })),
+                            };
+                        }""",
+                        arg=[element, value],
+                        timeout=max_wait_ms,
+                    )
+                    match = await option_handle.json_value()
+                except PlaywrightTimeoutError:
+                    options = await page.locator(selector).evaluate(
+                        """el => el.options ? Array.from(el.options).map(opt => ({
+                            value: opt.value,
+                            text: opt.textContent.trim()
+                        })) : []"""
+                    )
+                    raise ValueError(
+                        f"Option '{value}' not found in select options: {options}"
+                    )
+                await page.locator(selector).select_option(match["value"])
+                harvested_options = [
+                    DropdownOptionItem.from_text(option["text"], option["value"])
+                    for option in match["options"]
+                    if option["value"]
+                ]
         elif tag_name == "input":
             await page.locator(selector).first.click()
             await page.locator(selector).first.fill(value)
@@ -56,6 +121,9 @@ async def select_option_or_click(
         else:
             await page.locator(selector).first.click()
             if item_selector:
+                indexed_option = find_indexed_option(
+                    option_index, value, allow_partial=is_selector_brand
+                )
                 max_scroll_attempts = 100
 
                 list_items = page.locator(item_selector)
@@ -63,30 +131,48 @@ async def select_option_or_click(
                 parent_container = page.locator(
                     f"{item_selector} >> xpath=.. >> xpath=.."
                 ).first
-                await parent_container.wait_for(timeout=5000)
+                await parent_container.wait_for(timeout=max_wait_ms)
 
+                # Scrolling a long list stops at max_wait_ms like every other wait
+                deadline = time.monotonic() + max_wait_ms / 1000
                 for attempt in range(max_scroll_attempts):
                     try:
-                        target = list_items.get_by_text(re.compile(f"^{re.escape(value)}$", re.IGNORECASE)).first
-
-                        if is_selector_brand:
+                        if indexed_option is not None:
+                            target = list_items.get_by_text(
+                                indexed_option.text, exact=True
+                            ).first
+                        elif is_selector_brand:
                             target = list_items.get_by_text(re.compile(re.escape(value), re.IGNORECASE)).first
-                            
+                        else:
+                            target = list_items.get_by_text(re.compile(f"^{re.escape(value)}$", re.IGNORECASE)).first
+
                         await target.scroll_into_view_if_needed(timeout=200)
                         is_visible = await target.is_visible()
                         if is_visible:
+                            if indexed_option is None:
+                                item_texts = await list_items.evaluate_all(
+                                    "elements => elements.map(el => el.textContent.trim())"
+                                )
+                                harvested_options = [
+                                    DropdownOptionItem.from_text(text)
+                                    for text in item_texts
+                                    if text
+                                ]
                             await target.click()
                             break
                     except Exception:
-                        if attempt == max_scroll_attempts - 1:
+                        if (
+                            attempt == max_scroll_attempts - 1
+                            or time.monotonic() >= deadline
+                        ):
                             item_texts = await list_items.evaluate_all(
                                 "elements => elements.map(el => el.textContent.trim())"
                             )
                             logger.error(
-                                f"Value '{value}' not found in {item_selector} after {max_scroll_attempts} attempts. Available items: {item_texts}"
+                                f"Value '{value}' not found in {item_selector} after {attempt + 1} attempts. Available items: {item_texts}"
                             )
                             raise ValueError(
-                                f"Value '{value}' not found in {item_selector} after {max_scroll_attempts} attempts"
+                                f"Value '{value}' not found in {item_selector} after {attempt + 1} attempts"
                             )
 
                         await parent_container.evaluate(
@@ -96,11 +182,20 @@ async def select_option_or_click(
         if close_selector:
             await close_popup(page, close_selector)
 
+        return harvested_options
+
     except Exception as e:
         logger.error(f"Error occurred while interacting with selector {selector}: {str(e)}")
         raise RuntimeError(f"Failed to interact with selector {selector}: {str(e)}")
 
 
+async def wait_for_network_idle(page: Page, timeout_ms: int) -> None:
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout_ms)
+    except PlaywrightTimeoutError:
+        pass
+
+
 async def close_popup(page: Page, close_selector: str):
     try:
         close_btn = page.locator(close_selector)
@@ -110,106 +205,300 @@ async def close_popup(page: Page, close_selector: str):
         pass
 
 
+@lru_cache(maxsize=None)
+def url_domain(base_url: str) -> Optional[str]:
+    domain_match = re.match(r"https?://([^/]+)", base_url) if base_url else None
+    return domain_match.group(1) if domain_match else None
+
+
+# Runs inside the results page: every listing link in one round trip, with
+# relative links made absolute against the platform domain
+EXTRACT_LINKS_JS = """
+(elements, domain) => elements
+    .map(el => el.getAttribute("href"))
+    .filter(href => href)
+    .map(href => domain && !href.includes(domain)
+        ? `https://${domain}/${href.replace(/^\\/+/, "")}`
+        : href)
+"""
+
+
 async def scrape_car_list(
     page: Page,
     car_list_selector: str,
     url_to_details: str,
     base_url: str,
     button_selector: Optional[str],
+    max_wait_ms: int = 5000,
+    timeout_ms: Optional[int] = None,
 ) -> List[str]:
-    car_urls = []
     try:
-        await page.wait_for_timeout(500) if button_selector is None else 0
-
-        await page.wait_for_selector(car_list_selector, state="visible")
-        elements = await page.locator(f"{car_list_selector} {url_to_details}").all()
-
-        for element in elements:
-            url = await element.get_attribute("href")
-            if url and base_url:
-                domain_match = re.match(r"https?://([^/]+)", base_url)
-                if domain_match:
-                    domain = domain_match.group(1)
-                    if domain not in url:
-                        url = f"https://{domain}/{url.lstrip('/')}"
-            if url:
-                car_urls.append(url)
-        return car_urls
+        if button_selector is None:
+            # Results are refreshed in place after the last filter is applied
+            await wait_for_network_idle(page, max_wait_ms)
+
+        await page.wait_for_selector(
+            car_list_selector, state="visible", timeout=timeout_ms
+        )
+        return await page.locator(f"{car_list_selector} {url_to_details}").evaluate_all(
+            EXTRACT_LINKS_JS, url_domain(base_url)
+        )
     except Exception as e:
         logger.error(f"Error occurred while scraping car list: {str(e)}")
         raise RuntimeError(f"Failed to scrape car list: {str(e)}")
 
-def find_by_muliple_selectors(soup: BeautifulSoup, selectors: str) -> Optional[Tag]:
-    list_selectors = selectors.split(",")
-    for selector in list_selectors:
-        element = soup.select_one(selector)
-        if element:
-            return element
-    return None
-
-async def validate_views(views_element: Optional[Tag], page: Page, selectors: Dict[str, str]) -> Optional[int]:
-    if views_element:
-            views = CarDataParser.parse_text_for_views(views_element)
-    else:
-        for _ in range(20):
-            await page.mouse.wheel(0, 300)
-            await page.wait_for_timeout(100)
-            html_content = await page.content()
-            soup = BeautifulSoup(html_content, "html.parser")
-            views_element = find_by_muliple_selectors(soup, selectors["views"])
-            if views_element:
-                views = CarDataParser.parse_text_for_views(views_element)
-                break
-        else:
-            views = None
-    
-    if views == 0:
-        await page.wait_for_timeout(3000)
-        html_content = await page.content()
-        soup = BeautifulSoup(html_content, "html.parser")
-        views = CarDataParser.parse_text_for_views(
-            find_by_muliple_selectors(soup, selectors["views"])
+async def scrape_next_pages(
+    page: Page,
+    car_platform: CarPlatform,
+    car_urls: List[str],
+    max_listings: int,
+) -> List[str]:
+    # Follows the "next page" control on the results page one page at a time
+    seen = set(car_urls)
+    for _ in range(car_platform.max_result_pages - 1):
+        if len(seen) >= max_listings:
+            break
+        next_button = page.locator(car_platform.next_page_selector).first
+        if await next_button.count() == 0 or not await next_button.is_visible():
+            break
+        await next_button.click()
+        await wait_for_network_idle(page, car_platform.max_wait_ms)
+        try:
+            page_urls = await scrape_car_list(
+                page,
+                car_platform.car_list_selector,
+                car_platform.url_to_details,
+                car_platform.base_search_url,
+                car_platform.button_selector,
+                max_wait_ms=car_platform.max_wait_ms,
+                timeout_ms=car_platform.max_wait_ms,
+            )
+        except RuntimeError:
+            break
+        new_urls = [url for url in page_urls if url not in seen]
+        if not new_urls:
+            break
+        car_urls.extend(new_urls)
+        seen.update(new_urls)
+    return car_urls
+
+
+async def scrape_templated_pages(
+    context: BrowserContext,
+    results_url: str,
+    car_platform: CarPlatform,
+    car_urls: List[str],
+    max_listings: int,
+) -> List[str]:
+    # Result pages addressable by URL are loaded concurrently, a batch at a time
+    per_page = max(len(car_urls), 1)
+    seen = set(car_urls)
+    next_page = 2
+
+    async def scrape_result_page(result_page: Page, page_url: str) -> List[str]:
+        try:
+            await result_page.goto(page_url)
+            return await scrape_car_list(
+                result_page,
+                car_platform.car_list_selector,
+                car_platform.url_to_details,
+                car_platform.base_search_url,
+                car_platform.button_selector,
+                max_wait_ms=car_platform.max_wait_ms,
+                timeout_ms=car_platform.max_wait_ms,
             )
-        
-    return views
+        except Exception as e:
+            logger.warning(f"Failed to scrape result page {page_url}: {str(e)}")
+            return []
+
+    async with PagePool(
+        context,
+        car_platform.detail_pages_concurrency,
+        setup_page=lambda result_page: block_resources(result_page, car_platform),
+    ) as pool:
+        while len(seen) < max_listings and next_page <= car_platform.max_result_pages:
+            pages_needed = -(-(max_listings - len(seen)) // per_page)
+            last_page = min(next_page + pages_needed - 1, car_platform.max_result_pages)
+            page_urls = [
+                car_platform.page_url_template.format(url=results_url, page=number)
+                for number in range(next_page, last_page + 1)
+            ]
+            next_page = last_page + 1
+
+            exhausted = False
+            for urls in await pool.map(scrape_result_page, page_urls):
+                new_urls = [url for url in urls if url not in seen]
+                if not new_urls:
+                    exhausted = True
+                    break
+                car_urls.extend(new_urls)
+                seen.update(new_urls)
+            if exhausted:
+                break
+    return car_urls
+
+
+def find_by_muliple_selectors(soup: Any, selectors: str) -> Optional[Any]:
+    return html_parser.select_first(soup, selectors)
+
+# Runs inside the detail page: resolves every field selector and returns only the
+# matched text. When the views counter is missing or still zero, the page is
+# scrolled while a MutationObserver waits for it instead of re-serializing the DOM.
+EXTRACT_DETAILS_JS = """
+async ({ selectors, maxWaitMs, scrollStep, maxScrolls }) => {
+    const unsupported = [];
+    const find = (field) => {
+        for (const selector of selectors[field].split(",")) {
+            const trimmed = selector.trim();
+            if (!trimmed) continue;
+            try {
+                const el = document.querySelector(trimmed);
+                if (el) return el;
+            } catch (e) {
+                if (!unsupported.includes(field)) unsupported.push(field);
+            }
+        }
+        return null;
+    };
+    const describe = (el) => {
+        if (!el) return null;
+        const parts = [];
+        const walker = document.createTreeWalker(el, NodeFilter.SHOW_TEXT);
+        while (walker.nextNode()) {
+            const text = walker.currentNode.textContent.trim();
+            if (text) parts.push(text);
+        }
+        return { text: parts.join(""), childCount: el.childNodes.length };
+    };
+    const viewsReady = () => {
+        const el = find("views");
+        return el && /[1-9]/.test(el.textContent) ? el : null;
+    };
+
+    let views = viewsReady();
+    let viewsWaitMs = 0;
+    if (!views && !unsupported.includes("views")) {
+        const waitStart = performance.now();
+        views = await new Promise((resolve) => {
+            let scrolls = 0;
+            const finish = (el) => {
+                observer.disconnect();
+                clearInterval(scroller);
+                clearTimeout(deadline);
+                resolve(el);
+            };
+            const observer = new MutationObserver(() => {
+                const el = viewsReady();
+                if (el) finish(el);
+            });
+            observer.observe(document.documentElement, {
+                childList: true, subtree: true, characterData: true,
+            });
+            const scroller = setInterval(() => {
+                if (scrolls++ < maxScrolls) window.scrollBy(0, scrollStep);
+            }, 100);
+            const deadline = setTimeout(() => finish(find("views")), maxWaitMs);
+        });
+        viewsWaitMs = performance.now() - waitStart;
+    }
+
+    return {
+        year: describe(find("year")),
+        price: describe(find("price")),
+        mileage: describe(find("mileage")),
+        views: describe(views),
+        unsupported,
+        viewsWaitMs,
+    };
+}
+"""
+
+
+def build_car_item(url: str, elements: Dict[str, Optional[Any]]) -> ScrapedCarItem:
+    year = CarDataParser.parse_text_for_year(elements["year"])
+    price, currency = CarDataParser.parse_text_for_price(elements["price"])
+    mileage, mileage_unit = CarDataParser.parse_text_for_mileage(elements["mileage"])
+    views = (
+        CarDataParser.parse_text_for_views(elements["views"])
+        if elements["views"]
+        else None
+    )
+
+    return ScrapedCarItem(
+        url=url,
+        year=year,
+        price=price,
+        currency=currency,
+        mileage=mileage,
+        mileage_unit=mileage_unit,
+        views=views,
+        scraped_at=datetime.now(timezone.utc),
+    )
+
+
+def detail_selectors(car_platform: CarPlatform) -> Dict[str, str]:
+    return {
+        "year": car_platform.year_bs4_selector,
+        "price": car_platform.price_bs4_selector,
+        "mileage": car_platform.mileage_bs4_selector,
+        "views": car_platform.views_bs4_selector,
+    }
+
+
+def parse_car_details(
+    soup: Any, url: str, selectors: Dict[str, str]
+) -> ScrapedCarItem:
+    elements = {
+        field: find_by_muliple_selectors(soup, field_selectors)
+        for field, field_selectors in selectors.items()
+    }
+    return build_car_item(url, elements)
+
 
 async def scrape_car_details(
     page: Page,
     url: str,
     selectors: Dict[str, str],
+    max_wait_ms: int = 5000,
+    timer: Optional[StageTimer] = None,
+    capture_html: bool = False,
 ) -> ScrapedCarItem | Dict[str, str]:
+    timer = timer or StageTimer()
     try:
-        await page.goto(url)
-        html_content = await page.content()
-        soup = BeautifulSoup(html_content, "html.parser")
-
-        # Extract year
-        year_element = find_by_muliple_selectors(soup, selectors["year"])
-        year = CarDataParser.parse_text_for_year(year_element)
-
-        # Extract price
-        price_element = find_by_muliple_selectors(soup, selectors["price"])
-        price, currency = CarDataParser.parse_text_for_price(price_element)
-
-        # Extract mileage
-        mileage_element = find_by_muliple_selectors(soup, selectors["mileage"])
-        mileage, mileage_unit = CarDataParser.parse_text_for_mileage(mileage_element)
-
-        # Extract views with scrolling if needed
-        views_element = find_by_muliple_selectors(soup, selectors["views"])
-
-        views = await validate_views(views_element, page, selectors)            
-
-        scrape_car_data = ScrapedCarItem(
-            url=url,
-            year=year,
-            price=price,
-            currency=currency,
-            mileage=mileage,
-            mileage_unit=mileage_unit,
-            views=views,
-            scraped_at=datetime.now(timezone.utc),
-        )
+        html_content: Optional[str] = None
+        with timer.stage("detail_navigation"):
+            await page.goto(url)
+        with timer.stage("detail_extraction"):
+            extracted = await page.evaluate(
+                EXTRACT_DETAILS_JS,
+                {
+                    "selectors": selectors,
+                    "maxWaitMs": max_wait_ms,
+                    "scrollStep": 300,
+                    "maxScrolls": 20,
+                },
+            )
+        if extracted["viewsWaitMs"]:
+            # Part of detail_extraction, reported separately as it is mostly idle
+            timer.add("views_wait", extracted["viewsWaitMs"] / 1000)
+        elements = {
+            field: TextElement.from_extracted(extracted[field])
+            for field in selectors
+        }
+
+        if extracted["unsupported"]:
+            # Selectors using bs4-only syntax are resolved on a DOM snapshot
+            with timer.stage("detail_fallback_parse"):
+                html_content = await page.content()
+                soup = html_parser.parse(html_content)
+                for field in extracted["unsupported"]:
+                    elements[field] = find_by_muliple_selectors(soup, selectors[field])
+
+        scrape_car_data = build_car_item(url, elements)
+        if capture_html:
+            # Serialized after extraction, so lazily loaded fields are included
+            with timer.stage("snapshot_capture"):
+                scrape_car_data.html = html_content or await page.content()
 
         logger.info(f"Scraped data for {url}: {scrape_car_data}")
         return scrape_car_data
@@ -217,91 +506,270 @@ async def scrape_car_details(
         return {"url": url, "error": str(e)}
 
 
-async def scrape_car_data(
-    context: BrowserContext,
+async def fetch_car_details(
+    url: str,
+    selectors: Dict[str, str],
+    timer: Optional[StageTimer] = None,
+    capture_html: bool = False,
+) -> ScrapedCarItem | Dict[str, str]:
+    timer = timer or StageTimer()
+    try:
+        with timer.stage("detail_navigation"):
+            html_content = await http_client.fetch_html(url)
+        with timer.stage("detail_extraction"):
+            soup = html_parser.parse(html_content)
+            scrape_car_data = parse_car_details(soup, url, selectors)
+        if capture_html:
+            scrape_car_data.html = html_content
+
+        logger.info(f"Fetched data for {url}: {scrape_car_data}")
+        return scrape_car_data
+    except Exception as e:
+        return {"url": url, "error": str(e)}
+
+
+async def fill_search_form(
+    page: Page,
     car_platform: CarPlatform,
     brand: str,
     model: str,
     year_from: int,
     year_to: int,
-) -> list[ScrapedCarItem]:
-    page: Optional[Page] = None
-    try:
-        logger.info(f"Scraping {brand} {model} on {car_platform.name}")
-        page = await context.new_page()
-
+    option_indexes: Optional[Dict[str, List[DropdownOptionItem]]] = None,
+    skip_popups: bool = False,
+    timer: Optional[StageTimer] = None,
+) -> Dict[str, List[DropdownOptionItem]]:
+    option_indexes = option_indexes or {}
+    harvested_options: Dict[str, List[DropdownOptionItem]] = {}
+    close_selector = None if skip_popups else car_platform.close_selector
+    timer = timer or StageTimer()
+
+    with timer.stage("navigation"):
         await page.goto(car_platform.base_search_url)
 
-        # Interact with form elements
-        await select_option_or_click(
+    # Interact with form elements
+    with timer.stage("form_brand"):
+        brand_options = await select_option_or_click(
             page,
             car_platform.brand_selector,
             car_platform.brand_item_selector,
             brand,
-            car_platform.close_selector,
+            close_selector,
             is_selector_brand=True,
+            max_wait_ms=car_platform.max_wait_ms,
+            option_index=option_indexes.get("brand"),
         )
-        await select_option_or_click(
+    if brand_options:
+        harvested_options["brand"] = brand_options
+    with timer.stage("form_model"):
+        model_options = await select_option_or_click(
             page,
             car_platform.model_selector,
             car_platform.model_item_selector,
             model,
-            car_platform.close_selector,
+            close_selector,
+            max_wait_ms=car_platform.max_wait_ms,
+            option_index=option_indexes.get("model"),
         )
+    if model_options:
+        harvested_options["model"] = model_options
+    with timer.stage("form_year_from"):
         await select_option_or_click(
             page,
             car_platform.year_from_selector,
             car_platform.year_from_item_selector,
             str(year_from),
-            car_platform.close_selector,
+            close_selector,
+            max_wait_ms=car_platform.max_wait_ms,
         )
+    with timer.stage("form_year_to"):
         await select_option_or_click(
             page,
             car_platform.year_to_selector,
             car_platform.year_to_item_selector,
             str(year_to),
-            car_platform.close_selector,
+            close_selector,
+            max_wait_ms=car_platform.max_wait_ms,
         )
 
-        if car_platform.button_selector:
-            await page.wait_for_selector(car_platform.button_selector)
+    if car_platform.button_selector:
+        with timer.stage("search_submit"):
+            await page.wait_for_selector(
+                car_platform.button_selector, timeout=car_platform.max_wait_ms
+            )
             await page.locator(car_platform.button_selector).click()
-            await page.wait_for_timeout(5000)
+            await wait_for_network_idle(page, car_platform.max_wait_ms)
+
+    return harvested_options
 
 
-        car_urls = await scrape_car_list(
+async def scrape_cached_search(
+    page: Page, car_platform: CarPlatform, cached_search_url: str
+) -> List[str]:
+    try:
+        await page.goto(cached_search_url)
+        return await scrape_car_list(
             page,
             car_platform.car_list_selector,
             car_platform.url_to_details,
             car_platform.base_search_url,
-            car_platform.button_selector,
+            None,
+            max_wait_ms=car_platform.max_wait_ms,
+            timeout_ms=car_platform.max_wait_ms,
+        )
+    except Exception as e:
+        logger.info(
+            f"Cached search URL failed on {car_platform.name}, using the form: {str(e)}"
         )
+        return []
+
+
+async def scrape_car_data(
+    context: BrowserContext,
+    car_platform: CarPlatform,
+    brand: str,
+    model: str,
+    year_from: int,
+    year_to: int,
+    max_listings: int = 10,
+    cached_search_url: Optional[str] = None,
+    option_indexes: Optional[Dict[str, List[DropdownOptionItem]]] = None,
+    skip_popups: bool = False,
+    timer: Optional[StageTimer] = None,
+    capture_html: bool = False,
+    lookup_listings: Optional[ListingLookup] = None,
+) -> CarDataScrapeResult:
+    page: Optional[Page] = None
+    timer = timer or StageTimer()
+    try:
+        logger.info(f"Scraping {brand} {model} on {car_platform.name}")
+        page = await context.new_page()
+        await block_resources(page, car_platform)
+
+        car_urls: List[str] = []
+        search_url_from_cache = False
+        harvested_options: Dict[str, List[DropdownOptionItem]] = {}
+        if cached_search_url:
+            with timer.stage("cached_search"):
+                car_urls = await scrape_cached_search(page, car_platform, cached_search_url)
+            search_url_from_cache = bool(car_urls)
+
+        if not car_urls:
+            harvested_options = await fill_search_form(
+                page,
+                car_platform,
+                brand,
+                model,
+                year_from,
+                year_to,
+                option_indexes,
+                skip_popups=skip_popups,
+                timer=timer,
+            )
+
+            with timer.stage("list_extraction"):
+                car_urls = await scrape_car_list(
+                    page,
+                    car_platform.car_list_selector,
+                    car_platform.url_to_details,
+                    car_platform.base_search_url,
+                    car_platform.button_selector,
+                    max_wait_ms=car_platform.max_wait_ms,
+                )
 
         if not car_urls:
             raise RuntimeError(
                 f"No cars found for {brand} {model} on {car_platform.name}"
             )
 
+        # Only a results page whose URL carries the search can be revisited directly
+        results_url = page.url
+        search_url = (
+            results_url
+            if url_encodes_search(
+                results_url, car_platform.base_search_url, brand, model
+            )
+            else None
+        )
+        if search_url is None and not search_url_from_cache:
+            logger.info(
+                f"Results URL of {car_platform.name} does not carry the search, "
+                "not caching it"
+            )
+
+        # Promoted listings can repeat on a page, keep the first occurrence
+        car_urls = list(dict.fromkeys(car_urls))
+        if len(car_urls) < max_listings:
+            with timer.stage("pagination"):
+                if car_platform.page_url_template:
+                    car_urls = await scrape_templated_pages(
+                        context, results_url, car_platform, car_urls, max_listings
+                    )
+                elif car_platform.next_page_selector:
+                    car_urls = await scrape_next_pages(
+                        page, car_platform, car_urls, max_listings
+                    )
+        car_urls = car_urls[:max_listings]
+
+        reused: Dict[str, ScrapedCarItem] = {}
+        if lookup_listings is not None:
+            with timer.stage("listing_lookup"):
+                reused = await lookup_listings(car_urls)
+        urls_to_visit = [url for url in car_urls if url not in reused]
+
         # Scrape details for each car
-        selectors = {
-            "year": car_platform.year_bs4_selector,
-            "price": car_platform.price_bs4_selector,
-            "mileage": car_platform.mileage_bs4_selector,
-            "views": car_platform.views_bs4_selector,
-        }
+        selectors = detail_selectors(car_platform)
+
+        if car_platform.render_mode == "http":
+            # Detail pages are server-rendered, the browser is only needed for the form
+            detail_semaphore = asyncio.Semaphore(car_platform.detail_pages_concurrency)
+
+            async def fetch_with_limit(url: str):
+                async with detail_semaphore:
+                    return await fetch_car_details(url, selectors, timer, capture_html)
 
+            with timer.stage("details"):
+                details = await asyncio.gather(
+                    *(fetch_with_limit(url) for url in urls_to_visit)
+                )
+        else:
+            with timer.stage("details"):
+                async with PagePool(
+                    context,
+                    car_platform.detail_pages_concurrency,
+                    setup_page=lambda detail_page: block_resources(detail_page, car_platform),
+                ) as pool:
+                    details = await pool.map(
+                        lambda detail_page, url: scrape_car_details(
+                            detail_page,
+                            url,
+                            selectors,
+                            car_platform.max_wait_ms,
+                            timer,
+                            capture_html,
+                        ),
+                        urls_to_visit,
+                    )
+
+        details_by_url = {**dict(zip(urls_to_visit, details)), **reused}
         car_results: list[ScrapedCarItem] = []
-        for url in car_urls[:10]:
-            car_data = await scrape_car_details(page, url, selectors)
+        for search_position, url in enumerate(car_urls, 1):
+            car_data = details_by_url[url]
             if isinstance(car_data, dict) and "error" in car_data:
                 logger.warning(f"Failed to scrape car at {url}: {car_data['error']}")
             elif isinstance(car_data, ScrapedCarItem) and car_data.year is not None and car_data.price is not None:
+                car_data.search_position = search_position
                 car_results.append(car_data)
 
         if not car_results:
             raise RuntimeError(f"No valid car data retrieved from {car_platform.name}")
 
-        return car_results
+        return CarDataScrapeResult(
+            cars=car_results,
+            search_url=search_url,
+            search_url_from_cache=search_url_from_cache,
+            harvested_options=harvested_options,
+        )
 
     except RuntimeError as e:
         raise e
@@ -0,0 +1,244 @@
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing.managers import SyncManager
+from queue import Queue
+from threading import Event
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional
+from common.app_settings import settings
+from db import SessionLocal, engine
+from schemas.scraped_car_schema import (
+    ScrapingConfigByQuery,
+    ScrapingResultSuccess,
+    ScrapingResultError,
+)
+from services.browser_pool import BrowserPool
+from services.http_client import http_client
+from services.logger_service import logger
+from services.rate_limiter import platform_limiters
+from services.stage_timer import stage_histograms
+
+ShardResult = ScrapingResultSuccess | ScrapingResultError | BaseException
+
+CANCEL_POLL_SECONDS = 0.5
+
+
+@dataclass
+class ShardTask:
+    car_id: int
+    car_platform_id: int
+    scrape_request_id: int
+    config: ScrapingConfigByQuery
+    # Number of worker processes scraping this platform in the same run
+    platform_shares: int = 1
+
+
+async def _watch_cancel(cancel_event: Event, scrapes: List[asyncio.Task]) -> None:
+    # The parent sets the event when its run is cancelled (job cancel, stream
+    # disconnect); is_set() is a manager round trip, so it is polled off the loop
+    while not await asyncio.to_thread(cancel_event.is_set):
+        await asyncio.sleep(CANCEL_POLL_SECONDS)
+    logger.info(f"Scraping worker cancelling {len(scrapes)} task(s)")
+    for scrape in scrapes:
+        scrape.cancel()
+
+
+async def _run_shard(
+    tasks: List[ShardTask],
+    headless: bool,
+    results_queue: Optional[Queue] = None,
+    cancel_event: Optional[Event] = None,
+) -> List[ShardResult]:
+    # Imported here because scraping_service imports this module
+    from services.scraping_service import background_tasks, create_scraping_service
+
+    for task in tasks:
+        platform_limiters.set_shares(task.car_platform_id, task.platform_shares)
+
+    loop = asyncio.get_running_loop()
+    pending_puts: List[asyncio.Future] = []
+
+    def forward_result(result: ScrapingResultSuccess | ScrapingResultError) -> None:
+        # put() is a blocking manager round trip; keep it off the event loop
+        pending_puts.append(loop.run_in_executor(None, results_queue.put, result))
+
+    pool = BrowserPool(
+        size=1,
+        context_max_pages=settings.BROWSER_CONTEXT_MAX_PAGES,
+        lease_timeout=settings.BROWSER_LEASE_TIMEOUT_SECONDS,
+    )
+    await pool.start()
+    await http_client.start()
+    watcher: Optional[asyncio.Task] = None
+    try:
+        async with SessionLocal() as session:
+            service = create_scraping_service(session)
+            car_platforms = {
+                cp.id: cp for cp in await service.repo_car_platform.get_all_car_platforms()
+            }
+
+            async with pool.lease(headless=headless) as context:
+                scrapes = [
+                    asyncio.create_task(
+                        service.scrape_single_car_platform(
+                            context=context,
+                            car_platform=car_platforms[task.car_platform_id],
+                            config=task.config,
+                            scrape_request_id=task.scrape_request_id,
+                            car_id=task.car_id,
+                            # Streamed to the parent as each task finishes
+                            on_result=(
+                                forward_result if results_queue is not None else None
+                            ),
+                        )
+                    )
+                    for task in tasks
+                ]
+                if cancel_event is not None:
+                    watcher = asyncio.create_task(_watch_cancel(cancel_event, scrapes))
+                results = await asyncio.gather(*scrapes, return_exceptions=True)
+        if background_tasks:
+            await asyncio.gather(*background_tasks, return_exceptions=True)
+        # Every result is on the queue before the parent sees the shard return
+        await asyncio.gather(*pending_puts, return_exceptions=True)
+    finally:
+        if watcher is not None:
+            watcher.cancel()
+            await asyncio.gather(watcher, return_exceptions=True)
+        await http_client.stop()
+        await pool.stop()
+        await engine.dispose()
+
+    # Exceptions like HTTPException do not always survive pickling
+    return [
+        RuntimeError("Scrape cancelled" if isinstance(r, asyncio.CancelledError) else str(r))
+        if isinstance(r, BaseException)
+        else r
+        for r in results
+    ]
+
+
+def run_shard(
+    tasks: List[ShardTask],
+    headless: bool,
+    results_queue: Optional[Queue] = None,
+    cancel_event: Optional[Event] = None,
+) -> List[ShardResult]:
+    return asyncio.run(_run_shard(tasks, headless, results_queue, cancel_event))
+
+
+class ScrapingWorkerPool:
+    def __init__(self, processes: int):
+        self.processes = processes
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._manager: Optional[SyncManager] = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._executor is not None
+
+    async def start(self) -> None:
+        if self.processes < 1 or self._executor is not None:
+            return
+        # spawn: forking a process with a running event loop and Playwright is unsafe
+        mp_context = multiprocessing.get_context("spawn")
+        self._manager = await asyncio.to_thread(mp_context.Manager)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.processes, mp_context=mp_context
+        )
+        logger.info(f"Scraping worker pool started with {self.processes} process(es)")
+
+    async def stop(self) -> None:
+        if self._executor is None:
+            return
+        executor, self._executor = self._executor, None
+        await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+        if self._manager is not None:
+            manager, self._manager = self._manager, None
+            await asyncio.to_thread(manager.shutdown)
+        logger.info("Scraping worker pool stopped")
+
+    async def run(
+        self,
+        tasks: List[ShardTask],
+        car_platforms: List,
+        headless: bool,
+        on_result: Optional[
+            Callable[[ScrapingResultSuccess | ScrapingResultError], None]
+        ] = None,
+    ) -> List[ShardResult]:
+        if self._executor is None:
+            raise RuntimeError("Scraping worker pool is not running")
+        if not tasks:
+            return []
+
+        # A platform's tasks are spread over as many processes as its limits
+        # allow, each child limiter then gets an equal part of those limits
+        limits = {cp.id: cp for cp in car_platforms}
+        tasks_by_platform: Dict[int, List[ShardTask]] = {}
+        for task in tasks:
+            tasks_by_platform.setdefault(task.car_platform_id, []).append(task)
+        shards: List[List[ShardTask]] = [[] for _ in range(self.processes)]
+        next_shard = 0
+        for platform_id, platform_tasks in tasks_by_platform.items():
+            car_platform = limits[platform_id]
+            shares = min(
+                self.processes,
+                len(platform_tasks),
+                car_platform.max_concurrency,
+                car_platform.requests_per_minute,
+            )
+            for i, task in enumerate(platform_tasks):
+                task.platform_shares = shares
+                shards[(next_shard + i % shares) % self.processes].append(task)
+            next_shard = (next_shard + shares) % self.processes
+        shards = [shard for shard in shards if shard]
+        loop = asyncio.get_running_loop()
+
+        async def run_one(shard: List[ShardTask]) -> List[ShardResult]:
+            try:
+                return await loop.run_in_executor(
+                    self._executor, run_shard, shard, headless, results_queue, cancel_event
+                )
+            except Exception as e:
+                logger.error(f"Scraping worker failed on {len(shard)} task(s): {str(e)}")
+                return [e] * len(shard)
+
+        # Children put each result on a managed queue as soon as its task ends,
+        # so callers see them one by one instead of once per finished shard
+        results_queue = self._manager.Queue()
+        # Cancelling this coroutine only abandons the executor futures; the event
+        # tells the children to stop scraping for a job nobody is waiting on
+        cancel_event = self._manager.Event()
+        forwarder = asyncio.create_task(self._forward_results(results_queue, on_result))
+        try:
+            shard_results = await asyncio.gather(*[run_one(s) for s in shards])
+        except asyncio.CancelledError:
+            cancel_event.set()
+            raise
+        finally:
+            results_queue.put(None)
+            await forwarder
+
+        return [result for results in shard_results for result in results]
+
+    async def _forward_results(
+        self,
+        results_queue: Queue,
+        on_result: Optional[
+            Callable[[ScrapingResultSuccess | ScrapingResultError], None]
+        ],
+    ) -> None:
+        while True:
+            result = await asyncio.to_thread(results_queue.get)
+            if result is None:
+                return
+            # Histograms observed in the child process die with it
+            for stage, seconds in result.stage_timings.items():
+                stage_histograms.observe(result.marketplace_name, stage, seconds)
+            if on_result is not None:
+                on_result(result)
+
+
+scraping_worker_pool = ScrapingWorkerPool(processes=settings.SCRAPING_WORKER_PROCESSES)
@@ -0,0 +1,155 @@
+import asyncio
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Annotated, Dict, List, Optional, Tuple
+from fastapi import Depends
+from common.app_settings import settings
+from crud.car_platform_repository import CarPlatformRepositoryDependency
+from crud.html_snapshot_repository import HtmlSnapshotRepositoryDependency
+from schemas.html_snapshot_schema import (
+    HtmlSnapshotReparseRequest,
+    HtmlSnapshotReparseResult,
+)
+from services.html_parser import html_parser
+from services.html_snapshot import decompress_html
+from services.scraping_utils import detail_selectors, parse_car_details
+from services.logger_service import logger
+
+ParsedFields = Dict[str, Optional[int | str]]
+
+
+def parse_snapshots(
+    snapshots: List[Tuple[str, bytes]], selectors: Dict[str, str]
+) -> Dict[str, Optional[ParsedFields]]:
+    # Runs in a worker process; a snapshot that fails to parse maps to None
+    parsed: Dict[str, Optional[ParsedFields]] = {}
+    for snapshot_hash, content in snapshots:
+        try:
+            car = parse_car_details(
+                html_parser.parse(decompress_html(content)), "", selectors
+            )
+        except Exception:
+            parsed[snapshot_hash] = None
+            continue
+        parsed[snapshot_hash] = {
+            "scraped_year": car.year,
+            "scraped_price": car.price,
+            "scraped_currency": car.currency,
+            "scraped_mileage": car.mileage,
+            "scraped_mileage_unit": car.mileage_unit,
+            "scraped_number_of_views": car.views,
+        }
+    return parsed
+
+
+class SnapshotReparseService:
+    def __init__(
+        self,
+        repo_html_snapshot: HtmlSnapshotRepositoryDependency,
+        repo_car_platform: CarPlatformRepositoryDependency,
+    ):
+        self.repo_html_snapshot = repo_html_snapshot
+        self.repo_car_platform = repo_car_platform
+
+    async def reparse(
+        self, criteria: HtmlSnapshotReparseRequest
+    ) -> HtmlSnapshotReparseResult:
+        start_time = time.perf_counter()
+        if criteria.car_platform_id is not None:
+            await self.repo_car_platform.get_car_platform_by_id(criteria.car_platform_id)
+        selectors_by_platform = {
+            cp.id: detail_selectors(cp)
+            for cp in await self.repo_car_platform.get_all_car_platforms()
+        }
+        processes = settings.HTML_REPARSE_PROCESSES or os.cpu_count() or 1
+        result = HtmlSnapshotReparseResult(
+            scraped_cars_checked=0,
+            snapshots_parsed=0,
+            scraped_cars_updated=0,
+            scraped_cars_unparseable=0,
+            missing_snapshots=0,
+            time_to_reparse_seconds=0.0,
+        )
+
+        loop = asyncio.get_running_loop()
+        # spawn: forking a process with a running event loop is unsafe
+        executor = ProcessPoolExecutor(
+            max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+        )
+        try:
+            after_id = 0
+            while True:
+                scraped_cars = await self.repo_html_snapshot.fetch_scraped_cars_with_snapshots(
+                    criteria, after_id, settings.HTML_REPARSE_BATCH_SIZE
+                )
+                if not scraped_cars:
+                    break
+                after_id = scraped_cars[-1].id
+                result.scraped_cars_checked += len(scraped_cars)
+
+                contents = await self.repo_html_snapshot.get_snapshot_contents(
+                    list({car.snapshot_hash for car in scraped_cars})
+                )
+                # A page scraped repeatedly without changes is parsed once
+                hashes_by_platform: Dict[int, List[str]] = {}
+                for car in scraped_cars:
+                    hashes = hashes_by_platform.setdefault(car.car_platform_id, [])
+                    if car.snapshot_hash in contents and car.snapshot_hash not in hashes:
+                        hashes.append(car.snapshot_hash)
+
+                chunks = []
+                for car_platform_id, hashes in hashes_by_platform.items():
+                    chunk_size = max(1, -(-len(hashes) // processes))
+                    for i in range(0, len(hashes), chunk_size):
+                        chunks.append((car_platform_id, hashes[i : i + chunk_size]))
+                chunk_results = await asyncio.gather(
+                    *[
+                        loop.run_in_executor(
+                            executor,
+                            parse_snapshots,
+                            [(h, contents[h]) for h in hashes],
+                            selectors_by_platform[car_platform_id],
+                        )
+                        for car_platform_id, hashes in chunks
+                    ]
+                )
+                parsed: Dict[Tuple[int, str], Optional[ParsedFields]] = {}
+                for (car_platform_id, _), chunk_parsed in zip(chunks, chunk_results):
+                    for snapshot_hash, fields in chunk_parsed.items():
+                        parsed[(car_platform_id, snapshot_hash)] = fields
+                result.snapshots_parsed += len(parsed)
+
+                updates = []
+                for car in scraped_cars:
+                    if car.snapshot_hash not in contents:
+                        result.missing_snapshots += 1
+                        continue
+                    fields = parsed[(car.car_platform_id, car.snapshot_hash)]
+                    # A broken selector must not wipe fields that were parsed before
+                    if (
+                        fields is None
+                        or fields["scraped_year"] is None
+                        or fields["scraped_price"] is None
+                    ):
+                        result.scraped_cars_unparseable += 1
+                        continue
+                    if any(getattr(car, key) != value for key, value in fields.items()):
+                        updates.append({"id": car.id, **fields})
+                await self.repo_html_snapshot.update_scraped_cars(updates)
+                result.scraped_cars_updated += len(updates)
+        finally:
+            await asyncio.to_thread(executor.shutdown, cancel_futures=True)
+
+        result.time_to_reparse_seconds = round(time.perf_counter() - start_time, 3)
+        logger.info(
+            f"Re-parsed {result.snapshots_parsed} HTML snapshot(s) with {processes} "
+            f"process(es), updated {result.scraped_cars_updated} scraped car(s)"
+        )
+        return result
+
+
+SnapshotReparseServiceDependency = Annotated[
+    SnapshotReparseService, Depends(SnapshotReparseService)
+]
@@ -0,0 +1,68 @@
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+from schemas.stage_timing_schema import HistogramBucket, StageHistogram
+
+HISTOGRAM_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120)
+
+
+# Wall-clock seconds per pipeline stage of one platform scrape. Stages that run
+# concurrently (detail pages) add up, so their total can exceed the scrape time
+class StageTimer:
+    def __init__(self):
+        self.seconds: Dict[str, float] = {}
+        self.counts: Dict[str, int] = {}
+
+    def add(self, stage: str, seconds: float, count: int = 1) -> None:
+        self.seconds[stage] = self.seconds.get(stage, 0.0) + seconds
+        self.counts[stage] = self.counts.get(stage, 0) + count
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def rounded(self) -> Dict[str, float]:
+        return {stage: round(seconds, 3) for stage, seconds in self.seconds.items()}
+
+
+class StageHistograms:
+    def __init__(self, buckets: Tuple[float, ...] = HISTOGRAM_BUCKETS):
+        self.buckets = buckets
+        self._counts: Dict[Tuple[str, str], List[int]] = {}
+        self._sums: Dict[Tuple[str, str], float] = {}
+
+    def observe(self, car_platform_name: str, stage: str, seconds: float) -> None:
+        key = (car_platform_name, stage)
+        counts = self._counts.setdefault(key, [0] * (len(self.buckets) + 1))
+        counts[bisect_left(self.buckets, seconds)] += 1
+        self._sums[key] = self._sums.get(key, 0.0) + seconds
+
+    def observe_timer(self, car_platform_name: str, timer: StageTimer) -> None:
+        for stage, seconds in timer.seconds.items():
+            self.observe(car_platform_name, stage, seconds)
+
+    def snapshot(self) -> List[StageHistogram]:
+        histograms = []
+        for (car_platform_name, stage), counts in sorted(self._counts.items()):
+            cumulative, buckets = 0, []
+            for bound, count in zip((*self.buckets, None), counts):
+                cumulative += count
+                buckets.append(HistogramBucket(le=bound, count=cumulative))
+            histograms.append(
+                StageHistogram(
+                    car_platform_name=car_platform_name,
+                    stage=stage,
+                    count=cumulative,
+                    sum_seconds=round(self._sums[(car_platform_name, stage)], 3),
+                    buckets=buckets,
+                )
+            )
+        return histograms
+
+
+stage_histograms = StageHistograms()
@@ -0,0 +1,70 @@
+import json
+import weakref
+from typing import Set
+from urllib.parse import urlparse
+from playwright.async_api import BrowserContext
+from models.car_platform import CarPlatform
+
+# Pooled contexts are shared by every platform: localStorage is restored by an
+# origin-guarded init script, added once per platform and context
+_platforms_with_init_script: "weakref.WeakKeyDictionary[BrowserContext, Set[int]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+RESTORE_LOCAL_STORAGE_JS = """
+(origins) => {
+    const items = origins[location.origin];
+    if (!items) return;
+    for (const { name, value } of items) {
+        try {
+            if (localStorage.getItem(name) === null) localStorage.setItem(name, value);
+        } catch (e) {}
+    }
+}
+"""
+
+
+def platform_host(car_platform: CarPlatform) -> str:
+    return urlparse(car_platform.base_search_url).hostname or ""
+
+
+def belongs_to_host(domain: str, host: str) -> bool:
+    domain = domain.lstrip(".")
+    return host == domain or host.endswith("." + domain) or domain.endswith("." + host)
+
+
+def filter_storage_state(storage_state: dict, host: str) -> dict:
+    return {
+        "cookies": [
+            cookie
+            for cookie in storage_state.get("cookies", [])
+            if belongs_to_host(cookie["domain"], host)
+        ],
+        "origins": [
+            origin
+            for origin in storage_state.get("origins", [])
+            if belongs_to_host(urlparse(origin["origin"]).hostname or "", host)
+        ],
+    }
+
+
+async def capture_storage_state(context: BrowserContext, car_platform: CarPlatform) -> dict:
+    return filter_storage_state(await context.storage_state(), platform_host(car_platform))
+
+
+async def apply_storage_state(
+    context: BrowserContext, car_platform: CarPlatform, storage_state: dict
+) -> None:
+    if storage_state.get("cookies"):
+        await context.add_cookies(storage_state["cookies"])
+
+    applied = _platforms_with_init_script.setdefault(context, set())
+    if storage_state.get("origins") and car_platform.id not in applied:
+        origins = {
+            origin["origin"]: origin.get("localStorage", [])
+            for origin in storage_state["origins"]
+        }
+        await context.add_init_script(
+            script=f"({RESTORE_LOCAL_STORAGE_JS})({json.dumps(origins)})"
+        )
+        applied.add(car_platform.id)